@@ -4,6 +4,7 @@
 //------------------------------------------------------------------------------
 
 using System;
+using System.Globalization;
 using System.Runtime.InteropServices;
 using System.Text;
 using System.Threading;
@@ -82,6 +83,11 @@ namespace Microsoft.ML.DotNetBridge
         [UnmanagedFunctionPointer(CallingConvention.StdCall)]
         private unsafe delegate bool KeyNamesGetter(DataSourceBlock* pdata, int col, int count, sbyte** buffer);
 
+        // Call back loading the next chunk of data in the data source block. Returns 1 when a chunk
+        // was loaded, 0 at the end of the data and -1 on error.
+        [UnmanagedFunctionPointer(CallingConvention.StdCall)]
+        private unsafe delegate int ChunkLoader(DataSourceBlock* pdata);
+
         // For getting numpy.int64 vectors from NativeBridge.
         [UnmanagedFunctionPointer(CallingConvention.StdCall)]
         private unsafe delegate void I8VectorGetter(DataSourceBlock* pdata, int col, long index, int* indices, long* values, bool inquire, out int size);
@@ -184,6 +190,42 @@ namespace Microsoft.ML.DotNetBridge
             Generic = 2,
         }
 
+        /// <summary>
+        /// How a call uses the host environment kept alive between calls.
+        /// WARNING: These values are shared with the native code, see ManagedInterop.h.
+        /// </summary>
+        private enum SessionMode
+        {
+            // Creates a new environment for the call and drops it afterwards.
+            None = 0,
+            // Runs the call in the session environment, creating it if needed.
+            Use = 1,
+            // Releases the session environment, no graph is run.
+            Close = 2,
+        }
+
+        /// <summary>
+        /// Operation on the model cache requested by a call. No graph is run when the command is not None,
+        /// the graph string holds the argument of the command.
+        /// WARNING: These values are shared with the native code, see ManagedInterop.h.
+        /// </summary>
+        private enum CacheCommand
+        {
+            None = 0,
+            // Only returns the state of the cache.
+            Stats = 1,
+            // Pins the model whose path is given.
+            Pin = 2,
+            // Unpins the model whose path is given.
+            Unpin = 3,
+            // Removes all the models and resets the counters.
+            Clear = 4,
+            // Sets the memory budget to modelCacheBudget.
+            SetBudget = 5,
+            // Loads the model whose path is given in the cache.
+            Load = 6,
+        }
+
         #region Callbacks to native
 
         // Call back to provide messages to native code.
@@ -191,11 +233,21 @@ namespace Microsoft.ML.DotNetBridge
         [UnmanagedFunctionPointer(CallingConvention.StdCall)]
         private unsafe delegate void MessageSink(EnvironmentBlock* penv, ChannelMessageKind kind, sbyte* sender, sbyte* message);
 
+        // Call back to send the model output as name to native code.
+        [UnmanagedFunctionPointer(CallingConvention.StdCall)]
+        private unsafe delegate void ModelSink(EnvironmentBlock* penv, sbyte* name, byte* modelBytes, ulong modelSize);
+
+        // Call back to get the bytes of the model name kept in memory by native code. Returns false
+        // when the model must be read from the file name.
+        [UnmanagedFunctionPointer(CallingConvention.StdCall)]
+        private unsafe delegate bool ModelSource(EnvironmentBlock* penv, sbyte* name, out byte* modelBytes, out long modelSize);
+
         [UnmanagedFunctionPointer(CallingConvention.StdCall)]
-        private unsafe delegate void ModelSink(EnvironmentBlock* penv, byte* modelBytes, ulong modelSize);
+        private unsafe delegate void DataSink(EnvironmentBlock* penv, DataViewBlock* pdata, out void** setters, out void* keyValueSetter, out void** buffers);
 
+        // Call back telling native code the values of numRows rows were set, returns false when no more data is wanted.
         [UnmanagedFunctionPointer(CallingConvention.StdCall)]
-        private unsafe delegate void DataSink(EnvironmentBlock* penv, DataViewBlock* pdata, out void** setters, out void* keyValueSetter);
+        private unsafe delegate bool DataBatchSink(EnvironmentBlock* penv, long numRows);
 
         [UnmanagedFunctionPointer(CallingConvention.StdCall)]
         public unsafe delegate bool CheckCancelled();
@@ -239,6 +291,34 @@ namespace Microsoft.ML.DotNetBridge
             // Path to python executable.
             [FieldOffset(0x30)]
             public readonly sbyte* pythonPath;
+
+            // How the host environment is shared with other calls, see SessionMode.
+            [FieldOffset(0x38)]
+            public readonly int sessionMode;
+
+            // Operation on the model cache, see CacheCommand.
+            [FieldOffset(0x3C)]
+            public readonly int cacheCommand;
+
+            // Memory budget of the model cache in bytes, used by CacheCommand.SetBudget.
+            [FieldOffset(0x40)]
+            public readonly long modelCacheBudget;
+
+            // Call back to send the data in batches, null when the data is sent at once.
+            [FieldOffset(0x48)]
+            public readonly void* dataBatchSink;
+
+            // Number of rows of every batch sent to dataBatchSink.
+            [FieldOffset(0x50)]
+            public readonly long dataBatchSize;
+
+            // Call back to get the models sent in memory, null when all the models are files.
+            [FieldOffset(0x58)]
+            public readonly void* modelSource;
+
+            // Maximum number of threads used by the graph, 0 for no limit.
+            [FieldOffset(0x60)]
+            public readonly int numThreads;
 #pragma warning restore 649 // never assigned
         }
 
@@ -271,14 +351,20 @@ namespace Microsoft.ML.DotNetBridge
             }
         }
 
+        // The environment shared by all the calls made while a session is open.
+        private static RmlEnvironment _sessionEnv;
+        private static readonly object _sessionLock = new object();
+        private static long _sessionCalls;
+        // The environment the assemblies are registered in once per process. The session
+        // environments are forks of it and the cached models are loaded with it.
+        private static RmlEnvironment _rootEnv;
+
         /// <summary>
-        // The Generic entry point. The specific behavior is indicated in a string argument.
+        /// Registers the assemblies holding the components the graphs may refer to.
+        /// This is the most expensive part of the environment creation.
         /// </summary>
-        private static unsafe int GenericExec(EnvironmentBlock* penv, sbyte* psz, int cdata, DataSourceBlock** ppdata)
+        private static void RegisterAssemblies(RmlEnvironment env)
         {
-            var env = new RmlEnvironment(MarshalDelegate<CheckCancelled>(penv->checkCancel), penv->seed, verbose: penv != null && penv->verbosity > 3);
-            var host = env.Register("ML.NET_Execution");
-
             env.ComponentCatalog.RegisterAssembly(typeof(TextLoader).Assembly); // ML.Data
             env.ComponentCatalog.RegisterAssembly(typeof(LinearModelParameters).Assembly); // ML.StandardLearners
             env.ComponentCatalog.RegisterAssembly(typeof(CategoricalCatalog).Assembly); // ML.Transforms
@@ -301,7 +387,138 @@ namespace Microsoft.ML.DotNetBridge
             //env.ComponentCatalog.RegisterAssembly(typeof(ParquetLoader).Assembly);
             env.ComponentCatalog.RegisterAssembly(typeof(SsaChangePointDetector).Assembly);
             env.ComponentCatalog.RegisterAssembly(typeof(DotNetBridgeEntrypoints).Assembly);
+        }
+
+        /// <summary>
+        /// Returns the environment a call runs in. Without a session, a new environment is created.
+        /// With a session, the call gets a fork of the session environment: the fork shares the
+        /// component catalog (so the assemblies are registered only once per process) but has its
+        /// own seed and verbosity. The listeners are shared by the forks, so each call gets a host
+        /// with a unique name to recognize its own messages.
+        /// </summary>
+        private static RmlEnvironment CreateEnvironment(EnvironmentBlock* penv, out string hostName)
+        {
+            bool verbose = penv->verbosity > 3;
+            if (penv->sessionMode == (int)SessionMode.None)
+            {
+                var env = new RmlEnvironment(MarshalDelegate<CheckCancelled>(penv->checkCancel), penv->seed, verbose);
+                RegisterAssemblies(env);
+                hostName = "ML.NET_Execution";
+                return env;
+            }
+
+            lock (_sessionLock)
+            {
+                if (_sessionEnv == null)
+                    _sessionEnv = new RmlEnvironment(GetRootEnvironment(), seed: null);
+                hostName = string.Format(CultureInfo.InvariantCulture, "ML.NET_Execution_{0}", ++_sessionCalls);
+                return new RmlEnvironment(_sessionEnv, penv->seed, verbose);
+            }
+        }
+
+        /// <summary>
+        /// Tells if a message was sent by the host <paramref name="hostName"/> or one of its
+        /// components. A full name starts with the name of the root component followed by
+        /// ';', comparing prefixes would mix ML.NET_Execution_1 and ML.NET_Execution_10.
+        /// </summary>
+        private static bool IsSentByHost(string fullName, string hostName)
+        {
+            int end = fullName.IndexOf(';');
+            string root = end < 0 ? fullName : fullName.Substring(0, end);
+            return string.Equals(root.Trim(), hostName, StringComparison.Ordinal);
+        }
 
+        /// <summary>
+        /// Returns the environment the assemblies are registered in, created by the first call
+        /// needing it. The caller holds <see cref="_sessionLock"/>.
+        /// </summary>
+        private static RmlEnvironment GetRootEnvironment()
+        {
+            if (_rootEnv == null)
+            {
+                var env = new RmlEnvironment(checkDelegate: null);
+                RegisterAssemblies(env);
+                _rootEnv = env;
+            }
+            return _rootEnv;
+        }
+
+        /// <summary>
+        /// Returns a host to load the models kept by <see cref="ModelCache"/> with. The models outlive
+        /// the call reading them and the session, so the host is registered on the root environment
+        /// rather than on the call's one.
+        /// </summary>
+        private static IHost GetModelCacheHost()
+        {
+            lock (_sessionLock)
+                return GetRootEnvironment().Register("ModelCache");
+        }
+
+        /// <summary>
+        /// Releases the session environment. The next call in session mode forks a new one from
+        /// the root environment.
+        /// </summary>
+        private static void CloseSession()
+        {
+            lock (_sessionLock)
+                _sessionEnv = null;
+        }
+
+        /// <summary>
+        /// Runs a model cache command and sends the state of the cache to native code
+        /// as a single row data frame.
+        /// </summary>
+        private static void RunCacheCommand(IChannel ch, IHost host, EnvironmentBlock* penv, string argument)
+        {
+            switch ((CacheCommand)penv->cacheCommand)
+            {
+                case CacheCommand.Stats:
+                    break;
+                case CacheCommand.Pin:
+                    ModelCache.Pin(argument);
+                    break;
+                case CacheCommand.Unpin:
+                    ModelCache.Unpin(argument);
+                    break;
+                case CacheCommand.Clear:
+                    ModelCache.Clear();
+                    break;
+                case CacheCommand.SetBudget:
+                    ModelCache.SetBudget(penv->modelCacheBudget);
+                    break;
+                case CacheCommand.Load:
+                    PreloadModel(penv, host, argument);
+                    break;
+                default:
+                    throw host.Except("Unknown model cache command {0}", penv->cacheCommand);
+            }
+
+            var builder = new ArrayDataViewBuilder(host);
+            builder.AddColumn("Hits", NumberDataViewType.Int64, ModelCache.Hits);
+            builder.AddColumn("Misses", NumberDataViewType.Int64, ModelCache.Misses);
+            builder.AddColumn("Evictions", NumberDataViewType.Int64, ModelCache.Evictions);
+            builder.AddColumn("Count", NumberDataViewType.Int64, ModelCache.Count);
+            builder.AddColumn("Bytes", NumberDataViewType.Int64, ModelCache.Bytes);
+            builder.AddColumn("Budget", NumberDataViewType.Int64, ModelCache.Budget);
+            SendViewToNativeAsDataFrame(ch, penv, builder.GetDataView());
+        }
+
+        /// <summary>
+        // The Generic entry point. The specific behavior is indicated in a string argument.
+        /// </summary>
+        private static unsafe int GenericExec(EnvironmentBlock* penv, sbyte* psz, int cdata, DataSourceBlock** ppdata)
+        {
+            if (penv != null && penv->sessionMode == (int)SessionMode.Close)
+            {
+                CloseSession();
+                return 0;
+            }
+
+            string hostName;
+            var env = CreateEnvironment(penv, out hostName);
+            var host = env.Register(hostName);
+
+            Action<IMessageSource, ChannelMessage> listener = null;
             using (var ch = host.Start("Executing"))
             {
                 var sw = new System.Diagnostics.Stopwatch();
@@ -323,9 +540,13 @@ namespace Microsoft.ML.DotNetBridge
                     var message = MarshalDelegate<MessageSink>(penv->messageSink);
                     var messageValidator = new MessageValidator(host);
                     var lk = new object();
-                    Action<IMessageSource, ChannelMessage> listener =
+                    listener =
                         (sender, msg) =>
                         {
+                            // Forks of the session environment share their listeners,
+                            // only the messages sent by this call are forwarded.
+                            if (!IsSentByHost(sender.FullName, hostName))
+                                return;
                             byte[] bs = StringToNullTerminatedBytes(sender.FullName);
                             string m = messageValidator.Validate(msg);
                             if (!string.IsNullOrEmpty(m))
@@ -341,6 +562,13 @@ namespace Microsoft.ML.DotNetBridge
                         };
                     env.AddListener(listener);
 
+                    if (penv->cacheCommand != (int)CacheCommand.None)
+                    {
+                        ch.Trace("Running model cache command");
+                        RunCacheCommand(ch, host, penv, graph);
+                        return 0;
+                    }
+
                     host.CheckParam(cdata >= 0, nameof(cdata), "must be non-negative");
                     host.CheckParam(ppdata != null || cdata == 0, nameof(ppdata));
                     for (int i = 0; i < cdata; i++)
@@ -382,6 +610,10 @@ namespace Microsoft.ML.DotNetBridge
                         ch.Info("Elapsed time: {0}", sw.Elapsed);
                     else
                         ch.Trace("Elapsed time: {0}", sw.Elapsed);
+
+                    // The listener holds penv which is not valid once the call returns.
+                    if (listener != null)
+                        env.RemoveListener(listener);
                 }
             }
             return 0;
@@ -0,0 +1,207 @@
+﻿//------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT License.
+//------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.ML.Data;
+using Microsoft.ML.Internal.Utilities;
+using Microsoft.ML.Runtime;
+
+namespace Microsoft.ML.DotNetBridge
+{
+    public unsafe static partial class Bridge
+    {
+        /// <summary>
+        /// Data view over data sent by the native code in chunks. Every chunk replaces the previous one
+        /// in the same <see cref="DataSourceBlock"/> and is read through a <see cref="NativeDataView"/>,
+        /// only one chunk is in memory at a time so the data can only be read once.
+        /// </summary>
+        private sealed class ChunkedDataView : IDataView, IDisposable
+        {
+            private readonly IHost _host;
+            private readonly DataSourceBlock* _pdata;
+            private readonly ChunkLoader _nextChunk;
+            private NativeDataView _chunk;
+            private bool _cursorCreated;
+
+            public bool CanShuffle => false;
+
+            public DataViewSchema Schema { get; }
+
+            public ChunkedDataView(IHostEnvironment env, DataSourceBlock* pdata)
+            {
+                Contracts.AssertValue(env);
+                _host = env.Register("PyChunkedDataView");
+                _host.Assert(pdata->nextChunk != null);
+
+                _pdata = pdata;
+                _nextChunk = MarshalDelegate<ChunkLoader>(pdata->nextChunk);
+                _chunk = new NativeDataView(_host, pdata);
+                Schema = _chunk.Schema;
+            }
+
+            public long? GetRowCount()
+            {
+                return null;
+            }
+
+            public DataViewRowCursor GetRowCursor(IEnumerable<DataViewSchema.Column> columnsNeeded, Random rand = null)
+            {
+                _host.CheckValue(columnsNeeded, nameof(columnsNeeded));
+                _host.CheckValueOrNull(rand);
+
+                if (_cursorCreated)
+                    throw _host.Except("Data sent in chunks can only be read once, it must be spilled to a file to be read several times.");
+                _cursorCreated = true;
+
+                var active = Utils.BuildArray(Schema.Count, columnsNeeded);
+                return new Cursor(_host, this, active);
+            }
+
+            public DataViewRowCursor[] GetRowCursorSet(IEnumerable<DataViewSchema.Column> columnsNeeded, int n, Random rand = null)
+            {
+                return new DataViewRowCursor[] { GetRowCursor(columnsNeeded, rand) };
+            }
+
+            public void Dispose()
+            {
+                if (_chunk != null)
+                {
+                    _chunk.Dispose();
+                    _chunk = null;
+                }
+            }
+
+            /// <summary>
+            /// Replaces the current chunk by the next one, returns false at the end of the data.
+            /// </summary>
+            private bool MoveNextChunk()
+            {
+                _chunk.Dispose();
+                _chunk = null;
+
+                int status = _nextChunk(_pdata);
+                if (status < 0)
+                {
+                    var error = _pdata->chunkError == null ? null : BytesToString(_pdata->chunkError);
+                    throw _host.Except("Failed to read the next chunk of data: {0}", error ?? "unknown error");
+                }
+                if (status == 0)
+                    return false;
+
+                _chunk = new NativeDataView(_host, _pdata);
+                var schema = _chunk.Schema;
+                if (schema.Count != Schema.Count)
+                    throw _host.Except("All the chunks must have the same columns, the first chunk has {0} columns, a following one {1}.", Schema.Count, schema.Count);
+                for (int i = 0; i < Schema.Count; i++)
+                {
+                    if (schema[i].Name != Schema[i].Name || !schema[i].Type.Equals(Schema[i].Type))
+                        throw _host.Except("Column '{0}' of type {1} does not match column '{2}' of type {3} in the first chunk.",
+                            schema[i].Name, schema[i].Type, Schema[i].Name, Schema[i].Type);
+                }
+                return true;
+            }
+
+            private sealed class Cursor : RootCursorBase
+            {
+                private readonly ChunkedDataView _view;
+                private readonly bool[] _active;
+                // Getters of the cursor of the current chunk, created on first use.
+                private readonly Delegate[] _getters;
+                private DataViewRowCursor _input;
+                private bool _disposed;
+
+                public override DataViewSchema Schema => _view.Schema;
+
+                public override long Batch => 0;
+
+                public Cursor(IChannelProvider provider, ChunkedDataView view, bool[] active)
+                    : base(provider)
+                {
+                    Contracts.AssertValue(provider);
+                    provider.AssertValue(view);
+                    provider.AssertValue(active);
+
+                    _view = view;
+                    _active = active;
+                    _getters = new Delegate[active.Length];
+                    _input = CreateInputCursor();
+                }
+
+                private DataViewRowCursor CreateInputCursor()
+                {
+                    var schema = _view._chunk.Schema;
+                    return _view._chunk.GetRowCursor(schema.Where(col => _active[col.Index]));
+                }
+
+                public override ValueGetter<TValue> GetGetter<TValue>(DataViewSchema.Column col)
+                {
+                    Ch.CheckParam(_active[col.Index], nameof(col.Index), "column is not active");
+                    if (col.Type.RawType != typeof(TValue))
+                        throw Ch.Except("Invalid TValue: '{0}'", typeof(TValue));
+
+                    int index = col.Index;
+                    return
+                        (ref TValue value) =>
+                        {
+                            Ch.Check(IsGood);
+                            var getter = _getters[index] as ValueGetter<TValue>;
+                            if (getter == null)
+                            {
+                                getter = _input.GetGetter<TValue>(_input.Schema[index]);
+                                _getters[index] = getter;
+                            }
+                            getter(ref value);
+                        };
+                }
+
+                public override bool IsColumnActive(DataViewSchema.Column column)
+                {
+                    Contracts.Check(0 <= column.Index && column.Index < Schema.Count);
+                    return _active[column.Index];
+                }
+
+                public override ValueGetter<DataViewRowId> GetIdGetter()
+                {
+                    return
+                        (ref DataViewRowId val) =>
+                        {
+                            Ch.Check(IsGood, "Cannot call ID getter in current state");
+                            val = new DataViewRowId((ulong)Position, 0);
+                        };
+                }
+
+                protected override bool MoveNextCore()
+                {
+                    while (!_input.MoveNext())
+                    {
+                        _input.Dispose();
+                        _input = null;
+                        Array.Clear(_getters, 0, _getters.Length);
+                        if (!_view.MoveNextChunk())
+                            return false;
+                        _input = CreateInputCursor();
+                    }
+                    return true;
+                }
+
+                protected override void Dispose(bool disposing)
+                {
+                    if (_disposed)
+                        return;
+
+                    _disposed = true;
+                    if (_input != null)
+                    {
+                        _input.Dispose();
+                        _input = null;
+                    }
+                    base.Dispose(disposing);
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,136 @@
+﻿//------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT License.
+//------------------------------------------------------------------------------
+
+using System;
+using System.Linq;
+using Microsoft.ML.Runtime;
+using Newtonsoft.Json.Linq;
+
+namespace Microsoft.ML.DotNetBridge
+{
+    public unsafe static partial class Bridge
+    {
+        private const string CrossValidatorName = "Models.CrossValidator";
+
+        // Arguments of a cross validation given to the evaluation of every fold.
+        private static readonly string[] _foldArguments = { "TransformModel", "Kind", "LabelColumn", "WeightColumn", "GroupColumn", "NameColumn" };
+
+        // Arguments of a cross validation given to the combination of the metrics of the folds.
+        private static readonly string[] _combinerArguments = { "LabelColumn", "WeightColumn", "GroupColumn", "NameColumn" };
+
+        // Metrics of every fold combined into the metrics of the cross validation.
+        private static readonly string[] _foldMetrics = { "Warnings", "OverallMetrics", "PerInstanceMetrics", "ConfusionMatrix" };
+
+        // Kinds of cross validation evaluated with a confusion matrix.
+        private static readonly string[] _confusionMatrixKinds = { "SignatureBinaryClassifierTrainer", "SignatureMulticlassClassificationTrainer" };
+
+        /// <summary>
+        /// Replaces every cross validation of the graph by the nodes its macro expands to: a split of the data,
+        /// one train-test evaluation per fold and the combination of their models and metrics. The folds do not
+        /// depend on each other and can be run at the same time by <see cref="ProfiledGraphRunner"/>.
+        /// The trainers of a fold, which do not set their number of threads, use <paramref name="numThreads"/>
+        /// divided by the number of folds run at the same time, <paramref name="parallelFolds"/>, 0 for all
+        /// of them. They keep their default when the folds run one after the other.
+        /// </summary>
+        private static JArray ExpandCrossValidators(IHostEnvironment env, JArray nodes, int parallelFolds, int numThreads)
+        {
+            Contracts.AssertValue(env);
+            env.AssertValue(nodes);
+
+            var expanded = new JArray();
+            int count = 0;
+            foreach (var token in nodes)
+            {
+                var node = token as JObject;
+                if (node == null || node.Value<string>("Name") != CrossValidatorName)
+                {
+                    expanded.Add(token);
+                    continue;
+                }
+
+                var inputs = node["Inputs"] as JObject;
+                var outputs = node["Outputs"] as JObject ?? new JObject();
+                if (inputs == null || !(inputs["Nodes"] is JArray))
+                    throw env.Except("Invalid inputs for node '{0}'", CrossValidatorName);
+                int numFolds = inputs.Value<int?>("NumFolds") ?? 2;
+                if (numFolds < 2)
+                    throw env.Except("The number of folds must be greater than 1, not {0}", numFolds);
+                var kind = inputs.Value<string>("Kind") ?? _confusionMatrixKinds[0];
+                var metrics = _foldMetrics.Where(m => outputs[m] != null &&
+                    (m != "ConfusionMatrix" || _confusionMatrixKinds.Contains(kind))).ToArray();
+                int concurrentFolds = parallelFolds > 0 ? Math.Min(parallelFolds, numFolds) : numFolds;
+                int foldThreads = Math.Max(1, numThreads / concurrentFolds);
+
+                // The variables of the expansion of the i-th cross validation start with CrossValidator{i}_.
+                var prefix = $"$CrossValidator{count++}_";
+
+                var splitterInputs = new JObject() { ["Data"] = inputs["Data"].DeepClone(), ["NumFolds"] = numFolds };
+                CopyArguments(inputs, splitterInputs, "StratificationColumn");
+                expanded.Add(MakeNode("Models.CrossValidatorDatasetSplitter", splitterInputs,
+                    new JObject() { ["TrainData"] = prefix + "TrainData", ["TestData"] = prefix + "TestData" }));
+
+                for (int k = 0; k < numFolds; k++)
+                {
+                    var subgraph = (JArray)inputs["Nodes"].DeepClone();
+                    if (concurrentFolds > 1)
+                        LimitNumberOfThreads(env, subgraph, foldThreads);
+                    var foldInputs = new JObject()
+                    {
+                        ["TrainingData"] = $"{prefix}TrainData[{k}]",
+                        ["TestingData"] = $"{prefix}TestData[{k}]",
+                        ["Nodes"] = subgraph,
+                        ["Inputs"] = inputs["Inputs"]?.DeepClone(),
+                        ["Outputs"] = inputs["Outputs"]?.DeepClone()
+                    };
+                    CopyArguments(inputs, foldInputs, _foldArguments);
+                    var foldOutputs = new JObject() { ["PredictorModel"] = $"{prefix}PredictorModel{k}" };
+                    foreach (var metric in metrics)
+                        foldOutputs[metric] = $"{prefix}{metric}{k}";
+                    expanded.Add(MakeNode("Models.TrainTestEvaluator", foldInputs, foldOutputs));
+                }
+
+                var folds = Enumerable.Range(0, numFolds);
+                if (outputs["PredictorModel"] != null)
+                {
+                    expanded.Add(MakeNode("Data.PredictorModelArrayConverter",
+                        new JObject() { ["Models"] = new JArray(folds.Select(k => $"{prefix}PredictorModel{k}")) },
+                        new JObject() { ["OutputModels"] = outputs["PredictorModel"].DeepClone() }));
+                }
+
+                var combinerInputs = new JObject() { ["Kind"] = kind };
+                var combinerOutputs = new JObject();
+                foreach (var metric in metrics)
+                {
+                    expanded.Add(MakeNode("Data.IDataViewArrayConverter",
+                        new JObject() { ["Data"] = new JArray(folds.Select(k => $"{prefix}{metric}{k}")) },
+                        new JObject() { ["OutputData"] = prefix + metric }));
+                    combinerInputs[metric] = prefix + metric;
+                    combinerOutputs[metric] = outputs[metric].DeepClone();
+                }
+                if (combinerOutputs.Count > 0)
+                {
+                    CopyArguments(inputs, combinerInputs, _combinerArguments);
+                    expanded.Add(MakeNode("Models.CrossValidationResultsCombiner", combinerInputs, combinerOutputs));
+                }
+            }
+            return expanded;
+        }
+
+        private static JObject MakeNode(string name, JObject inputs, JObject outputs)
+        {
+            return new JObject() { ["Name"] = name, ["Inputs"] = inputs, ["Outputs"] = outputs };
+        }
+
+        private static void CopyArguments(JObject from, JObject to, params string[] names)
+        {
+            foreach (var name in names)
+            {
+                var value = from[name];
+                if (value != null && value.Type != JTokenType.Null)
+                    to[name] = value.DeepClone();
+            }
+        }
+    }
+}
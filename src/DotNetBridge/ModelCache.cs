@@ -0,0 +1,224 @@
+﻿//------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT License.
+//------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using Microsoft.ML.Runtime;
+
+namespace Microsoft.ML.DotNetBridge
+{
+    /// <summary>
+    /// Process wide cache of the deserialized models read by the graphs. A model is identified
+    /// by its path, the size and the last write time of the file, so a file overwritten with
+    /// a new model is loaded again. The least recently used models are evicted when the total
+    /// size goes over the budget, except the pinned ones. The size of a model is approximated
+    /// by the size of its file. Models sent in memory are identified by their name, which starts
+    /// with <see cref="InMemoryPrefix"/>, their bytes never change.
+    /// </summary>
+    internal static class ModelCache
+    {
+        // Default memory budget in bytes.
+        public const long DefaultBudget = 1L << 30;
+
+        // Prefix of the names of the models sent in memory by python.
+        public const string InMemoryPrefix = "memory:";
+
+        private sealed class Entry
+        {
+            public readonly string Key;
+            public readonly string Id;
+            public readonly long Length;
+            public readonly DateTime LastWriteTime;
+            public readonly object Model;
+            public LinkedListNode<Entry> Node;
+
+            public Entry(string key, string id, long length, DateTime lastWriteTime, object model)
+            {
+                Key = key;
+                Id = id;
+                Length = length;
+                LastWriteTime = lastWriteTime;
+                Model = model;
+            }
+        }
+
+        private static readonly object _lock = new object();
+        // Most recently used entries come first.
+        private static readonly LinkedList<Entry> _lru = new LinkedList<Entry>();
+        private static readonly Dictionary<string, Entry> _entries = new Dictionary<string, Entry>();
+        private static readonly HashSet<string> _pinned = new HashSet<string>(StringComparer.Ordinal);
+
+        private static long _budget = DefaultBudget;
+        private static long _bytes;
+        private static long _hits;
+        private static long _misses;
+        private static long _evictions;
+
+        public static long Budget => _budget;
+        public static long Bytes => _bytes;
+        public static long Count => _entries.Count;
+        public static long Hits => _hits;
+        public static long Misses => _misses;
+        public static long Evictions => _evictions;
+
+        /// <summary>
+        /// Returns the model stored in path, deserialized by load if it is not in the cache.
+        /// </summary>
+        public static T GetOrLoad<T>(string path, Func<Stream, T> load)
+            where T : class
+        {
+            Contracts.AssertNonEmpty(path);
+            Contracts.AssertValue(load);
+
+            var info = new FileInfo(path);
+            if (!info.Exists)
+                throw Contracts.ExceptIO("Model file '{0}' does not exist", path);
+            return GetOrLoad(info.FullName, info.Length, info.LastWriteTimeUtc, info.OpenRead, load);
+        }
+
+        /// <summary>
+        /// Returns the model sent in memory as name, deserialized by load if it is not in the cache.
+        /// </summary>
+        public static unsafe T GetOrLoad<T>(string name, byte* modelBytes, long modelSize, Func<Stream, T> load)
+            where T : class
+        {
+            Contracts.Assert(name.StartsWith(InMemoryPrefix, StringComparison.Ordinal));
+            Contracts.Assert(modelBytes != null);
+            Contracts.AssertValue(load);
+
+            var stream = new UnmanagedMemoryStream(modelBytes, modelSize);
+            return GetOrLoad(name, modelSize, DateTime.MinValue, () => stream, load);
+        }
+
+        private static T GetOrLoad<T>(string id, long length, DateTime lastWriteTime, Func<Stream> open, Func<Stream, T> load)
+            where T : class
+        {
+            // The same file may be read as a predictor model or as a transform model.
+            var key = typeof(T).Name + "|" + id;
+
+            lock (_lock)
+            {
+                if (_budget > 0 && _entries.TryGetValue(key, out var entry))
+                {
+                    if (entry.Length == length && entry.LastWriteTime == lastWriteTime)
+                    {
+                        _hits++;
+                        _lru.Remove(entry.Node);
+                        _lru.AddFirst(entry.Node);
+                        return (T)entry.Model;
+                    }
+                    // The file changed since it was loaded.
+                    Remove(entry);
+                }
+                _misses++;
+            }
+
+            // Deserialization happens outside the lock, two threads may load the same model
+            // at the same time but they do not block the calls using other models.
+            T model;
+            using (var fs = open())
+                model = load(fs);
+
+            lock (_lock)
+            {
+                if (_budget > 0 && !_entries.ContainsKey(key))
+                {
+                    var entry = new Entry(key, id, length, lastWriteTime, model);
+                    entry.Node = _lru.AddFirst(entry);
+                    _entries.Add(key, entry);
+                    _bytes += entry.Length;
+                    Evict();
+                }
+            }
+            return model;
+        }
+
+        /// <summary>
+        /// Pins the model stored in path, it stays in the cache until it is unpinned.
+        /// The model is still loaded the first time a graph reads it.
+        /// </summary>
+        public static void Pin(string path)
+        {
+            Contracts.CheckNonEmpty(path, nameof(path));
+            lock (_lock)
+                _pinned.Add(GetId(path));
+        }
+
+        /// <summary>
+        /// Unpins the model stored in path, it can be evicted again.
+        /// </summary>
+        public static void Unpin(string path)
+        {
+            Contracts.CheckNonEmpty(path, nameof(path));
+            lock (_lock)
+            {
+                _pinned.Remove(GetId(path));
+                Evict();
+            }
+        }
+
+        /// <summary>
+        /// Sets the memory budget in bytes. Zero or less disables the cache.
+        /// </summary>
+        public static void SetBudget(long budget)
+        {
+            lock (_lock)
+            {
+                _budget = budget;
+                if (_budget <= 0)
+                    Clear();
+                else
+                    Evict();
+            }
+        }
+
+        /// <summary>
+        /// Removes all the models, including the pinned ones, and resets the counters.
+        /// </summary>
+        public static void Clear()
+        {
+            lock (_lock)
+            {
+                _lru.Clear();
+                _entries.Clear();
+                _pinned.Clear();
+                _bytes = 0;
+                _hits = 0;
+                _misses = 0;
+                _evictions = 0;
+            }
+        }
+
+        private static string GetId(string path)
+        {
+            if (path.StartsWith(InMemoryPrefix, StringComparison.Ordinal))
+                return path;
+            return Path.GetFullPath(path);
+        }
+
+        private static void Remove(Entry entry)
+        {
+            _lru.Remove(entry.Node);
+            _entries.Remove(entry.Key);
+            _bytes -= entry.Length;
+        }
+
+        private static void Evict()
+        {
+            var node = _lru.Last;
+            while (_bytes > _budget && node != null)
+            {
+                var previous = node.Previous;
+                if (!_pinned.Contains(node.Value.Id))
+                {
+                    Remove(node.Value);
+                    _evictions++;
+                }
+                node = previous;
+            }
+        }
+    }
+}
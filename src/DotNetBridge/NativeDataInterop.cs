@@ -45,6 +45,27 @@ namespace Microsoft.ML.DotNetBridge
             public readonly void** getters;
             [FieldOffset(0x38)]
             public readonly void* labelsGetter;
+            [FieldOffset(0x40)]
+            // Raw column buffers, null for the columns read through the getters.
+            public readonly void** colData;
+            [FieldOffset(0x48)]
+            public readonly long* colStrides;
+            [FieldOffset(0x50)]
+            // Text columns sent as UTF-8 buffers: offsets of the values in colData and bitmap
+            // of the missing values. Null for the other columns.
+            public readonly long** textOffsets;
+            [FieldOffset(0x58)]
+            public readonly byte** textMissing;
+            [FieldOffset(0x60)]
+            // Call back loading the next chunk of data in this block, null when all the data is
+            // in the block.
+            public readonly void* nextChunk;
+            [FieldOffset(0x68)]
+            // Binary file the chunks are written to, null to read them once.
+            public readonly sbyte* spillPath;
+            [FieldOffset(0x70)]
+            // Message of the python exception raised by nextChunk, null when it did not fail.
+            public readonly sbyte* chunkError;
 #pragma warning restore 649 // never assigned
         }
 
@@ -250,15 +271,21 @@ namespace Microsoft.ML.DotNetBridge
                 for (int iid = 0; iid < names.Length; iid++)
                     names[iid] = prgbNames + nameIndices[iid];
 
+                // The rows are sent in batches when the native code asks for it, the columns
+                // then hold one batch at a time.
+                var batchSink = penv->dataBatchSink != null && penv->dataBatchSize > 0 ?
+                    MarshalDelegate<DataBatchSink>(penv->dataBatchSink) : null;
+                long batchSize = batchSink != null ? penv->dataBatchSize : long.MaxValue;
+
                 DataViewBlock block;
                 block.ccol = nameIndices.Length;
-                block.crow = view.GetRowCount() ?? 0;
+                block.crow = batchSink != null ? batchSize : view.GetRowCount() ?? 0;
                 block.names = (sbyte**)prgname;
                 block.kinds = prgkind;
                 block.keyCards = prgkeyCard;
                 block.valueCounts = prgbValueCount;
 
-                dataSink(penv, &block, out var setters, out var keyValueSetter);
+                dataSink(penv, &block, out var setters, out var keyValueSetter, out var buffers);
 
                 if (setters == null)
                 {
@@ -297,7 +324,7 @@ namespace Microsoft.ML.DotNetBridge
                                 keyIndex++;
                             }
                         }
-                        fillers[i] = BufferFillerBase.Create(penv, cursor, pyColumn, colIndices[i], prgkind[pyColumn], type, setters[pyColumn]);
+                        fillers[i] = BufferFillerBase.Create(penv, cursor, pyColumn, colIndices[i], prgkind[pyColumn], type, setters[pyColumn], buffers, block.crow);
 
                         if ((type is VectorDataViewType) && (type.GetVectorSize() > 0))
                         {
@@ -305,18 +332,28 @@ namespace Microsoft.ML.DotNetBridge
                         }
                         else pyColumn++;
                     }
-                    for (int crow = 0; ; crow++)
+                    long crow = 0;
+                    long batchStart = 0;
+                    // Advance to the next row.
+                    while (cursor.MoveNext())
                     {
-                        // Advance to the next row.
-                        if (!cursor.MoveNext())
-                            break;
-
                         // Fill values for the current row.
                         for (int i = 0; i < fillers.Length; i++)
                         {
-                            fillers[i].Set();
+                            fillers[i].Set(crow - batchStart);
+                        }
+                        crow++;
+
+                        if (crow - batchStart == batchSize)
+                        {
+                            if (!batchSink(penv, batchSize))
+                                return;
+                            batchStart = crow;
                         }
                     }
+                    // The last batch, an empty one is still sent when there is no row at all.
+                    if (batchSink != null && (crow > batchStart || crow == 0))
+                        batchSink(penv, crow - batchStart);
                 }
             }
         }
@@ -417,13 +454,15 @@ namespace Microsoft.ML.DotNetBridge
 
                 DataViewBlock block;
                 block.ccol = nameIndices.Length;
-                block.crow = view.GetRowCount() ?? 0;
+                // The columns of the CSR matrix do not hold one value per row, so the native
+                // code must not preallocate them from the number of rows.
+                block.crow = 0;
                 block.names = (sbyte**)prgname;
                 block.kinds = prgkind;
                 block.keyCards = null;
                 block.valueCounts = prgbValueCount;
 
-                dataSink(penv, &block, out var setters, out var keyValueSetter);
+                dataSink(penv, &block, out var setters, out var keyValueSetter, out _);
 
                 if (setters == null) return;
 
@@ -505,9 +544,14 @@ namespace Microsoft.ML.DotNetBridge
                 _input = input;
             }
 
-            public static BufferFillerBase Create(EnvironmentBlock* penv, DataViewRow input, int pyCol, int idvCol, InternalDataKind dataKind, DataViewType type, void* setter)
+            public static BufferFillerBase Create(EnvironmentBlock* penv, DataViewRow input, int pyCol, int idvCol, InternalDataKind dataKind, DataViewType type, void* setter, void** buffers, long bufferRows)
             {
                 var itemType = type.GetItemType();
+                // When the native code preallocated the buffers of the column, the values are written
+                // directly in them instead of calling the native setter for every value. This is only
+                // done when the setter matches the kind of the native column: the U1 and U2 keys and the
+                // keys without count are widened by the native setters and keep using them.
+                var direct = buffers != null && buffers[pyCol] != null ? new DirectSetters(buffers, bufferRows, setter) : null;
                 // We convert the unsigned types to signed types, with -1 indicating missing in Python.
                 if (itemType.GetKeyCount() > 0)
                 {
@@ -526,13 +570,13 @@ namespace Microsoft.ML.DotNetBridge
                             (ushort value, int col, long m, long n) => fnI2(penv, col, m, n, value > keyMax ? (short)-1 : (short)(value - 1));
                         return new Impl<ushort>(input, pyCol, idvCol, type, pokeU2);
                     case InternalDataKind.U4:
-                        var fnI4 = MarshalDelegate<I4Setter>(setter);
+                        var fnI4 = direct != null ? direct.SetI4 : MarshalDelegate<I4Setter>(setter);
                         ValuePoker<uint> pokeU4 =
                             (uint value, int col, long m, long n) => fnI4(penv, col, m, n, value > keyMax ? -1 : (int)(value - 1));
                         return new Impl<uint>(input, pyCol, idvCol, type, pokeU4);
                     case InternalDataKind.U8:
                         // We convert U8 key types with key names to I4.
-                        fnI4 = MarshalDelegate<I4Setter>(setter);
+                        fnI4 = direct != null ? direct.SetI4 : MarshalDelegate<I4Setter>(setter);
                         ValuePoker<ulong> pokeU8 =
                             (ulong value, int col, long m, long n) => fnI4(penv, col, m, n, value > keyMax ? -1 : (int)(value - 1));
                         return new Impl<ulong>(input, pyCol, idvCol, type, pokeU8);
@@ -571,62 +615,62 @@ namespace Microsoft.ML.DotNetBridge
                     switch (dataKind)
                     {
                     case InternalDataKind.R4:
-                        var fnR4 = MarshalDelegate<R4Setter>(setter);
+                        var fnR4 = direct != null ? direct.SetR4 : MarshalDelegate<R4Setter>(setter);
                         ValuePoker<float> pokeR4 =
                             (float value, int col, long m, long n) => fnR4(penv, col, m, n, value);
                         return new Impl<float>(input, pyCol, idvCol, type, pokeR4);
                     case InternalDataKind.R8:
-                        var fnR8 = MarshalDelegate<R8Setter>(setter);
+                        var fnR8 = direct != null ? direct.SetR8 : MarshalDelegate<R8Setter>(setter);
                         ValuePoker<double> pokeR8 =
                             (double value, int col, long m, long n) => fnR8(penv, col, m, n, value);
                         return new Impl<double>(input, pyCol, idvCol, type, pokeR8);
                     case InternalDataKind.BL:
-                        var fnBl = MarshalDelegate<BLSetter>(setter);
+                        var fnBl = direct != null ? direct.SetBL : MarshalDelegate<BLSetter>(setter);
                         ValuePoker<bool> pokeBl =
                             (bool value, int col, long m, long n) => fnBl(penv, col, m, n, !value ? (byte)0 : value ? (byte)1 : (byte)0xFF);
                         return new Impl<bool>(input, pyCol, idvCol, type, pokeBl);
                     case InternalDataKind.I1:
-                        var fnI1 = MarshalDelegate<I1Setter>(setter);
+                        var fnI1 = direct != null ? direct.SetI1 : MarshalDelegate<I1Setter>(setter);
                         ValuePoker<sbyte> pokeI1 =
                             (sbyte value, int col, long m, long n) => fnI1(penv, col, m, n, value);
                         return new Impl<sbyte>(input, pyCol, idvCol, type, pokeI1);
                     case InternalDataKind.I2:
-                        var fnI2 = MarshalDelegate<I2Setter>(setter);
+                        var fnI2 = direct != null ? direct.SetI2 : MarshalDelegate<I2Setter>(setter);
                         ValuePoker<short> pokeI2 =
                             (short value, int col, long m, long n) => fnI2(penv, col, m, n, value);
                         return new Impl<short>(input, pyCol, idvCol, type, pokeI2);
                     case InternalDataKind.I4:
-                        var fnI4 = MarshalDelegate<I4Setter>(setter);
+                        var fnI4 = direct != null ? direct.SetI4 : MarshalDelegate<I4Setter>(setter);
                         ValuePoker<int> pokeI4 =
                             (int value, int col, long m, long n) => fnI4(penv, col, m, n, value);
                         return new Impl<int>(input, pyCol, idvCol, type, pokeI4);
                     case InternalDataKind.I8:
-                        var fnI8 = MarshalDelegate<I8Setter>(setter);
+                        var fnI8 = direct != null ? direct.SetI8 : MarshalDelegate<I8Setter>(setter);
                         ValuePoker<long> pokeI8 =
                             (long value, int col, long m, long n) => fnI8(penv, col, m, n, value);
                         return new Impl<long>(input, pyCol, idvCol, type, pokeI8);
                     case InternalDataKind.U1:
-                        var fnU1 = MarshalDelegate<U1Setter>(setter);
+                        var fnU1 = direct != null ? direct.SetU1 : MarshalDelegate<U1Setter>(setter);
                         ValuePoker<byte> pokeU1 =
                             (byte value, int col, long m, long n) => fnU1(penv, col, m, n, value);
                         return new Impl<byte>(input, pyCol, idvCol, type, pokeU1);
                     case InternalDataKind.U2:
-                        var fnU2 = MarshalDelegate<U2Setter>(setter);
+                        var fnU2 = direct != null ? direct.SetU2 : MarshalDelegate<U2Setter>(setter);
                         ValuePoker<ushort> pokeU2 =
                             (ushort value, int col, long m, long n) => fnU2(penv, col, m, n, value);
                         return new Impl<ushort>(input, pyCol, idvCol, type, pokeU2);
                     case InternalDataKind.U4:
-                        var fnU4 = MarshalDelegate<U4Setter>(setter);
+                        var fnU4 = direct != null ? direct.SetU4 : MarshalDelegate<U4Setter>(setter);
                         ValuePoker<uint> pokeU4 =
                             (uint value, int col, long m, long n) => fnU4(penv, col, m, n, value);
                         return new Impl<uint>(input, pyCol, idvCol, type, pokeU4);
                     case InternalDataKind.U8:
-                        var fnU8 = MarshalDelegate<U8Setter>(setter);
+                        var fnU8 = direct != null ? direct.SetU8 : MarshalDelegate<U8Setter>(setter);
                         ValuePoker<ulong> pokeU8 =
                             (ulong value, int col, long m, long n) => fnU8(penv, col, m, n, value);
                         return new Impl<ulong>(input, pyCol, idvCol, type, pokeU8);
                     case InternalDataKind.DT:
-                        var fnDT = MarshalDelegate<I8Setter>(setter);
+                        var fnDT = direct != null ? direct.SetI8 : MarshalDelegate<I8Setter>(setter);
                         ValuePoker<DateTime> pokeDT =
                             (DateTime value, int col, long m, long n) =>
                             {
@@ -660,7 +704,98 @@ namespace Microsoft.ML.DotNetBridge
                 return null;
             }
 
-            public abstract void Set();
+            /// <summary>
+            /// Sets the values of the current row of the cursor at the given row of the native column.
+            /// </summary>
+            public abstract void Set(long row);
+
+            /// <summary>
+            /// Setters writing the values in the buffers preallocated by the native code,
+            /// one buffer per column with one value per row. The buffers hold the number of rows
+            /// announced to the native code, the view may have more rows than it reported: these
+            /// go through the native setter, which grows the column. The rows are written in
+            /// increasing order, so a buffer is not written to anymore once it was grown.
+            /// </summary>
+            private sealed class DirectSetters
+            {
+                private readonly void** _buffers;
+                private readonly long _crow;
+                private readonly void* _setter;
+                private Delegate _fallback;
+
+                public DirectSetters(void** buffers, long crow, void* setter)
+                {
+                    Contracts.Assert(buffers != null);
+                    Contracts.Assert(setter != null);
+                    _buffers = buffers;
+                    _crow = crow;
+                    _setter = setter;
+                }
+
+                private TDel Fallback<TDel>()
+                    where TDel : Delegate
+                {
+                    if (_fallback == null)
+                        _fallback = MarshalDelegate<TDel>(_setter);
+                    return (TDel)_fallback;
+                }
+
+                public void SetBL(EnvironmentBlock* penv, int col, long m, long n, byte value)
+                {
+                    if (m < _crow) ((byte*)_buffers[col])[m] = value;
+                    else Fallback<BLSetter>()(penv, col, m, n, value);
+                }
+                public void SetR4(EnvironmentBlock* penv, int col, long m, long n, float value)
+                {
+                    if (m < _crow) ((float*)_buffers[col])[m] = value;
+                    else Fallback<R4Setter>()(penv, col, m, n, value);
+                }
+                public void SetR8(EnvironmentBlock* penv, int col, long m, long n, double value)
+                {
+                    if (m < _crow) ((double*)_buffers[col])[m] = value;
+                    else Fallback<R8Setter>()(penv, col, m, n, value);
+                }
+                public void SetI1(EnvironmentBlock* penv, int col, long m, long n, sbyte value)
+                {
+                    if (m < _crow) ((sbyte*)_buffers[col])[m] = value;
+                    else Fallback<I1Setter>()(penv, col, m, n, value);
+                }
+                public void SetI2(EnvironmentBlock* penv, int col, long m, long n, short value)
+                {
+                    if (m < _crow) ((short*)_buffers[col])[m] = value;
+                    else Fallback<I2Setter>()(penv, col, m, n, value);
+                }
+                public void SetI4(EnvironmentBlock* penv, int col, long m, long n, int value)
+                {
+                    if (m < _crow) ((int*)_buffers[col])[m] = value;
+                    else Fallback<I4Setter>()(penv, col, m, n, value);
+                }
+                public void SetI8(EnvironmentBlock* penv, int col, long m, long n, long value)
+                {
+                    if (m < _crow) ((long*)_buffers[col])[m] = value;
+                    else Fallback<I8Setter>()(penv, col, m, n, value);
+                }
+                public void SetU1(EnvironmentBlock* penv, int col, long m, long n, byte value)
+                {
+                    if (m < _crow) ((byte*)_buffers[col])[m] = value;
+                    else Fallback<U1Setter>()(penv, col, m, n, value);
+                }
+                public void SetU2(EnvironmentBlock* penv, int col, long m, long n, ushort value)
+                {
+                    if (m < _crow) ((ushort*)_buffers[col])[m] = value;
+                    else Fallback<U2Setter>()(penv, col, m, n, value);
+                }
+                public void SetU4(EnvironmentBlock* penv, int col, long m, long n, uint value)
+                {
+                    if (m < _crow) ((uint*)_buffers[col])[m] = value;
+                    else Fallback<U4Setter>()(penv, col, m, n, value);
+                }
+                public void SetU8(EnvironmentBlock* penv, int col, long m, long n, ulong value)
+                {
+                    if (m < _crow) ((ulong*)_buffers[col])[m] = value;
+                    else Fallback<U8Setter>()(penv, col, m, n, value);
+                }
+            }
 
             private sealed class Impl<TSrc> : BufferFillerBase
             {
@@ -684,7 +819,7 @@ namespace Microsoft.ML.DotNetBridge
                     _poker = poker;
                     _isVarLength = (type.GetValueCount() == 0);
                 }
-                public override void Set()
+                public override void Set(long row)
                 {
                     if (_getVec != null)
                     {
@@ -694,8 +829,8 @@ namespace Microsoft.ML.DotNetBridge
                             for (int i = 0; i < _buffer.Length; i++)
                             {
                                 if (_isVarLength)
-                                     _poker(_buffer.GetValues()[i], _colIndex, _input.Position, i);
-                                else _poker(_buffer.GetValues()[i], _colIndex + i, _input.Position, 0);
+                                     _poker(_buffer.GetValues()[i], _colIndex, row, i);
+                                else _poker(_buffer.GetValues()[i], _colIndex + i, row, 0);
                             }
                         }
                         else
@@ -712,8 +847,8 @@ namespace Microsoft.ML.DotNetBridge
                                     val = values[ii];
 
                                 if (_isVarLength)
-                                     _poker(val, _colIndex, _input.Position, i);
-                                else _poker(val, _colIndex + i, _input.Position, 0);
+                                     _poker(val, _colIndex, row, i);
+                                else _poker(val, _colIndex + i, row, 0);
                             }
                         }
                     }
@@ -721,7 +856,7 @@ namespace Microsoft.ML.DotNetBridge
                     {
                         TSrc value = default(TSrc);
                         _get(ref value);
-                        _poker(value, _colIndex, _input.Position, 0);
+                        _poker(value, _colIndex, row, 0);
                     }
                 }
             }
@@ -7,6 +7,7 @@ using System;
 using System.Collections.Generic;
 using System.Collections.Concurrent;
 using System.Linq;
+using System.Text;
 using System.Threading;
 using Microsoft.ML.Data;
 using Microsoft.ML.Internal.Utilities;
@@ -26,6 +27,9 @@ namespace Microsoft.ML.DotNetBridge
 
             private readonly IHost _host;
 
+            // Maximum number of cursors of a cursor set, 0 for no limit.
+            private readonly int _maxThreads;
+
             public bool CanShuffle => false;
 
             /// This field contains some information copied from <see cref="_columns">.
@@ -35,11 +39,13 @@ namespace Microsoft.ML.DotNetBridge
             /// we decided to keep this duplicate piece of data as a quick solution.
             public DataViewSchema Schema { get; }
 
-            public NativeDataView(IHostEnvironment env, DataSourceBlock* pdata)
+            public NativeDataView(IHostEnvironment env, DataSourceBlock* pdata, int maxThreads = 0)
             {
                 Contracts.AssertValue(env);
                 _host = env.Register("PyNativeDataView");
+                _host.CheckParam(maxThreads >= 0, nameof(maxThreads));
                 _rowCount = pdata->crow;
+                _maxThreads = maxThreads;
 
                 var nameSet = new HashSet<string>();
                 var columns = new List<Column>();
@@ -175,6 +181,8 @@ namespace Microsoft.ML.DotNetBridge
                 _host.CheckValueOrNull(rand);
 
                 var active = Utils.BuildArray(_columns.Length, columnsNeeded);
+                if (_maxThreads > 0)
+                    n = Math.Min(n, _maxThreads);
                 return NativeRowCursor.CreateSet(_host, this, active, n, rand);
             }
 
@@ -558,6 +566,12 @@ namespace Microsoft.ML.DotNetBridge
                 public readonly int ColIndex;
                 protected const string AlreadyDisposed = "Native wrapped column has been disposed";
 
+                // Raw buffer of the column and distance in bytes between two rows. When the native
+                // code provides it, the values are read directly from the buffer instead of calling
+                // the getter for every cell.
+                protected byte* RawData;
+                protected long RawStride;
+
                 protected Column(DataSourceBlock* data, int colIndex, string name, DataViewType type)
                 {
                     Contracts.AssertNonWhiteSpace(name);
@@ -565,11 +579,17 @@ namespace Microsoft.ML.DotNetBridge
                     Data = data;
                     ColIndex = colIndex;
                     DetachedColumn = new DataViewSchema.DetachedColumn(name, type);
+                    if (data->colData != null && data->colData[colIndex] != null)
+                    {
+                        RawData = (byte*)data->colData[colIndex];
+                        RawStride = data->colStrides[colIndex];
+                    }
                 }
 
                 public virtual void Dispose()
                 {
                     Data = null;
+                    RawData = null;
                 }
 
                 /// This field contains some duplicate information with <see cref="Schema">.
@@ -605,7 +625,11 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out var val);
+                    sbyte val;
+                    if (RawData != null)
+                        val = *(sbyte*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out val);
                     if (val < 0)
                         throw new InvalidOperationException(
                             $"Bool type doesnt support missing data, use floats or doubles." +
@@ -634,8 +658,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out var val);
-                    value = val;
+                    if (RawData != null)
+                        value = *(sbyte*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -659,8 +685,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out var val);
-                    value = val;
+                    if (RawData != null)
+                        value = *(short*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -684,8 +712,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out var val);
-                    value = val;
+                    if (RawData != null)
+                        value = *(int*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -711,8 +741,10 @@ namespace Microsoft.ML.DotNetBridge
                     // invalid between checking _disposed and accessing the data pointer.
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out var val);
-                    value = val;
+                    if (RawData != null)
+                        value = *(long*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -736,7 +768,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(byte*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -760,7 +795,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(ushort*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -784,7 +822,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(uint*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -810,7 +851,10 @@ namespace Microsoft.ML.DotNetBridge
                     // invalid between checking _disposed and accessing the data pointer.
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(ulong*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -836,7 +880,10 @@ namespace Microsoft.ML.DotNetBridge
                     // invalid between checking _disposed and accessing the data pointer.
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(double*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -860,7 +907,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(float*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -884,7 +934,11 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out var val);
+                    long val;
+                    if (RawData != null)
+                        val = *(long*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out val);
                     value = DateTimeOffset.FromUnixTimeMilliseconds(val).UtcDateTime;
                 }
 
@@ -898,17 +952,37 @@ namespace Microsoft.ML.DotNetBridge
             private sealed class TextColumn : Column<ReadOnlyMemory<char>>
             {
                 private TXGetter _getter;
+                // Set when the values are sent as one UTF-8 buffer, see DataSourceBlock.textOffsets.
+                private long* _offsets;
+                private byte* _missing;
 
                 public TextColumn(DataSourceBlock* data, void* getter, int colIndex, string name)
                     : base(data, colIndex, name, TextDataViewType.Instance)
                 {
-                    _getter = MarshalDelegate<TXGetter>(getter);
+                    if (data->textOffsets != null && data->textOffsets[colIndex] != null)
+                    {
+                        Contracts.Assert(RawData != null);
+                        _offsets = data->textOffsets[colIndex];
+                        _missing = data->textMissing[colIndex];
+                    }
+                    else
+                        _getter = MarshalDelegate<TXGetter>(getter);
                 }
 
                 public void CopyOutEx(long index, ref ReadOnlyMemory<char> value)
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
+                    if (_offsets != null)
+                    {
+                        long start = _offsets[index];
+                        int length = (int)(_offsets[index + 1] - start);
+                        if (((_missing[index >> 3] >> (7 - (int)(index & 7))) & 1) != 0 || length == 0)
+                            value = ReadOnlyMemory<char>.Empty;
+                        else
+                            value = Encoding.UTF8.GetString(RawData + start, length).AsMemory();
+                        return;
+                    }
                     _getter(Data, ColIndex, index, out var pch, out int size, out int missing);
                     if (missing > 0)
                         value = ReadOnlyMemory<char>.Empty;
@@ -929,6 +1003,8 @@ namespace Microsoft.ML.DotNetBridge
                 public override void Dispose()
                 {
                     _getter = null;
+                    _offsets = null;
+                    _missing = null;
                     base.Dispose();
                 }
             }
@@ -963,7 +1039,10 @@ namespace Microsoft.ML.DotNetBridge
                 {
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
-                    _getter(Data, ColIndex, index, out value);
+                    if (RawData != null)
+                        value = *(uint*)(RawData + index * RawStride);
+                    else
+                        _getter(Data, ColIndex, index, out value);
                 }
 
                 public override void Dispose()
@@ -1333,7 +1412,9 @@ namespace Microsoft.ML.DotNetBridge
                 public VectorR4Column(DataSourceBlock* data, void* getter, int colIndex, string name, VectorDataViewType type)
                     : base(data, colIndex, name, type)
                 {
-                    _getter = MarshalDelegate<R4VectorGetter>(getter);
+                    // Dense vectors are read from the rows of the buffer, see RawData.
+                    if (RawData == null)
+                        _getter = MarshalDelegate<R4VectorGetter>(getter);
                     _length = type.GetVectorSize();
                 }
 
@@ -1342,6 +1423,14 @@ namespace Microsoft.ML.DotNetBridge
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
 
+                    if (RawData != null)
+                    {
+                        var denseEditor = VBufferEditor.Create(ref dst, _length);
+                        new ReadOnlySpan<float>(RawData + index * RawStride, _length).CopyTo(denseEditor.Values);
+                        dst = denseEditor.Commit();
+                        return;
+                    }
+
                     _getter(Data, ColIndex, index, null, null, true, out var size);
                     var dstEditor = VBufferEditor.Create(ref dst, _length, size, requireIndicesOnDense: true);
 
@@ -1372,7 +1461,9 @@ namespace Microsoft.ML.DotNetBridge
                 public VectorR8Column(DataSourceBlock* data, void* getter, int colIndex, string name, VectorDataViewType type)
                     : base(data, colIndex, name, type)
                 {
-                    _getter = MarshalDelegate<R8VectorGetter>(getter);
+                    // Dense vectors are read from the rows of the buffer, see RawData.
+                    if (RawData == null)
+                        _getter = MarshalDelegate<R8VectorGetter>(getter);
                     _length = type.GetVectorSize();
                 }
 
@@ -1381,6 +1472,14 @@ namespace Microsoft.ML.DotNetBridge
                     Contracts.Check(Data != null, AlreadyDisposed);
                     Contracts.Assert(0 <= index);
 
+                    if (RawData != null)
+                    {
+                        var denseEditor = VBufferEditor.Create(ref dst, _length);
+                        new ReadOnlySpan<double>(RawData + index * RawStride, _length).CopyTo(denseEditor.Values);
+                        dst = denseEditor.Commit();
+                        return;
+                    }
+
                     _getter(Data, ColIndex, index, null, null, true, out var size);
                     var dstEditor = VBufferEditor.Create(ref dst, _length, size, requireIndicesOnDense: true);
 
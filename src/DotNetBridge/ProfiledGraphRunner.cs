@@ -0,0 +1,299 @@
+﻿//------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT License.
+//------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.IO;
+using System.Linq;
+using System.Reflection;
+using System.Text.RegularExpressions;
+using System.Threading.Tasks;
+using Microsoft.ML.EntryPoints;
+using Microsoft.ML.Runtime;
+using Newtonsoft.Json.Linq;
+
+namespace Microsoft.ML.DotNetBridge
+{
+    public unsafe static partial class Bridge
+    {
+        /// <summary>
+        /// Runs a graph like <see cref="GraphRunner"/>. When profiling, every node runs alone in its own
+        /// <see cref="GraphRunner"/>, its outputs are given to the nodes reading them, and its wall time,
+        /// the number of rows of its output data and the bytes allocated by the thread running the node
+        /// are recorded. Data views are lazy: a transform which does not need to be trained only builds
+        /// its output view, its rows are processed by the node or the output reading them.
+        /// The nodes also run alone when several of them can run at the same time or when they have
+        /// their own seed, the seed of the graph plus their position, so that their results do not
+        /// depend on the order they run in.
+        /// </summary>
+        private sealed class ProfiledGraphRunner
+        {
+            private sealed class Node
+            {
+                public readonly string Name;
+                public readonly GraphRunner Runner;
+                public readonly string[] Inputs;
+                public readonly string[] Outputs;
+
+                public Node(IHostEnvironment env, JObject node)
+                {
+                    Name = node.Value<string>("Name");
+                    Runner = new GraphRunner(env, new JArray(node));
+                    Inputs = GetVariables(node["Inputs"] as JObject).Distinct().ToArray();
+                    Outputs = GetVariables(node["Outputs"] as JObject).ToArray();
+                }
+
+                // An element of an array, $name[index], is read from the variable of the array.
+                private static readonly Regex _variable = new Regex(@"^\$([a-zA-Z_][a-zA-Z0-9_]*)(\[\d+\])?$");
+
+                // The subgraphs of the macros have their own variables.
+                private static IEnumerable<string> GetVariables(JObject ports)
+                {
+                    if (ports == null)
+                        yield break;
+                    foreach (var port in ports)
+                    {
+                        if (port.Key == "Nodes")
+                            continue;
+                        IEnumerable<JToken> values = port.Value is JArray array ? (IEnumerable<JToken>)array : new[] { port.Value };
+                        foreach (var value in values.OfType<JValue>())
+                        {
+                            var match = _variable.Match(value.Value as string ?? "");
+                            if (match.Success)
+                                yield return match.Groups[1].Value;
+                        }
+                    }
+                }
+            }
+
+            private sealed class Step
+            {
+                public string Name;
+                public TimeSpan Time;
+                public long? Rows;
+                public long AllocatedBytes;
+            }
+
+            private static readonly MethodInfo _setInput = typeof(GraphRunner).GetMethod(nameof(GraphRunner.SetInput));
+
+            private readonly IHost _host;
+            // Runs the whole graph when the nodes do not run alone.
+            private readonly GraphRunner _runner;
+            private readonly Node[] _nodes;
+            private readonly bool _profile;
+            private readonly int _maxConcurrentNodes;
+            private readonly Dictionary<string, object> _values = new Dictionary<string, object>();
+            private readonly List<Step> _steps = new List<Step>();
+            private Stopwatch _stepTime;
+            private long _stepAllocated;
+
+            /// <summary>
+            /// Creates the runner, <paramref name="maxConcurrentNodes"/> is the number of nodes run
+            /// at the same time, 0 for no limit, and <paramref name="seed"/> the seed of the graph
+            /// when every node has its own.
+            /// </summary>
+            public ProfiledGraphRunner(IHostEnvironment env, JArray nodes, bool profile, int maxConcurrentNodes = 1, int? seed = null)
+            {
+                Contracts.AssertValue(env);
+                _host = env.Register("ProfiledGraphRunner");
+                _host.CheckParam(maxConcurrentNodes >= 0, nameof(maxConcurrentNodes));
+                _profile = profile;
+                _maxConcurrentNodes = maxConcurrentNodes > 0 ? maxConcurrentNodes : int.MaxValue;
+                if (!profile && maxConcurrentNodes == 1 && seed == null)
+                {
+                    _runner = new GraphRunner(env, nodes);
+                    return;
+                }
+                _host.CheckValue(nodes, nameof(nodes));
+                _nodes = nodes.Select((n, i) => new Node(
+                    seed == null ? env : env.Register(((JObject)n).Value<string>("Name"), seed + i), (JObject)n)).ToArray();
+            }
+
+            public TlcModule.DataKind GetPortDataKind(string name)
+            {
+                if (_runner != null)
+                    return _runner.GetPortDataKind(name);
+                var node = _nodes.FirstOrDefault(n => n.Inputs.Contains(name) || n.Outputs.Contains(name));
+                if (node == null)
+                    throw _host.Except("Variable '{0}' is not found", name);
+                return node.Runner.GetPortDataKind(name);
+            }
+
+            public void SetInput<TInput>(string name, TInput input)
+                where TInput : class
+            {
+                if (_runner != null)
+                    _runner.SetInput(name, input);
+                else
+                    _values[name] = input;
+            }
+
+            public TOutput GetOutput<TOutput>(string name)
+                where TOutput : class
+            {
+                if (_runner != null)
+                    return _runner.GetOutput<TOutput>(name);
+                if (!_values.TryGetValue(name, out var value) || !(value == null || value is TOutput))
+                    throw _host.Except("Output '{0}' is not found", name);
+                return (TOutput)value;
+            }
+
+            public void RunAll()
+            {
+                if (_runner != null)
+                {
+                    _runner.RunAll();
+                    return;
+                }
+
+                // A node runs once all the variables it reads are set. The values are only read and
+                // written by this thread, the nodes running at the same time only see their runner.
+                var pending = _nodes.ToList();
+                var running = new Dictionary<Task<Step>, Node>();
+                while (pending.Count > 0 || running.Count > 0)
+                {
+                    Node node;
+                    while (running.Count < _maxConcurrentNodes && (node = pending.FirstOrDefault(n => n.Inputs.All(_values.ContainsKey))) != null)
+                    {
+                        pending.Remove(node);
+                        SetInputs(node);
+                        if (_maxConcurrentNodes == 1)
+                        {
+                            SetOutputs(node, RunNode(node));
+                            continue;
+                        }
+                        var current = node;
+                        running.Add(Task.Run(() => RunNode(current)), current);
+                    }
+                    if (running.Count == 0)
+                    {
+                        if (pending.Count == 0)
+                            break;
+                        var missing = pending.SelectMany(n => n.Inputs).Where(x => !_values.ContainsKey(x)).Distinct();
+                        throw _host.Except("The following inputs are missing: {0}", string.Join(", ", missing));
+                    }
+
+                    var tasks = running.Keys.ToArray();
+                    var done = tasks[Task.WaitAny(tasks)];
+                    if (done.IsFaulted)
+                    {
+                        // The other nodes may read the same data, they finish before the error is raised.
+                        try
+                        {
+                            Task.WaitAll(tasks);
+                        }
+                        catch (AggregateException)
+                        {
+                        }
+                    }
+                    var doneNode = running[done];
+                    running.Remove(done);
+                    SetOutputs(doneNode, done.GetAwaiter().GetResult());
+                }
+            }
+
+            private void SetInputs(Node node)
+            {
+                foreach (var input in node.Inputs)
+                {
+                    var value = _values[input];
+                    if (value == null)
+                        continue;
+                    try
+                    {
+                        _setInput.MakeGenericMethod(value.GetType()).Invoke(node.Runner, new[] { input, value });
+                    }
+                    catch (TargetInvocationException ex)
+                    {
+                        throw ex.InnerException;
+                    }
+                }
+            }
+
+            // Runs the node and measures it on the thread running it.
+            private Step RunNode(Node node)
+            {
+                if (!_profile)
+                {
+                    node.Runner.RunAll();
+                    return null;
+                }
+                var allocated = GC.GetAllocatedBytesForCurrentThread();
+                var time = Stopwatch.StartNew();
+                node.Runner.RunAll();
+                time.Stop();
+                return new Step()
+                {
+                    Name = node.Name,
+                    Time = time.Elapsed,
+                    AllocatedBytes = GC.GetAllocatedBytesForCurrentThread() - allocated
+                };
+            }
+
+            private void SetOutputs(Node node, Step step)
+            {
+                foreach (var output in node.Outputs)
+                    _values[output] = node.Runner.GetOutput<object>(output);
+                if (step == null)
+                    return;
+                step.Rows = node.Outputs.Select(x => (_values[x] as IDataView)?.GetRowCount()).Max();
+                _steps.Add(step);
+            }
+
+            /// <summary>
+            /// Starts measuring a step of the profile, the graph nodes are measured by <see cref="RunAll"/>.
+            /// </summary>
+            public void StartStep()
+            {
+                if (!_profile)
+                    return;
+                _stepAllocated = GC.GetAllocatedBytesForCurrentThread();
+                _stepTime = Stopwatch.StartNew();
+            }
+
+            /// <summary>
+            /// Records the step started by <see cref="StartStep"/> in the profile, rows is the number
+            /// of rows it processed if known.
+            /// </summary>
+            public void EndStep(string name, long? rows)
+            {
+                if (!_profile)
+                    return;
+                _host.Assert(_stepTime != null);
+                _stepTime.Stop();
+                _steps.Add(new Step()
+                {
+                    Name = name,
+                    Time = _stepTime.Elapsed,
+                    Rows = rows,
+                    AllocatedBytes = GC.GetAllocatedBytesForCurrentThread() - _stepAllocated
+                });
+                _stepTime = null;
+            }
+
+            /// <summary>
+            /// Writes the profile to a tab separated file with a header, the rows are missing
+            /// when a step does not know how many rows it processed.
+            /// </summary>
+            public void SaveProfile(string path)
+            {
+                _host.CheckNonEmpty(path, nameof(path));
+                using (var writer = new StreamWriter(path))
+                {
+                    writer.WriteLine("Step\tName\tTime\tRows\tAllocatedBytes");
+                    for (int i = 0; i < _steps.Count; i++)
+                    {
+                        var step = _steps[i];
+                        writer.WriteLine(string.Format(CultureInfo.InvariantCulture, "{0}\t{1}\t{2}\t{3}\t{4}",
+                            i, step.Name, step.Time.TotalSeconds, step.Rows?.ToString(CultureInfo.InvariantCulture) ?? "",
+                            step.AllocatedBytes));
+                    }
+                }
+            }
+        }
+    }
+}
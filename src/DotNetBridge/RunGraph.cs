@@ -90,6 +90,91 @@ namespace Microsoft.ML.DotNetBridge
                 model.Save(host, fs);
         }
 
+        // Returns the model sent in memory by the native code as path, or stored in the file path.
+        // A model which is not in the cache is deserialized by load with a host of the long-lived
+        // environment, see GetModelCacheHost.
+        private static T LoadModel<T>(EnvironmentBlock* penv, string path, Func<IHost, Stream, T> loadWithHost)
+            where T : class
+        {
+            Func<Stream, T> load = fs => loadWithHost(GetModelCacheHost(), fs);
+            if (penv->modelSource != null)
+            {
+                var modelSource = MarshalDelegate<ModelSource>(penv->modelSource);
+                byte[] name = StringToNullTerminatedBytes(path);
+                byte* modelBytes;
+                long modelSize;
+                bool found;
+                fixed (byte* pname = name)
+                    found = modelSource(penv, (sbyte*)pname, out modelBytes, out modelSize);
+                if (found)
+                    return ModelCache.GetOrLoad(path, modelBytes, modelSize, load);
+            }
+            return ModelCache.GetOrLoad(path, load);
+        }
+
+        // Loads the model sent in memory as path, or stored in the file path, in the model cache so that
+        // the first graph reading it does not pay for its deserialization. A file may hold a predictor
+        // model or only transforms, it is read as a transform model when it has no predictor.
+        private static void PreloadModel(EnvironmentBlock* penv, IHost host, string path)
+        {
+            host.CheckNonEmpty(path, nameof(path));
+            try
+            {
+                LoadModel<PredictorModel>(penv, path, (h, fs) => new PredictorModelImpl(h, fs));
+            }
+            catch (Exception e) when (!(e is IOException))
+            {
+                LoadModel<TransformModel>(penv, path, (h, fs) => new TransformModelImpl(h, fs));
+            }
+        }
+
+        // Sends the model output as name to the native code.
+        private static void SendModelToNative(EnvironmentBlock* penv, string name, Action<Stream> save, IHost host)
+        {
+            if (penv->modelSink == null)
+                throw host.Except("Returning in-memory models is not supported");
+            var modelSink = MarshalDelegate<ModelSink>(penv->modelSink);
+
+            byte[] modelBytes;
+            using (var ms = new MemoryStream())
+            {
+                save(ms);
+                modelBytes = ms.ToArray();
+            }
+            byte[] bname = StringToNullTerminatedBytes(name);
+            fixed (byte* pname = bname)
+            fixed (byte* pmodel = modelBytes)
+                modelSink(penv, (sbyte*)pname, pmodel, (ulong)modelBytes.Length);
+        }
+
+        // Arguments of the entry points setting their number of threads.
+        private static readonly string[] _numberOfThreadsArguments = { "NumberOfThreads", "NumThreads" };
+
+        // Sets the number of threads of the nodes, including the nodes of their subgraphs, which can set it
+        // and leave it to its default, the number of cores. RmlEnvironment takes no number of threads, the
+        // limit only reaches the components through their arguments.
+        private static void LimitNumberOfThreads(IHostEnvironment env, JArray nodes, int numThreads)
+        {
+            if (nodes == null)
+                return;
+            foreach (var node in nodes.OfType<JObject>())
+            {
+                var name = node.Value<string>("Name");
+                var inputs = node["Inputs"] as JObject;
+                if (name == null || inputs == null || !env.ComponentCatalog.TryFindEntryPoint(name, out var info))
+                    continue;
+                foreach (var argument in _numberOfThreadsArguments)
+                {
+                    var field = info.InputType.GetField(argument);
+                    if (field == null || (field.FieldType != typeof(int) && field.FieldType != typeof(int?)))
+                        continue;
+                    if (inputs[argument] == null || inputs[argument].Type == JTokenType.Null)
+                        inputs[argument] = numThreads;
+                }
+                LimitNumberOfThreads(env, inputs["Nodes"] as JArray, numThreads);
+            }
+        }
+
         private static void RunGraphCore(EnvironmentBlock* penv, IHostEnvironment env, string graphStr, int cdata, DataSourceBlock** ppdata)
         {
             Contracts.AssertValue(env);
@@ -105,13 +190,39 @@ namespace Microsoft.ML.DotNetBridge
                 throw host.Except(ex, "Failed to parse experiment graph: {0}", ex.Message);
             }
 
-            var runner = new GraphRunner(host, graph["nodes"] as JArray);
+            var nodes = graph["nodes"] as JArray;
+            // The folds of the cross validations are trained at the same time when the graph gives
+            // their number, 0 for all of them. The nodes get their own seed so that the results do
+            // not depend on it. Chunked data can only be read by one fold at a time.
+            var parallelFolds = graph.Value<int?>("parallel_folds");
+            if (parallelFolds != null && nodes != null)
+            {
+                for (int i = 0; i < cdata; i++)
+                {
+                    if (ppdata[i]->nextChunk != null)
+                        parallelFolds = 1;
+                }
+                var numThreads = penv->numThreads > 0 ? penv->numThreads : Environment.ProcessorCount;
+                nodes = ExpandCrossValidators(env, nodes, parallelFolds.Value, numThreads);
+            }
+            if (penv->numThreads > 0)
+                LimitNumberOfThreads(env, nodes, penv->numThreads);
+            // The graph is run node by node and profiled when it has the path of a profile.
+            var profilePath = graph.Value<string>("profile");
+            var runner = parallelFolds == null
+                ? new ProfiledGraphRunner(host, nodes, !string.IsNullOrEmpty(profilePath))
+                : new ProfiledGraphRunner(host, nodes, !string.IsNullOrEmpty(profilePath), parallelFolds.Value, penv->seed);
 
             var dvNative = new IDataView[cdata];
             try
             {
                 for (int i = 0; i < cdata; i++)
-                    dvNative[i] = new NativeDataView(host, ppdata[i]);
+                {
+                    if (ppdata[i]->nextChunk != null)
+                        dvNative[i] = new ChunkedDataView(host, ppdata[i]);
+                    else
+                        dvNative[i] = new NativeDataView(host, ppdata[i], penv->numThreads);
+                }
 
                 // Setting inputs.
                 var jInputs = graph["inputs"] as JObject;
@@ -151,8 +262,22 @@ namespace Microsoft.ML.DotNetBridge
                                 else
                                 {
                                     Contracts.Assert(iDv < dvNative.Length);
-                                    // prefetch all columns
+                                    var pdata = ppdata[iDv];
                                     dv = dvNative[iDv++];
+                                    if (dv is ChunkedDataView)
+                                    {
+                                        // The chunks can be read once, they are written to a binary
+                                        // file when the graph needs several passes over the data.
+                                        if (pdata->spillPath != null)
+                                        {
+                                            var spillPath = BytesToString(pdata->spillPath);
+                                            SaveIdvToFile(dv, spillPath, host);
+                                            dv = new BinaryLoader(host, new BinaryLoader.Arguments(), spillPath);
+                                        }
+                                        runner.SetInput(varName, dv);
+                                        break;
+                                    }
+                                    // prefetch all columns
                                     var prefetch = new int[dv.Schema.Count];
                                     for (int i = 0; i < prefetch.Length; i++)
                                         prefetch[i] = i;
@@ -163,10 +288,7 @@ namespace Microsoft.ML.DotNetBridge
                             case TlcModule.DataKind.PredictorModel:
                                 PredictorModel pm;
                                 if (!string.IsNullOrWhiteSpace(path))
-                                {
-                                    using (var fs = File.OpenRead(path))
-                                        pm = new PredictorModelImpl(host, fs);
-                                }
+                                    pm = LoadModel<PredictorModel>(penv, path, (h, fs) => new PredictorModelImpl(h, fs));
                                 else
                                     throw host.Except("Model must be loaded from a file");
                                 runner.SetInput(varName, pm);
@@ -174,10 +296,7 @@ namespace Microsoft.ML.DotNetBridge
                             case TlcModule.DataKind.TransformModel:
                                 TransformModel tm;
                                 if (!string.IsNullOrWhiteSpace(path))
-                                {
-                                    using (var fs = File.OpenRead(path))
-                                        tm = new TransformModelImpl(host, fs);
-                                }
+                                    tm = LoadModel<TransformModel>(penv, path, (h, fs) => new TransformModelImpl(h, fs));
                                 else
                                     throw host.Except("Model must be loaded from a file");
                                 runner.SetInput(varName, tm);
@@ -190,6 +309,7 @@ namespace Microsoft.ML.DotNetBridge
                 runner.RunAll();
 
                 // Reading outputs. 
+                runner.StartStep();
                 using (var ch = host.Start("Reading outputs"))
                 {
                     var jOutputs = graph["outputs"] as JObject;
@@ -232,7 +352,7 @@ namespace Microsoft.ML.DotNetBridge
                                         SavePredictorModelToFile(pm, path, host);
                                     }
                                     else
-                                        throw host.Except("Returning in-memory models is not supported");
+                                        SendModelToNative(penv, varName, fs => pm.Save(host, fs), host);
                                     break;
                                 case TlcModule.DataKind.TransformModel:
                                     var tm = runner.GetOutput<TransformModel>(varName);
@@ -242,7 +362,7 @@ namespace Microsoft.ML.DotNetBridge
                                             tm.Save(host, fs);
                                     }
                                     else
-                                        throw host.Except("Returning in-memory models is not supported");
+                                        SendModelToNative(penv, varName, fs => tm.Save(host, fs), host);
                                     break;
 
                                 case TlcModule.DataKind.Array:
@@ -267,6 +387,9 @@ namespace Microsoft.ML.DotNetBridge
                         }
                     }
                 }
+                runner.EndStep("Reading outputs", null);
+                if (!string.IsNullOrEmpty(profilePath))
+                    runner.SaveProfile(profilePath);
             }
             finally
             {
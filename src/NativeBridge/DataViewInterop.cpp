@@ -10,6 +10,92 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
     // Assert that this class doesn't have a vtable.
     assert(offsetof(DataSourceBlock, ccol) == 0);
 
+    this->nextChunk = nullptr;
+    this->spillPath = nullptr;
+    this->chunkError = nullptr;
+    if (data.contains(PYTHON_DATA_CHUNKS))
+    {
+        _chunks = data[PYTHON_DATA_CHUNKS];
+        this->nextChunk = &NextChunk;
+        if (data.contains(PYTHON_DATA_SPILL))
+        {
+            _spillPath = bp::extract<std::string>(data[PYTHON_DATA_SPILL]);
+            this->spillPath = _spillPath.c_str();
+        }
+    }
+
+    Load(data);
+}
+
+MANAGED_CALLBACK(int) DataSourceBlock::NextChunk(DataSourceBlock *pdata)
+{
+    PyGILLock gil;
+    try
+    {
+        bp::handle<> next(bp::allow_null(PyIter_Next(pdata->_chunks.ptr())));
+        if (!next)
+        {
+            if (PyErr_Occurred())
+                bp::throw_error_already_set();
+            return 0;
+        }
+        // The previous chunk is released once the new one holds the buffers.
+        bp::dict chunk = bp::extract<bp::dict>(bp::object(next));
+        pdata->Load(chunk);
+        pdata->_chunk = chunk;
+        return 1;
+    }
+    catch (bp::error_already_set const&)
+    {
+        // Exceptions must not go through the managed code, their message is given to it
+        // through chunkError.
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        PyErr_NormalizeException(&type, &value, &traceback);
+        bp::handle<> htype(bp::allow_null(type));
+        bp::handle<> hvalue(bp::allow_null(value));
+        bp::handle<> htraceback(bp::allow_null(traceback));
+        pdata->_chunkError = "Python exception";
+        try
+        {
+            if (htype)
+                pdata->_chunkError = bp::extract<std::string>(bp::object(htype).attr("__name__"));
+            if (hvalue)
+                pdata->_chunkError += ": " + std::string(bp::extract<std::string>(bp::str(bp::object(hvalue))));
+        }
+        catch (bp::error_already_set const&)
+        {
+            PyErr_Clear();
+        }
+        pdata->chunkError = pdata->_chunkError.c_str();
+    }
+    catch (const std::exception& e)
+    {
+        pdata->_chunkError = e.what();
+        pdata->chunkError = pdata->_chunkError.c_str();
+    }
+    return -1;
+}
+
+void DataSourceBlock::Load(bp::dict& data)
+{
+    _mpnum.clear();
+    _mptxt.clear();
+    _mpkey.clear();
+    _vname.clear();
+    _vkind.clear();
+    _vkeyCard.clear();
+    _vvecCard.clear();
+    _vgetter.clear();
+    _vdata.clear();
+    _vcolData.clear();
+    _vcolStride.clear();
+    _vtextOffsets.clear();
+    _vtextMissing.clear();
+    _vtextdata.clear();
+    _vkeydata.clear();
+    _vkeynames.clear();
+
     CxInt64 llTotalNumRows = -1;
     assert(data.contains(PYTHON_DATA_KEY_INFO));
     bp::dict varInfo = bp::extract<bp::dict>(data[PYTHON_DATA_KEY_INFO]);
@@ -25,7 +111,8 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
         bp::object key = *keys;
         char* name = bp::extract<char*>(key);
         bp::object value = *values++;
-        if (strcmp(name, PYTHON_DATA_KEY_INFO) == 0 || strcmp(name, PYTHON_DATA_COL_TYPES) == 0)
+        if (strcmp(name, PYTHON_DATA_KEY_INFO) == 0 || strcmp(name, PYTHON_DATA_COL_TYPES) == 0 ||
+            strcmp(name, PYTHON_DATA_CHUNKS) == 0 || strcmp(name, PYTHON_DATA_SPILL) == 0)
             continue;
 
         // now it should be a column names
@@ -40,6 +127,10 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
         bool isNumeric = false;
         bool isText = false;
         CxInt64 vecCard = -1;
+        const void *colData = nullptr;
+        CxInt64 colStride = 0;
+        const CxInt64 *textOffsets = nullptr;
+        const BYTE *textMissing = nullptr;
         // Numeric or bool values.
         if (bp::extract<np::ndarray>(value).check())
         {
@@ -51,10 +142,6 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
                 kind = BL;
                 pgetter = (void*)&GetBL;
                 break;
-            case (ML_PY_BOOL64):
-                kind = BL;
-                pgetter = (void*)&GetBL64;
-                break;
             case (ML_PY_UINT8):
                 kind = U1;
                 pgetter = (void*)&GetU1;
@@ -102,11 +189,34 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
                 kind = DT;
                 pgetter = (void*)&GetI8;
                 break;
+            case (ML_PY_CAT):
+            {
+                // Categorical codes as int32, shifted by one so 0 is the missing value.
+                if (!varInfo.contains(colName))
+                    throw std::invalid_argument("column " + colName + " has no categories");
+                assert(val.get_dtype() == np::dtype::get_builtin<int>());
+                isKey = true;
+                bp::list keyNames = bp::extract<bp::list>(varInfo[colName]);
+
+                kind = U4;
+                pgetter = (void*)&GetU4;
+
+                this->_vkeyCard.push_back(len(keyNames));
+                // Keeps _vkeydata parallel to _vkeynames, the codes are read from _vdata.
+                this->_vkeydata.push_back(bp::list());
+                this->_vkeynames.push_back(keyNames);
+
+                assert(this->_mpkey.size() == dataframeColCount);
+                this->_mpkey.push_back(_vkeydata.size() - 1);
+                break;
+            }
             default:
                 throw std::invalid_argument("column " + colName + " has unsupported type");
             }
             const char *data = val.get_data();
             this->_vdata.push_back(data);
+            colData = data;
+            colStride = val.strides(0);
 
             assert(this->_mpnum.size() == dataframeColCount);
             this->_mpnum.push_back(_vdata.size() - 1);
@@ -175,6 +285,58 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
                 throw std::invalid_argument("column " + colName + " has unsupported type");
             }
         }
+        // Text values as UTF-8 buffers, read directly by the managed code.
+        else if (bp::extract<bp::dict>(value).check() && (colType == ML_PY_TEXT || colType == ML_PY_UNICODE))
+        {
+            bp::dict text = bp::extract<bp::dict>(value);
+            np::ndarray bytes = bp::extract<np::ndarray>(text["..Data"]);
+            np::ndarray offsets = bp::extract<np::ndarray>(text["..Offsets"]);
+            np::ndarray missing = bp::extract<np::ndarray>(text["..Missing"]);
+
+            isText = true;
+            kind = TX;
+            pgetter = nullptr;
+            colData = bytes.get_data();
+            colStride = 1;
+            textOffsets = reinterpret_cast<const CxInt64*>(offsets.get_data());
+            textMissing = reinterpret_cast<const BYTE*>(missing.get_data());
+
+            assert(this->_mptxt.size() == dataframeColCount);
+            this->_mptxt.push_back(-1);
+            if (llTotalNumRows == -1)
+                llTotalNumRows = offsets.shape(0) - 1;
+            else
+                assert(llTotalNumRows == offsets.shape(0) - 1);
+        }
+        // A dense vector of fixed size, a C-contiguous 2-D array whose rows are read directly by the managed code.
+        else if (bp::extract<bp::dict>(value).check() && !bp::extract<bp::dict>(value)().has_key("indptr"))
+        {
+            bp::dict dense = bp::extract<bp::dict>(value);
+            np::ndarray values = bp::extract<np::ndarray>(dense["values"]);
+            switch (colType)
+            {
+            case (ML_PY_FLOAT32):
+                kind = R4;
+                break;
+            case (ML_PY_FLOAT64):
+                kind = R8;
+                break;
+            default:
+                throw std::invalid_argument("column " + colName + " has unsupported type, a dense vector must be float32 or float64");
+            }
+            if (values.get_nd() != 2 || !(values.get_flags() & np::ndarray::C_CONTIGUOUS))
+                throw std::invalid_argument("column " + colName + " must be a C-contiguous 2-D array");
+            pgetter = nullptr;
+            colData = values.get_data();
+            colStride = values.strides(0);
+            vecCard = bp::extract<int>(dense["colCount"]);
+            name = (char*)"Data";
+
+            if (llTotalNumRows == -1)
+                llTotalNumRows = values.shape(0);
+            else
+                assert(llTotalNumRows == values.shape(0));
+        }
         // A sparse vector.
         else if (bp::extract<bp::dict>(value).check())
         {
@@ -252,6 +414,10 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
         this->_vname.push_back(name);
         this->_vkind.push_back(kind);
         _vvecCard.push_back(vecCard);
+        this->_vcolData.push_back(colData);
+        this->_vcolStride.push_back(colStride);
+        this->_vtextOffsets.push_back(textOffsets);
+        this->_vtextMissing.push_back(textMissing);
 
         if (!isNumeric)
         {
@@ -288,6 +454,10 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
         this->keyCards = &this->_vkeyCard[0];
         this->vecCards = &this->_vvecCard[0];
         this->getters = &this->_vgetter[0];
+        this->colData = &this->_vcolData[0];
+        this->colStrides = &this->_vcolStride[0];
+        this->textOffsets = &this->_vtextOffsets[0];
+        this->textMissing = &this->_vtextMissing[0];
     }
     else
     {
@@ -296,6 +466,10 @@ DataSourceBlock::DataSourceBlock(bp::dict& data)
         this->keyCards = nullptr;
         this->vecCards = nullptr;
         this->getters = nullptr;
+        this->colData = nullptr;
+        this->colStrides = nullptr;
+        this->textOffsets = nullptr;
+        this->textMissing = nullptr;
     }
 }
 
@@ -319,6 +493,13 @@ DataSourceBlock::~DataSourceBlock()
     FillDead(this->vecCards);
     FillDead(this->getters);
     FillDead(this->getLabels);
+    FillDead(this->colData);
+    FillDead(this->colStrides);
+    FillDead(this->textOffsets);
+    FillDead(this->textMissing);
+    FillDead(this->nextChunk);
+    FillDead(this->spillPath);
+    FillDead(this->chunkError);
 }
 
 
@@ -8,12 +8,18 @@
 #define ONEMASK ((size_t)(-1) / 0xFF)
 #define PYTHON_DATA_KEY_INFO "..mlVarInfo"
 #define PYTHON_DATA_COL_TYPES "..mlColTypes"
+#define PYTHON_DATA_CHUNKS "..mlChunks"
+#define PYTHON_DATA_SPILL "..mlSpill"
 
 class DataSourceBlock;
 
 // Callback function for getting labels for key-type columns. Returns success.
 typedef MANAGED_CALLBACK_PTR(bool, GETLABELS)(DataSourceBlock *source, int col, int count, const char **buffer);
 
+// Callback function replacing the data of the block with the next chunk. Returns 1 when a chunk
+// was loaded, 0 when there is no more data and -1 when the python iterator failed.
+typedef MANAGED_CALLBACK_PTR(int, NEXTCHUNK)(DataSourceBlock *source);
+
 // REVIEW: boost_python is not updated at the same speed as swig or pybind11.
 // Both have a larger audience now, see about pybind11 https://github.com/davisking/dlib/issues/293
 // It handles csr_matrix: https://pybind11-rtdtest.readthedocs.io/en/stable/advanced.html#transparent-conversion-of-dense-and-sparse-eigen-data-types.
@@ -52,6 +58,27 @@ private:
     // Call back function for getting labels.
     GETLABELS getLabels;
 
+    // Raw column buffers, managed code reads the values directly instead of calling the getters.
+    // nullptr for the columns which need a getter (text, key, sparse, bool stored as float64).
+    const void **colData;
+    // Distance in bytes between two consecutive rows of the raw column buffers.
+    const CxInt64 *colStrides;
+    // For text columns sent as UTF-8 buffers, colData holds the bytes of all the values,
+    // textOffsets the offsets of the values in it (crow + 1 items) and textMissing a bitmap
+    // of the missing values (most significant bit first). nullptr for the other columns.
+    const CxInt64 **textOffsets;
+    const BYTE **textMissing;
+
+    // Call back function loading the next chunk of the data, nullptr when all the data is
+    // in this block.
+    NEXTCHUNK nextChunk;
+    // Binary file the chunks are written to so the graph can read the data several times,
+    // nullptr when the chunks are read once.
+    const char *spillPath;
+    // Message of the python exception raised while loading the last chunk, nullptr when
+    // nextChunk did not fail.
+    const char *chunkError;
+
 private:
     // *** Stuff below here is not known by the managed code.
 
@@ -73,6 +100,11 @@ private:
     std::vector<const void *> _vgetter;
 
     std::vector<const void*> _vdata;
+    // Raw column buffers and strides, parallel to the vectors above.
+    std::vector<const void*> _vcolData;
+    std::vector<CxInt64> _vcolStride;
+    std::vector<const CxInt64*> _vtextOffsets;
+    std::vector<const BYTE*> _vtextMissing;
     std::vector<bp::list> _vtextdata;
     std::vector<char*> _vtextdata_cache;
     std::vector<bp::list> _vkeydata;
@@ -84,11 +116,21 @@ private:
     int* _sparseIndices;
     int* _indPtr;
 
+    // Python iterator of the next chunks and the chunk currently loaded, which owns the buffers.
+    bp::object _chunks;
+    bp::dict _chunk;
+    std::string _spillPath;
+    std::string _chunkError;
+
 public:
     DataSourceBlock(bp::dict& data);
     ~DataSourceBlock();
 
 private:
+    // Fills the columns of the block from the dictionary built by resolve_dataframe.
+    void Load(bp::dict& data);
+
+    static MANAGED_CALLBACK(int) NextChunk(DataSourceBlock *pdata);
 
     bp::object SelectItemForType(bp::list& container)
     {
@@ -116,16 +158,6 @@ private:
         const signed char *charData = reinterpret_cast<const signed char*>(pdata->_vdata[numCol]);
         dst = charData[index];
     }
-    static MANAGED_CALLBACK(void) GetBL64(DataSourceBlock *pdata, int col, long index, /*out*/ signed char &dst)
-    {
-        CxInt64 numCol = pdata->_mpnum[col];
-        assert(0 <= numCol && numCol < (CxInt64)pdata->_vdata.size());
-        const double *charData = reinterpret_cast<const double*>(pdata->_vdata[numCol]);
-        if (boost::math::isnan(charData[index]))
-            dst = -1;
-        else
-            dst = (signed char)charData[index];
-    }
     static MANAGED_CALLBACK(void) GetU1(DataSourceBlock *pdata, int col, long index, /*out*/ unsigned char &dst)
     {
         CxInt64 numCol = pdata->_mpnum[col];
@@ -200,6 +232,7 @@ private:
     // Call back from C# to map from data buffer and index to char* and convert to UTF16.
     static MANAGED_CALLBACK(void) GetTX(DataSourceBlock *pdata, int col, long index, const/*out*/ char*& pch, /*out*/int32_t &size, /*out*/int32_t &missing)
     {
+        PyGILLock gil;
         CxInt64 txCol = pdata->_mptxt[col];
         assert(0 <= txCol && txCol < (CxInt64)pdata->_vtextdata.size());
         bp::object s = pdata->_vtextdata[txCol][index];
@@ -234,6 +267,7 @@ private:
     // Call back from C# to get text data in UTF16 from unicode bytestring
     static MANAGED_CALLBACK(void) GetUnicodeTX(DataSourceBlock *pdata, int col, long index, const/*out*/ char*& pch, /*out*/int32_t &size, /*out*/int32_t &missing)
     {
+        PyGILLock gil;
         CxInt64 txCol = pdata->_mptxt[col];
         assert(0 <= txCol && txCol < (CxInt64)pdata->_vtextdata.size());
         auto s = pdata->_vtextdata[txCol][index];
@@ -290,6 +324,7 @@ private:
 
     static MANAGED_CALLBACK(void) GetKeyInt(DataSourceBlock *pdata, int col, long index, /*out*/ int& dst)
     {
+        PyGILLock gil;
         CxInt64 keyCol = pdata->_mpkey[col];
         assert(0 <= keyCol && keyCol < (CxInt64)pdata->_vkeydata.size());
 
@@ -324,6 +359,7 @@ private:
             return OnGetLabelsFailure(count, buffer);
         }
 
+        PyGILLock gil;
         CxInt64 keyCol = pdata->_mpkey[col];
         bp::list & names = pdata->_vkeynames[keyCol];
         if (len(names) != count)
@@ -531,7 +567,6 @@ struct DataViewBlock
 
 enum ML_PY_TYPE_MAP_ENUM {
     ML_PY_BOOL = '?',
-    ML_PY_BOOL64 = '!',
     ML_PY_UINT8 = 'B',
     ML_PY_UINT16 = 'H',
     ML_PY_UINT32 = 'I',
@@ -26,12 +26,26 @@ EnvironmentBlock::~EnvironmentBlock()
     FillDead(this->messageSink);
     FillDead(this->modelSink);
     FillDead(this->checkCancel);
+    FillDead(this->sessionMode);
+    FillDead(this->cacheCommand);
+    FillDead(this->modelCacheBudget);
+    FillDead(this->dataBatchSink);
+    FillDead(this->dataBatchSize);
+    FillDead(this->modelSource);
+    FillDead(this->numThreads);
 
     for (size_t i = 0; i < _vset.size(); i++)
         FillDead(_vset[i]);
+    for (size_t i = 0; i < _vbuf.size(); i++)
+        FillDead(_vbuf[i]);
+
+    // Columns allocated for a batch which was never sent.
+    ReleaseColumns();
 }
 
-EnvironmentBlock::EnvironmentBlock(int verbosity, int maxSlots, int seed, const char* pythonPath)
+EnvironmentBlock::EnvironmentBlock(int verbosity, int maxSlots, int seed, const char* pythonPath,
+    int sessionMode, int cacheCommand, CxInt64 modelCacheBudget, bp::object batchCallback, CxInt64 dataBatchSize,
+    bp::object modelCallback, bp::dict models, int numThreads)
 {
     // Assert that this class doesn't have a vtable.
     assert(offsetof(EnvironmentBlock, verbosity) == 0);
@@ -40,6 +54,24 @@ EnvironmentBlock::EnvironmentBlock(int verbosity, int maxSlots, int seed, const
     this->maxSlots = maxSlots;
     this->seed = seed;
     this->pythonPath = pythonPath;
+    this->sessionMode = sessionMode;
+    this->cacheCommand = cacheCommand;
+    this->modelCacheBudget = modelCacheBudget;
+    this->_batchCallback = batchCallback;
+    this->dataBatchSize = dataBatchSize;
+    this->_modelCallback = modelCallback;
+    this->_modelBytes = models;
+    this->numThreads = numThreads;
+    bp::list names = models.keys();
+    for (bp::ssize_t i = 0; i < bp::len(names); i++)
+    {
+        std::string name = bp::extract<std::string>(names[i]);
+        PyObject* bytes = bp::object(models[names[i]]).ptr();
+        if (!PyBytes_Check(bytes))
+            throw std::invalid_argument("The model " + name + " must be bytes.");
+        _models[name] = std::make_pair((const unsigned char*)PyBytes_AS_STRING(bytes),
+            (CxInt64)PyBytes_GET_SIZE(bytes));
+    }
     this->_kindMask = (1 << Warning) | (1 << Error);
     if (verbosity > 0)
         this->_kindMask |= (1 << Info);
@@ -49,13 +81,16 @@ EnvironmentBlock::EnvironmentBlock(int verbosity, int maxSlots, int seed, const
     this->messageSink = &MessageSink;
     this->modelSink = &ModelSink;
     this->checkCancel = &CheckCancel;
+    this->dataBatchSink = batchCallback.is_none() ? nullptr : &DataBatchSink;
+    this->modelSource = _models.empty() ? nullptr : &ModelSource;
 }
 
-STATIC MANAGED_CALLBACK(void) EnvironmentBlock::DataSink(EnvironmentBlock *penv, const DataViewBlock *pdata, void **&setters, void *&keyValueSetter)
+STATIC MANAGED_CALLBACK(void) EnvironmentBlock::DataSink(EnvironmentBlock *penv, const DataViewBlock *pdata, void **&setters, void *&keyValueSetter, void **&buffers)
 {
     penv->DataSinkCore(pdata);
     setters = &penv->_vset[0];
     keyValueSetter = (void *)&SetKeyValue;
+    buffers = &penv->_vbuf[0];
 }
 
 void EnvironmentBlock::DataSinkCore(const DataViewBlock * pdata)
@@ -65,8 +100,6 @@ void EnvironmentBlock::DataSinkCore(const DataViewBlock * pdata)
     for (int i = 0; i < pdata->ccol; i++)
     {
         BYTE kind = pdata->kinds[i];
-        _columns.push_back(PyColumnBase::Create(kind, pdata->crow, pdata->valueCounts[i]));
-
         switch (kind)
         {
         case BL:
@@ -118,13 +151,142 @@ void EnvironmentBlock::DataSinkCore(const DataViewBlock * pdata)
             _vKeyValues.push_back(new PyColumnSingle<std::string>(TX, pdata->keyCards[i]));
         }
 
+        _kinds.push_back(kind);
+        _valueCounts.push_back(pdata->valueCounts[i]);
+        _vbuf.push_back(nullptr);
         _names.push_back(pdata->names[i]);
     }
+
+    CreateColumns(pdata->crow);
+}
+
+// Creates the columns receiving the next numRows rows. The previous columns are owned
+// by the arrays returned to python. _vbuf is updated in place since the managed code
+// keeps a pointer to it.
+void EnvironmentBlock::CreateColumns(CxInt64 numRows)
+{
+    ReleaseColumns();
+    for (size_t i = 0; i < _kinds.size(); i++)
+    {
+        BYTE kind = _kinds[i];
+        PyColumnBase* column = PyColumnBase::Create(kind, numRows, _valueCounts[i]);
+        _columns.push_back(column);
+        void* buffer = nullptr;
+
+        switch (kind)
+        {
+        case BL:
+        case I1:
+            buffer = PreallocateBuffer<signed char>(column, numRows);
+            break;
+        case I2:
+            buffer = PreallocateBuffer<short>(column, numRows);
+            break;
+        case I4:
+            buffer = PreallocateBuffer<int>(column, numRows);
+            break;
+        case DT:
+        case I8:
+            buffer = PreallocateBuffer<CxInt64>(column, numRows);
+            break;
+        case U1:
+            buffer = PreallocateBuffer<unsigned char>(column, numRows);
+            break;
+        case U2:
+            buffer = PreallocateBuffer<unsigned short>(column, numRows);
+            break;
+        case U4:
+            buffer = PreallocateBuffer<unsigned int>(column, numRows);
+            break;
+        case U8:
+            buffer = PreallocateBuffer<CxUInt64>(column, numRows);
+            break;
+        case R4:
+            buffer = PreallocateBuffer<float>(column, numRows);
+            break;
+        case R8:
+            buffer = PreallocateBuffer<double>(column, numRows);
+            break;
+        }
+        _vbuf[i] = buffer;
+    }
 }
 
-STATIC MANAGED_CALLBACK(void) EnvironmentBlock::ModelSink(EnvironmentBlock * env,
+STATIC MANAGED_CALLBACK(bool) EnvironmentBlock::DataBatchSink(EnvironmentBlock *penv, CxInt64 numRows)
+{
+    return penv->DataBatchSinkCore(numRows);
+}
+
+bool EnvironmentBlock::DataBatchSinkCore(CxInt64 numRows)
+{
+    // The last batch is usually shorter than the preallocated columns.
+    for (size_t i = 0; i < _columns.size(); i++)
+        _columns[i]->Truncate(numRows);
+
+    PyGILLock gil;
+    bool more = false;
+    try
+    {
+        more = bp::extract<bool>(_batchCallback(GetData()));
+    }
+    catch (bp::error_already_set const&)
+    {
+        // Exceptions must not go through the managed code, the data is not sent anymore.
+        PyErr_Print();
+    }
+
+    // No batch follows a stop or a batch shorter than the others, the columns are only
+    // allocated again when the managed code may still send rows.
+    if (more && numRows == dataBatchSize)
+        CreateColumns(dataBatchSize);
+    else
+    {
+        ReleaseColumns();
+        for (size_t i = 0; i < _vbuf.size(); i++)
+            _vbuf[i] = nullptr;
+    }
+    return more;
+}
+
+// Deletes the columns which were not handed over to python by GetData.
+void EnvironmentBlock::ReleaseColumns()
+{
+    for (size_t i = 0; i < _columns.size(); i++)
+    {
+        if (_columns[i] != nullptr)
+            delete _columns[i];
+    }
+    _columns.clear();
+}
+
+STATIC MANAGED_CALLBACK(void) EnvironmentBlock::ModelSink(EnvironmentBlock * env, const char * name,
     const unsigned char * pBinaryModel, size_t iModelLen)
 {
+    if (env->_modelCallback.is_none())
+        return;
+
+    PyGILLock gil;
+    try
+    {
+        bp::object bytes(bp::handle<>(PyBytes_FromStringAndSize((const char*)pBinaryModel, iModelLen)));
+        env->_modelCallback(std::string(name), bytes);
+    }
+    catch (bp::error_already_set const&)
+    {
+        // Exceptions must not go through the managed code.
+        PyErr_Print();
+    }
+}
+
+STATIC MANAGED_CALLBACK(bool) EnvironmentBlock::ModelSource(EnvironmentBlock * env, const char * name,
+    const unsigned char *& pBinaryModel, CxInt64 & iModelLen)
+{
+    auto it = env->_models.find(std::string(name));
+    if (it == env->_models.end())
+        return false;
+    pBinaryModel = it->second.first;
+    iModelLen = it->second.second;
+    return true;
 }
 
 
@@ -160,6 +322,7 @@ STATIC MANAGED_CALLBACK(void) EnvironmentBlock::MessageSink(EnvironmentBlock * e
         }
 
         // Redirect message to Python streams
+        PyGILLock gil;
         PyObject *sys = PyImport_ImportModule("sys");
         PyObject *pystream = PyObject_GetAttrString(sys, (kind == Error) ? "stderr" : "stdout");
         PyObject_CallMethod(pystream, "write", "s", sMessage.c_str());
@@ -220,6 +383,7 @@ bp::dict EnvironmentBlock::GetData()
                 list.append(obj);
             }
             dict[_names[i]] = list;
+            delete column;
         }
         break;
         case BL:
@@ -267,6 +431,9 @@ bp::dict EnvironmentBlock::GetData()
         default:
             throw std::invalid_argument("data type is not supported " + std::to_string(kind));
         }
+        // The column is now owned by the arrays of the dictionary or was deleted.
+        _columns[i] = nullptr;
     }
+    _columns.clear();
     return dict;
 }
@@ -4,6 +4,7 @@
 using namespace std;
 #include "stdafx.h"
 #include "PythonInterop.h"
+#include <unordered_map>
 #include <unordered_set>
 
 #define CX_TraceOut(...)
@@ -24,9 +25,16 @@ enum MessageKind
 
 // REVIEW: the exceptions thrown in the callbacks will not be caught by BxlServer on Linux.
 // On Linux, CoreCLR will ignore previous stack frames, i.e., those before entering the managed code.
-typedef MANAGED_CALLBACK_PTR(void, MODELSINK) (EnvironmentBlock * env,
+// Receives the model the graph outputs as name when its output path is empty.
+typedef MANAGED_CALLBACK_PTR(void, MODELSINK) (EnvironmentBlock * env, const char * name,
     const unsigned char * binaryModel, size_t modelLen);
 
+// Gives the bytes of the model name sent in memory by python, returns false when name is not
+// such a model and must be read from a file.
+typedef MANAGED_CALLBACK_PTR(bool, MODELSOURCE)(EnvironmentBlock *penv, const char *name,
+    // Outputs:
+    const unsigned char *& binaryModel, CxInt64 & modelLen);
+
 typedef MANAGED_CALLBACK_PTR(void, MESSAGESINK)(EnvironmentBlock *penv, MessageKind kind,
     const char * sender, const char * message);
 
@@ -34,7 +42,34 @@ typedef MANAGED_CALLBACK_PTR(void, DATASINK)(EnvironmentBlock *penv, const DataV
     // Outputs:
     // * setters: item setter function pointers.
     // keyValueSetter: setter for key values.
-    void **& setters, void *& keyValueSetter);
+    // * buffers: preallocated column buffers, one value per row, nullptr when the setter must be used.
+    void **& setters, void *& keyValueSetter, void **& buffers);
+
+// Called by the managed code once numRows rows were set through the data sink, returns false
+// to stop sending the data.
+typedef MANAGED_CALLBACK_PTR(bool, DATABATCHSINK)(EnvironmentBlock *penv, CxInt64 numRows);
+
+// How a call uses the host environment kept alive between calls by the managed code.
+// WARNING: These values are defined by the managed code so should not be changed!
+enum SessionMode
+{
+    SessionNone = 0,
+    SessionUse = 1,
+    SessionClose = 2
+};
+
+// Operation on the managed model cache, no graph is run when it is not CacheNone.
+// WARNING: These values are defined by the managed code so should not be changed!
+enum CacheCommand
+{
+    CacheNone = 0,
+    CacheStats = 1,
+    CachePin = 2,
+    CacheUnpin = 3,
+    CacheClear = 4,
+    CacheSetBudget = 5,
+    CacheLoad = 6
+};
 
 // Callback function for getting cancel flag.
 typedef MANAGED_CALLBACK_PTR(bool, CHECKCANCEL)();
@@ -78,20 +113,49 @@ private:
     // Path to python executable
     const char* pythonPath;
 
+    // How the managed host environment is shared with other calls, see SessionMode.
+    int sessionMode;
+
+    // Operation on the managed model cache, see CacheCommand.
+    int cacheCommand;
+
+    // Memory budget of the model cache in bytes, used by CacheSetBudget.
+    CxInt64 modelCacheBudget;
+
+    // The data batch sink, null when the data is returned at once by GetData.
+    DATABATCHSINK dataBatchSink;
+
+    // Number of rows sent to the data batch sink at a time.
+    CxInt64 dataBatchSize;
+
+    // The model source, null when no model is sent in memory.
+    MODELSOURCE modelSource;
+
+    // Maximum number of threads used by the managed code, 0 for no limit.
+    int numThreads;
+
 public:
-    EnvironmentBlock(int verbosity = 0, int maxSlots = -1, int seed = 42, const char* pythonPath = NULL);
+    EnvironmentBlock(int verbosity = 0, int maxSlots = -1, int seed = 42, const char* pythonPath = NULL,
+        int sessionMode = SessionNone, int cacheCommand = CacheNone, CxInt64 modelCacheBudget = 0,
+        bp::object batchCallback = bp::object(), CxInt64 dataBatchSize = 0,
+        bp::object modelCallback = bp::object(), bp::dict models = bp::dict(), int numThreads = 0);
     ~EnvironmentBlock();
     std::string GetErrorMessage() { return _errMessage; }
     bp::dict GetData();
 
 private:
-    static MANAGED_CALLBACK(void) DataSink(EnvironmentBlock *penv, const DataViewBlock *pdata, void **&setters, void *&keyValueSetter);
+    static MANAGED_CALLBACK(void) DataSink(EnvironmentBlock *penv, const DataViewBlock *pdata, void **&setters, void *&keyValueSetter, void **&buffers);
     static MANAGED_CALLBACK(void) MessageSink(EnvironmentBlock *penv, MessageKind kind, const char *sender, const char *message);
-    static MANAGED_CALLBACK(void) ModelSink(EnvironmentBlock *penv, const unsigned char *pBinaryModel, size_t iModelLen);
+    static MANAGED_CALLBACK(void) ModelSink(EnvironmentBlock *penv, const char *name, const unsigned char *pBinaryModel, size_t iModelLen);
+    static MANAGED_CALLBACK(bool) ModelSource(EnvironmentBlock *penv, const char *name, const unsigned char *&pBinaryModel, CxInt64 &iModelLen);
     static MANAGED_CALLBACK(bool) CheckCancel();
+    static MANAGED_CALLBACK(bool) DataBatchSink(EnvironmentBlock *penv, CxInt64 numRows);
 
 private:
     void DataSinkCore(const DataViewBlock * pdata);
+    void CreateColumns(CxInt64 numRows);
+    bool DataBatchSinkCore(CxInt64 numRows);
+    void ReleaseColumns();
 
 private:
     // This has a bit set for each kind of message that is desired.
@@ -100,16 +164,41 @@ private:
     int _irowBase;
     int _crowWant;
     std::vector<void*> _vset;
+    // Buffers of the columns allocated for the number of rows announced by the managed code.
+    std::vector<void*> _vbuf;
     std::string _errMessage;
 
-    // Column names.
+    // Python function receiving the dictionary of every batch of rows.
+    bp::object _batchCallback;
+
+    // Python function receiving the name and the bytes of every output model.
+    bp::object _modelCallback;
+    // Models sent in memory, the python bytes are kept alive by _modelBytes and read
+    // without the GIL.
+    bp::dict _modelBytes;
+    std::unordered_map<std::string, std::pair<const unsigned char*, CxInt64>> _models;
+
+    // Column names, kinds and value counts.
     std::vector<std::string> _names;
+    std::vector<BYTE> _kinds;
+    std::vector<BYTE> _valueCounts;
     std::vector<PyColumnBase*> _columns;
 
     // Set of all key column indexes.
     std::unordered_set<CxInt64> _columnToKeyMap;
     std::vector<PyColumnSingle<std::string>*> _vKeyValues;
 
+    // Sizes the column for numRows values and returns its buffer. Returns nullptr when the number
+    // of rows is unknown or when the column does not hold a single value per row.
+    template <class T>
+    static void* PreallocateBuffer(PyColumnBase* column, CxInt64 numRows)
+    {
+        PyColumnSingle<T>* colObject = dynamic_cast<PyColumnSingle<T>*>(column);
+        if (colObject == nullptr || numRows <= 0)
+            return nullptr;
+        return colObject->Preallocate(numRows);
+    }
+
     static MANAGED_CALLBACK(void) SetR4(EnvironmentBlock *env, int col, long m, long n, float value)
     {
         PyColumn<float>* colObject = dynamic_cast<PyColumn<float>*>(env->_columns[col]);
@@ -11,6 +11,21 @@ inline void destroyManagerCObject(PyObject* obj) {
     if (b) { delete b; }
 }
 
+// Text columns are returned as numpy arrays of python objects, allocated
+// once for all the rows and filled in place. Items are None until set.
+inline np::ndarray CreateObjectArray(size_t numRows)
+{
+    return np::empty(bp::make_tuple(numRows), np::dtype(bp::str("O")));
+}
+
+inline void SetObjectItem(np::ndarray& array, size_t index, const std::string& value)
+{
+    PyObject** items = reinterpret_cast<PyObject**>(array.get_data());
+    bp::object obj(value);
+    Py_XDECREF(items[index]);
+    items[index] = bp::incref(obj.ptr());
+}
+
 
 PyColumnBase::PyColumnBase(const int& kind)
 {
@@ -184,18 +199,14 @@ void PyColumnSingle<std::string>::AddToDict(bp::dict& dict,
                                             const std::vector<std::string>* keyNames,
                                             const size_t expectedRows)
 {
-    bp::list list;
+    np::ndarray array = CreateObjectArray(_pData->size());
     for (size_t i = 0; i < _pData->size(); i++)
     {
-        bp::object obj;
         const std::string& value = _pData->at(i);
         if (!value.empty())
-        {
-            obj = bp::object(value);
-        }
-        list.append(obj);
+            SetObjectItem(array, i, value);
     }
-    dict[name] = list;
+    dict[name] = array;
 }
 
 template <class T, class T2>
@@ -318,22 +329,16 @@ void PyColumnVariable<std::string, NullableString>::AddColumnToDict(bp::dict& di
                                                                     const std::string& name,
                                                                     size_t index)
 {
-    bp::list list;
     std::vector<NullableString>* pColData = _data[index];
     size_t numRows = pColData->size();
+    np::ndarray array = CreateObjectArray(numRows);
 
     for (size_t i = 0; i < numRows; i++)
     {
-        bp::object obj;
-        NullableString value = pColData->at(i);
-
+        const NullableString& value = pColData->at(i);
         if (value)
-        {
-            obj = bp::object(*value);
-        }
-
-        list.append(obj);
+            SetObjectItem(array, i, *value);
     }
 
-    dict[name] = list;
+    dict[name] = array;
 }
@@ -56,6 +56,8 @@ public:
 
     virtual size_t GetNumRows() = 0;
     virtual size_t GetNumCols() = 0;
+    // Drops the rows after the first numRows ones.
+    virtual void Truncate(size_t numRows) = 0;
 };
 
 
@@ -96,7 +98,9 @@ public:
                            const size_t expectedRows);
     virtual size_t GetNumRows();
     virtual size_t GetNumCols();
+    virtual void Truncate(size_t numRows);
     const std::vector<T>* GetData() const { return _pData; }
+    T* Preallocate(size_t numRows);
 };
 
 template <class T>
@@ -123,12 +127,27 @@ inline void PyColumnSingle<T>::SetAt(size_t nRow, size_t nCol, const T& value)
     _pData->at(nRow) = value;
 }
 
+// Sizes the column for numRows values so the managed code can write them directly.
+template <class T>
+inline T* PyColumnSingle<T>::Preallocate(size_t numRows)
+{
+    _pData->resize(numRows);
+    return _pData->data();
+}
+
 template <class T>
 inline size_t PyColumnSingle<T>::GetNumRows()
 {
     return _pData->size();
 }
 
+template <class T>
+inline void PyColumnSingle<T>::Truncate(size_t numRows)
+{
+    if (_pData->size() > numRows)
+        _pData->resize(numRows);
+}
+
 template <class T>
 inline size_t PyColumnSingle<T>::GetNumCols()
 {
@@ -160,6 +179,7 @@ public:
                            const size_t expectedRows);
     virtual size_t GetNumRows();
     virtual size_t GetNumCols();
+    virtual void Truncate(size_t numRows);
 
     T2 GetMissingValue();
     T2 GetConvertedValue(const T& value);
@@ -205,6 +225,14 @@ inline size_t PyColumnVariable<T, T2>::GetNumCols()
     return _data.size();
 }
 
+template <class T, class T2>
+inline void PyColumnVariable<T, T2>::Truncate(size_t numRows)
+{
+    // The values are appended by SetAt, only the announced number of rows can be larger.
+    if (_numRows > numRows)
+        _numRows = numRows;
+}
+
 template <class T, class T2>
 inline T2 PyColumnVariable<T, T2>::GetMissingValue()
 {
@@ -2,6 +2,7 @@
 // Licensed under the MIT license.
 
 #include "stdafx.h"
+#include <mutex>
 #include <string>
 #include "DataViewInterop.h"
 #include "ManagedInterop.h"
@@ -15,6 +16,14 @@
 #define PARAM_DPREP_PATH "dprepPath"
 #define PARAM_PYTHON_PATH "pythonPath"
 #define PARAM_DATA "data"
+#define PARAM_SESSION "session"
+#define PARAM_CACHE_COMMAND "cache_command"
+#define PARAM_CACHE_BUDGET "cache_budget"
+#define PARAM_BATCH_CALLBACK "batch_callback"
+#define PARAM_BATCH_SIZE "batch_size"
+#define PARAM_MODEL_CALLBACK "model_callback"
+#define PARAM_MODELS "models"
+#define PARAM_NUM_THREADS "num_threads"
 
 
 enum FnId
@@ -45,10 +54,13 @@ typedef UnixMlNetInterface MlNetInterface;
 // Function pointers for the managed code entry points.
 static MlNetInterface *g_mlnetInterface = nullptr;
 static GENERICEXEC g_exec = nullptr;
+// Several python threads may load the managed code at the same time.
+static std::mutex g_execMutex;
 
 // Ensure that we have the DotNetBridge managed code entry point.
 GENERICEXEC EnsureExec(const char *mlnetpath, const char *coreclrpath, const char *dpreppath)
 {
+    std::lock_guard<std::mutex> lock(g_execMutex);
     if (g_mlnetInterface == nullptr)
         g_mlnetInterface = new MlNetInterface();
 
@@ -88,7 +100,11 @@ bp::dict pxCall(bp::dict& params)
         const char *coreclrpath = s_dotnetClrPath.c_str();
         const char *dpreppath = s_dprepPath.c_str();
 
-        GENERICEXEC exec = EnsureExec(mlnetpath, coreclrpath, dpreppath);
+        GENERICEXEC exec;
+        {
+            PyGILRelease nogil;
+            exec = EnsureExec(mlnetpath, coreclrpath, dpreppath);
+        }
         if (exec == nullptr)
             throw std::invalid_argument("Failed to communicate with the managed library. Paths searched: "
                 + s_mlnetPath + " and " + s_dotnetClrPath);
@@ -101,7 +117,43 @@ bp::dict pxCall(bp::dict& params)
         if (params.has_key(PARAM_MAX_SLOTS))
             maxSlots = bp::extract<int>(params[PARAM_MAX_SLOTS]);
 
-        EnvironmentBlock env(i_verbose, maxSlots, seed, s_pythonPath.c_str());
+        int sessionMode = SessionNone;
+        if (params.has_key(PARAM_SESSION))
+            sessionMode = bp::extract<int>(params[PARAM_SESSION]);
+
+        int cacheCommand = CacheNone;
+        if (params.has_key(PARAM_CACHE_COMMAND))
+            cacheCommand = bp::extract<int>(params[PARAM_CACHE_COMMAND]);
+
+        CxInt64 cacheBudget = 0;
+        if (params.has_key(PARAM_CACHE_BUDGET))
+            cacheBudget = bp::extract<CxInt64>(params[PARAM_CACHE_BUDGET]);
+
+        // The output data is sent to the callback every batchSize rows instead of being returned.
+        bp::object batchCallback;
+        CxInt64 batchSize = 0;
+        if (params.has_key(PARAM_BATCH_CALLBACK))
+        {
+            batchCallback = params[PARAM_BATCH_CALLBACK];
+            batchSize = bp::extract<CxInt64>(params[PARAM_BATCH_SIZE]);
+        }
+
+        // The output models are sent to the callback when their output path is empty, the
+        // input models in the dictionary are read from memory instead of files.
+        bp::object modelCallback;
+        if (params.has_key(PARAM_MODEL_CALLBACK))
+            modelCallback = params[PARAM_MODEL_CALLBACK];
+        bp::dict models;
+        if (params.has_key(PARAM_MODELS))
+            models = bp::extract<bp::dict>(params[PARAM_MODELS]);
+
+        // Maximum number of threads the graph uses, 0 for no limit.
+        int numThreads = 0;
+        if (params.has_key(PARAM_NUM_THREADS))
+            numThreads = bp::extract<int>(params[PARAM_NUM_THREADS]);
+
+        EnvironmentBlock env(i_verbose, maxSlots, seed, s_pythonPath.c_str(), sessionMode,
+            cacheCommand, cacheBudget, batchCallback, batchSize, modelCallback, models, numThreads);
         int retCode;
         if (params.has_key(PARAM_DATA) && bp::extract<bp::dict>(params[PARAM_DATA]).check())
         {
@@ -109,12 +161,18 @@ bp::dict pxCall(bp::dict& params)
             DataSourceBlock data(d);
             const DataSourceBlock *datas[1];
             datas[0] = &data;
+            PyGILRelease nogil;
             retCode = exec(&env, s_graph.c_str(), 1, datas);
         }
         else
+        {
+            PyGILRelease nogil;
             retCode = exec(&env, s_graph.c_str(), 0, NULL);
+        }
 
-        res = env.GetData();
+        // In batch mode every row was sent to the callback.
+        if (batchCallback.is_none())
+            res = env.GetData();
 
         if (retCode == -1)
             throw std::runtime_error(env.GetErrorMessage());
@@ -146,6 +204,12 @@ BOOST_PYTHON_MODULE(pybridge)
     //
     np::initialize();
 
+    //
+    // the GIL is released while the managed code runs, make sure
+    // the python threads are initialized (python 2.7 and < 3.7)
+    //
+    PyEval_InitThreads();
+
     bp::register_exception_translator<MlNetExecutionError>(&translate_mlnet_exception);
     def("px_call", pxCall);
 }
\ No newline at end of file
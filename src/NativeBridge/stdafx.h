@@ -112,4 +112,39 @@ private:
 // frequently used namespace aliases
 //
 namespace bp = boost::python;
-namespace np = boost::python::numpy;
\ No newline at end of file
+namespace np = boost::python::numpy;
+
+//
+// The managed code runs without the GIL so other python threads, including
+// other calls to the bridge, are not blocked while a graph executes.
+//
+
+// Acquires the GIL for the lifetime of the object, used by the callbacks
+// from the managed code which touch python objects. They may be called from
+// any managed thread.
+class PyGILLock
+{
+public:
+    PyGILLock() { m_state = PyGILState_Ensure(); }
+    ~PyGILLock() { PyGILState_Release(m_state); }
+
+private:
+    PyGILLock(const PyGILLock&);
+    PyGILLock& operator=(const PyGILLock&);
+
+    PyGILState_STATE m_state;
+};
+
+// Releases the GIL held by the current thread for the lifetime of the object.
+class PyGILRelease
+{
+public:
+    PyGILRelease() { m_state = PyEval_SaveThread(); }
+    ~PyGILRelease() { PyEval_RestoreThread(m_state); }
+
+private:
+    PyGILRelease(const PyGILRelease&);
+    PyGILRelease& operator=(const PyGILRelease&);
+
+    PyThreadState* m_state;
+};
@@ -0,0 +1,74 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# -------------------------------------------------------------------------
+
+# Measures the latency of scoring a few rows with and without a session.
+# These timings depend on the machine, they are kept out of the unit
+# tests.
+# Usage: python latency.py
+
+import time
+
+import numpy as np
+import nimbusml.session
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.tests.test_utils import split_features_and_label
+
+
+def latencies(fct, rows, repeat=3):
+    # The first calls warm the bridge and the model cache up.
+    for row in rows[:repeat]:
+        fct(row)
+    times = []
+    for row in rows:
+        begin = time.perf_counter()
+        fct(row)
+        times.append(time.perf_counter() - begin)
+    return np.array(times)
+
+
+def print_percentiles(name, times):
+    print("{0}, {1} calls, p50: {2:.2f}ms, p99: {3:.2f}ms".format(
+        name, len(times), np.percentile(times, 50) * 1000,
+        np.percentile(times, 99) * 1000))
+
+
+def get_fitted_pipeline():
+    df = get_dataset("iris").as_df()
+    df.drop(['Species'], inplace=True, axis=1)
+    df.Label = [1 if x == 1 else 0 for x in df.Label]
+    X, y = split_features_and_label(df, 'Label')
+    pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+    pipeline.fit(X, y)
+    return pipeline, X
+
+
+def benchmark_session(n=100):
+    # Pipeline.predict on five rows without and with a session.
+    pipeline, X = get_fitted_pipeline()
+    rows = [X.iloc[:5]] * n
+    print_percentiles("no session", latencies(pipeline.predict, rows))
+    nimbusml.session.open()
+    try:
+        print_percentiles("session", latencies(pipeline.predict, rows))
+    finally:
+        nimbusml.session.close()
+
+
+def benchmark_single_row(n=1000):
+    # Pipeline.predict against the handle of compile_predictor.
+    pipeline, X = get_fitted_pipeline()
+    rows = [X.iloc[i % len(X):i % len(X) + 1] for i in range(n)]
+
+    print_percentiles("predict", latencies(pipeline.predict, rows))
+    with pipeline.compile_predictor() as predictor:
+        print_percentiles("compile_predictor",
+                          latencies(predictor.predict, rows))
+
+
+if __name__ == '__main__':
+    benchmark_session()
+    benchmark_single_row()
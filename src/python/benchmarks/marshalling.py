@@ -0,0 +1,69 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# -------------------------------------------------------------------------
+
+# Measures the conversion of DataFrames into the dictionaries sent to the
+# bridge by resolve_dataframe. These timings depend on the machine, they
+# are kept out of the unit tests.
+# Usage: python marshalling.py
+
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    # python 2
+    tracemalloc = None
+
+import numpy as np
+import pandas as pd
+from nimbusml.internal.utils.dataframes import resolve_dataframe
+
+
+def timeit(fct, *args):
+    begin = time.perf_counter()
+    fct(*args)
+    return time.perf_counter() - begin
+
+
+def traced_peak(fct, *args):
+    tracemalloc.start()
+    try:
+        fct(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_category(sizes=(10 ** 6, 10 ** 7)):
+    # Categorical codes sent as one int32 array against a python list.
+    for n in sizes:
+        serie = pd.Series(pd.Categorical.from_codes(
+            np.random.randint(0, 100, n), [str(i) for i in range(100)]))
+        df = pd.DataFrame(dict(cat=serie))
+        as_list = timeit(
+            lambda: [x + 1 for x in serie.cat.codes.values.tolist()])
+        as_array = timeit(resolve_dataframe, df)
+        print("category, {0} rows, list: {1:.3f}s, array: {2:.3f}s".format(
+            n, as_list, as_array))
+
+
+def benchmark_bool(n=100000, d=50):
+    # Boolean object columns sent as int8 arrays against float64 copies.
+    df = pd.DataFrame({'flag%d' % i: pd.Series(
+        np.random.rand(n) < 0.5, dtype=object) for i in range(d)})
+
+    def as_float64(frame):
+        return [frame[c].values.astype(np.float64) for c in frame]
+
+    as_float = traced_peak(as_float64, df)
+    as_int8 = traced_peak(resolve_dataframe, df)
+    print("bool, {0}x{1} flags, float64: {2} bytes, int8: {3} bytes".format(
+        n, d, as_float, as_int8))
+
+
+if __name__ == '__main__':
+    benchmark_category()
+    if tracemalloc is not None:
+        benchmark_bool()
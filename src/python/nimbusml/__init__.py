@@ -17,13 +17,7 @@ import sys
 import warnings
 warnings.filterwarnings("ignore", message="numpy.dtype size changed")
 
-from .internal.utils.data_roles import Role
-from .internal.utils.data_schema import DataSchema
-from .internal.utils.data_stream import BinaryDataStream
-from .internal.utils.data_stream import DprepDataStream
-from .internal.utils.data_stream import FileDataStream
-from .internal.utils.utils import run_tests
-from .pipeline import Pipeline
+from .internal.utils.lazy import lazy_import
 
 if sys.platform.lower() == "linux":
     pkg_path = os.path.dirname(os.path.realpath(__file__))
@@ -40,5 +34,25 @@ __all__ = [
     'DataSchema',
     'FileDataStream',
     'BinaryDataStream',
-    'Role'
+    'ChunkedDataStream',
+    'Role',
+    'warmup',
+    'set_num_threads',
+    'get_num_threads'
 ]
+
+# The pipeline, sklearn, scipy and the entrypoints are imported the first
+# time one of these attributes is used.
+__getattr__, __dir__ = lazy_import(__name__, {
+    'Role': '.internal.utils.data_roles',
+    'DataSchema': '.internal.utils.data_schema',
+    'BinaryDataStream': '.internal.utils.data_stream',
+    'ChunkedDataStream': '.internal.utils.data_stream',
+    'DprepDataStream': '.internal.utils.data_stream',
+    'FileDataStream': '.internal.utils.data_stream',
+    'run_tests': '.internal.utils.utils',
+    'Pipeline': '.pipeline',
+    'warmup': '.session',
+    'set_num_threads': '.session',
+    'get_num_threads': '.session'
+})
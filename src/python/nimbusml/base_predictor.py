@@ -8,7 +8,6 @@ Base class for all the predictors.
 
 __all__ = ["BasePredictor"]
 
-import os
 from collections import OrderedDict
 
 from sklearn.base import BaseEstimator
@@ -17,6 +16,7 @@ from . import Pipeline
 from .internal.core.base_pipeline_item import BasePipelineItem
 from .internal.utils.data_roles import Role
 from .internal.utils.data_schema import DataSchema
+from .internal.utils.models import model_exists
 from .internal.utils.schema_helper import _extract_label_column
 from .internal.utils.utils import trace, compare_shape, set_shape
 
@@ -73,9 +73,7 @@ class BasePredictor(BaseEstimator, BasePipelineItem):
         """
         Tells if the predictor was trained.
         """
-        return (hasattr(self, 'model_') and
-                self.model_ and
-                os.path.isfile(self.model_))
+        return hasattr(self, 'model_') and model_exists(self.model_)
 
     @trace
     def _invoke_inference_method(self, method, X, **params):
@@ -167,9 +165,7 @@ class BasePredictor(BaseEstimator, BasePipelineItem):
         if hasattr(self, 'model_summary_') and self.model_summary_ is not None:
             return self.model_summary_
 
-        if not hasattr(
-                self, 'model_') or self.model_ is None or not \
-                os.path.isfile(self.model_):
+        if not hasattr(self, 'model_') or not model_exists(self.model_):
             raise ValueError(
                 "Model is not fitted. Train or load a model before "
                 "summary().")
@@ -8,12 +8,11 @@ Base class for all the transforms.
 
 __all__ = ["BaseTransform"]
 
-import os
-
 from sklearn.base import BaseEstimator
 
 from . import Pipeline
 from .internal.core.base_pipeline_item import BasePipelineItem
+from .internal.utils.models import model_exists
 from .internal.utils.utils import trace, compare_shape, set_shape
 
 
@@ -90,9 +89,7 @@ class BaseTransform(BaseEstimator, BasePipelineItem):
         """
         Tells if the transform was trained.
         """
-        return (hasattr(self, 'model_') and
-                self.model_ and
-                os.path.isfile(self.model_))
+        return hasattr(self, 'model_') and model_exists(self.model_)
 
     @trace
     def transform(self, X, as_binary_data_stream=False, **params):
@@ -1,5 +1,9 @@
-from .kmeansplusplus import KMeansPlusPlus
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'KMeansPlusPlus'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'KMeansPlusPlus': '.kmeansplusplus'
+})
@@ -1,10 +1,4 @@
-from .datasets import get_dataset, available_datasets, \
-    DataSetIris, DataSetInfert, Topics, Timeseries, \
-    DataSetAirQuality, WikiDetox_Train, WikiDetox_Test, \
-    Generated_Twitter_Train, Generated_Twitter_Test, \
-    Generated_Ticket_Train, Generated_Ticket_Test, \
-    Uci_Train, Uci_Test, MSLTR_Train, MSLTR_Test, \
-    FS_Train, FS_Test
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'get_dataset',
@@ -17,3 +11,25 @@ __all__ = [
     'Uci_Train', 'Uci_Test', 'MSLTR_Train', 'MSLTR_Test',
     'FS_Train', 'FS_Test'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'get_dataset': '.datasets',
+    'available_datasets': '.datasets',
+    'DataSetIris': '.datasets',
+    'DataSetInfert': '.datasets',
+    'Topics': '.datasets',
+    'Timeseries': '.datasets',
+    'DataSetAirQuality': '.datasets',
+    'WikiDetox_Train': '.datasets',
+    'WikiDetox_Test': '.datasets',
+    'Generated_Twitter_Train': '.datasets',
+    'Generated_Twitter_Test': '.datasets',
+    'Generated_Ticket_Train': '.datasets',
+    'Generated_Ticket_Test': '.datasets',
+    'Uci_Train': '.datasets',
+    'Uci_Test': '.datasets',
+    'MSLTR_Train': '.datasets',
+    'MSLTR_Test': '.datasets',
+    'FS_Train': '.datasets',
+    'FS_Test': '.datasets'
+})
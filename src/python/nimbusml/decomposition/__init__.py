@@ -1,10 +1,14 @@
-from .factorizationmachinebinaryclassifier import \
-    FactorizationMachineBinaryClassifier
-from .pcaanomalydetector import PcaAnomalyDetector
-from .pcatransformer import PcaTransformer
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'FactorizationMachineBinaryClassifier',
     'PcaAnomalyDetector',
     'PcaTransformer'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'FactorizationMachineBinaryClassifier':
+        '.factorizationmachinebinaryclassifier',
+    'PcaAnomalyDetector': '.pcaanomalydetector',
+    'PcaTransformer': '.pcatransformer'
+})
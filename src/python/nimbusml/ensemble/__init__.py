@@ -1,17 +1,4 @@
-from .ensembleclassifier import EnsembleClassifier
-from .ensembleregressor import EnsembleRegressor
-from .fastforestbinaryclassifier import FastForestBinaryClassifier
-from .fastforestregressor import FastForestRegressor
-from .fasttreesbinaryclassifier import FastTreesBinaryClassifier
-from .fasttreesregressor import FastTreesRegressor
-from .fasttreestweedieregressor import FastTreesTweedieRegressor
-from .gambinaryclassifier import GamBinaryClassifier
-from .gamregressor import GamRegressor
-from .lightgbmbinaryclassifier import LightGbmBinaryClassifier
-from .lightgbmclassifier import LightGbmClassifier
-from .lightgbmranker import LightGbmRanker
-from .lightgbmregressor import LightGbmRegressor
-from .votingensemble import VotingRegressor
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'EnsembleClassifier',
@@ -29,3 +16,20 @@ __all__ = [
     'LightGbmRegressor',
     'VotingRegressor'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'EnsembleClassifier': '.ensembleclassifier',
+    'EnsembleRegressor': '.ensembleregressor',
+    'FastForestBinaryClassifier': '.fastforestbinaryclassifier',
+    'FastForestRegressor': '.fastforestregressor',
+    'FastTreesBinaryClassifier': '.fasttreesbinaryclassifier',
+    'FastTreesRegressor': '.fasttreesregressor',
+    'FastTreesTweedieRegressor': '.fasttreestweedieregressor',
+    'GamBinaryClassifier': '.gambinaryclassifier',
+    'GamRegressor': '.gamregressor',
+    'LightGbmBinaryClassifier': '.lightgbmbinaryclassifier',
+    'LightGbmClassifier': '.lightgbmclassifier',
+    'LightGbmRanker': '.lightgbmranker',
+    'LightGbmRegressor': '.lightgbmregressor',
+    'VotingRegressor': '.votingensemble'
+})
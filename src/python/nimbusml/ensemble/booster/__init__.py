@@ -1,9 +1,13 @@
-from .dart import Dart
-from .gbdt import Gbdt
-from .goss import Goss
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'Dart',
     'Gbdt',
     'Goss'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'Dart': '.dart',
+    'Gbdt': '.gbdt',
+    'Goss': '.goss'
+})
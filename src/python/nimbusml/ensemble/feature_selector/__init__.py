@@ -1,7 +1,11 @@
-from .allfeatureselector import AllFeatureSelector
-from .randomfeatureselector import RandomFeatureSelector
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'AllFeatureSelector',
     'RandomFeatureSelector'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'AllFeatureSelector': '.allfeatureselector',
+    'RandomFeatureSelector': '.randomfeatureselector'
+})
@@ -1,11 +1,4 @@
-from .classifieraverage import ClassifierAverage
-from .classifiermedian import ClassifierMedian
-from .classifierstacking import ClassifierStacking
-from .classifiervoting import ClassifierVoting
-from .classifierweightedaverage import ClassifierWeightedAverage
-from .regressoraverage import RegressorAverage
-from .regressormedian import RegressorMedian
-from .regressorstacking import RegressorStacking
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'ClassifierAverage',
@@ -17,3 +10,14 @@ __all__ = [
     'RegressorMedian',
     'RegressorStacking'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'ClassifierAverage': '.classifieraverage',
+    'ClassifierMedian': '.classifiermedian',
+    'ClassifierStacking': '.classifierstacking',
+    'ClassifierVoting': '.classifiervoting',
+    'ClassifierWeightedAverage': '.classifierweightedaverage',
+    'RegressorAverage': '.regressoraverage',
+    'RegressorMedian': '.regressormedian',
+    'RegressorStacking': '.regressorstacking'
+})
@@ -1,9 +1,4 @@
-from .classifierallselector import ClassifierAllSelector
-from .classifierbestdiverseselector import ClassifierBestDiverseSelector
-from .classifierbestperformanceselector import ClassifierBestPerformanceSelector
-from .regressorallselector import RegressorAllSelector
-from .regressorbestdiverseselector import RegressorBestDiverseSelector
-from .regressorbestperformanceselector import RegressorBestPerformanceSelector
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'ClassifierAllSelector',
@@ -12,4 +7,13 @@ __all__ = [
     'RegressorAllSelector',
     'RegressorBestDiverseSelector',
     'RegressorBestPerformanceSelector'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'ClassifierAllSelector': '.classifierallselector',
+    'ClassifierBestDiverseSelector': '.classifierbestdiverseselector',
+    'ClassifierBestPerformanceSelector': '.classifierbestperformanceselector',
+    'RegressorAllSelector': '.regressorallselector',
+    'RegressorBestDiverseSelector': '.regressorbestdiverseselector',
+    'RegressorBestPerformanceSelector': '.regressorbestperformanceselector'
+})
@@ -1,7 +1,11 @@
-from .classifierdisagreement import ClassifierDisagreement
-from .regressordisagreement import RegressorDisagreement
+from ....internal.utils.lazy import lazy_import
 
 __all__ = [
     'ClassifierDisagreement',
     'RegressorDisagreement'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'ClassifierDisagreement': '.classifierdisagreement',
+    'RegressorDisagreement': '.regressordisagreement'
+})
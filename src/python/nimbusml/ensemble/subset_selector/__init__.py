@@ -1,9 +1,13 @@
-from .allinstanceselector import AllInstanceSelector
-from .bootstrapselector import BootstrapSelector
-from .randompartitionselector import RandomPartitionSelector
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'AllInstanceSelector',
     'BootstrapSelector',
     'RandomPartitionSelector'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'AllInstanceSelector': '.allinstanceselector',
+    'BootstrapSelector': '.bootstrapselector',
+    'RandomPartitionSelector': '.randompartitionselector'
+})
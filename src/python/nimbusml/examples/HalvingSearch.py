@@ -0,0 +1,34 @@
+###############################################################################
+# HalvingSearch - successive halving search of the parameters of a pipeline
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.ensemble import FastTreesBinaryClassifier
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.model_selection import HalvingSearch
+
+df = get_dataset('infert').as_df()
+X = df.drop(['case', 'row_num', 'stratum'], axis=1)
+y = df['case']
+
+pipeline = Pipeline([
+    ('cat', OneHotVectorizer() << 'education_str'),
+    ('learner', FastTreesBinaryClassifier(feature=['age', 'parity',
+                                                   'induced', 'spontaneous',
+                                                   'education_str']))])
+
+param_grid = dict(learner__number_of_trees=[5, 10, 20, 50],
+                  learner__number_of_leaves=[2, 5, 10],
+                  learner__learning_rate=[0.05, 0.2])
+
+# 24 candidates, evaluated on 3 folds of growing samples of the rows,
+# the best third of them is kept after every step
+search = HalvingSearch(pipeline, param_grid, factor=3, cv=3, n_jobs=4,
+                       random_state=0)
+search.fit(X, y)
+
+print(search.n_resources_)
+print(search.best_params_, search.best_score_)
+print(search.cv_results_.groupby('step').size())
+
+# the best candidate trained on all the rows
+print(search.best_pipeline_.predict(X).head())
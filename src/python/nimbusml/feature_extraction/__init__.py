@@ -1,5 +1,9 @@
-from .treefeaturizer import TreeFeaturizer
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'TreeFeaturizer'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'TreeFeaturizer': '.treefeaturizer'
+})
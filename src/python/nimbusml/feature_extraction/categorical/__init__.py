@@ -1,7 +1,11 @@
-from .onehothashvectorizer import OneHotHashVectorizer
-from .onehotvectorizer import OneHotVectorizer
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'OneHotHashVectorizer',
     'OneHotVectorizer'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'OneHotHashVectorizer': '.onehothashvectorizer',
+    'OneHotVectorizer': '.onehotvectorizer'
+})
@@ -1,9 +1,13 @@
-from .loader import Loader
-from .pixelextractor import PixelExtractor
-from .resizer import Resizer
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'Loader',
     'PixelExtractor',
     'Resizer'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'Loader': '.loader',
+    'PixelExtractor': '.pixelextractor',
+    'Resizer': '.resizer'
+})
@@ -1,8 +1,4 @@
-from .lightlda import LightLda
-from .ngramextractor import NGramExtractor
-from .ngramfeaturizer import NGramFeaturizer
-from .sentiment import Sentiment
-from .wordembedding import WordEmbedding
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'LightLda',
@@ -11,3 +7,11 @@ __all__ = [
     'Sentiment',
     'WordEmbedding'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'LightLda': '.lightlda',
+    'NGramExtractor': '.ngramextractor',
+    'NGramFeaturizer': '.ngramfeaturizer',
+    'Sentiment': '.sentiment',
+    'WordEmbedding': '.wordembedding'
+})
@@ -1,7 +1,11 @@
-from .ngram import Ngram
-from .ngramhash import NgramHash
+from ....internal.utils.lazy import lazy_import
 
 __all__ = [
     'Ngram',
     'NgramHash'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'Ngram': '.ngram',
+    'NgramHash': '.ngramhash'
+})
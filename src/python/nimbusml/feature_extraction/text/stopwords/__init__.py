@@ -1,7 +1,11 @@
-from .customstopwordsremover import CustomStopWordsRemover
-from .predefinedstopwordsremover import PredefinedStopWordsRemover
+from ....internal.utils.lazy import lazy_import
 
 __all__ = [
     'CustomStopWordsRemover',
     'PredefinedStopWordsRemover'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'CustomStopWordsRemover': '.customstopwordsremover',
+    'PredefinedStopWordsRemover': '.predefinedstopwordsremover'
+})
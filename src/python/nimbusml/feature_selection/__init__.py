@@ -1,7 +1,11 @@
-from .countselector import CountSelector
-from .mutualinformationselector import MutualInformationSelector
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'CountSelector',
     'MutualInformationSelector'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'CountSelector': '.countselector',
+    'MutualInformationSelector': '.mutualinformationselector'
+})
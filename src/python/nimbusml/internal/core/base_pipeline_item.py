@@ -9,13 +9,10 @@ pipeline.
 
 __all__ = ["BasePipelineItem"]
 
-import os
-import tempfile
 import warnings
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from itertools import chain
-from shutil import copyfile
 from textwrap import wrap
 
 import six
@@ -24,6 +21,8 @@ from nimbusml.utils import signature
 from ..utils.data_roles import DataRoles, Role
 from ..utils.data_stream import ViewBasePipelineItem, DataStream, \
     ViewDataStream
+from ..utils.models import ModelBytes, model_exists, read_model_bytes, \
+    save_model_to_file, write_vector_input_dtype
 from ..utils.utils import trace
 
 
@@ -378,10 +377,8 @@ class BasePipelineItem():
         odict = self.__dict__.copy()
         odict['export_version'] = 1
 
-        if hasattr(self, 'model_') and \
-                self.model_ is not None and os.path.isfile(self.model_):
-            with open(self.model_, "rb") as mfile:
-                odict['modelbytes'] = mfile.read()
+        if hasattr(self, 'model_') and model_exists(self.model_):
+            odict['modelbytes'] = read_model_bytes(self.model_)
             del odict['model_']
         if hasattr(self, 'type'):
             odict['type'] = self.type
@@ -396,11 +393,7 @@ class BasePipelineItem():
         # Note: modelbytes and type were
         # added before export_version 1
         if 'modelbytes' in state:
-            (fd, modelfile) = tempfile.mkstemp()
-            fl = os.fdopen(fd, "wb")
-            fl.write(state['modelbytes'])
-            fl.close()
-            self.model_ = modelfile
+            self.model_ = ModelBytes(state['modelbytes'])
         if 'type' in state:
             self.type = state['type']
         else:
@@ -458,8 +451,11 @@ class BasePipelineItem():
 
         """
         if self.model_ is not None:
-            if os.path.isfile(self.model_):
-                copyfile(self.model_, dst)
+            save_model_to_file(self.model_, dst)
+            # See Pipeline.save_model.
+            dtype = getattr(self, '_vector_input_dtype', None)
+            if dtype is not None:
+                write_vector_input_dtype(dst, dtype.name)
 
     def __getitem__(self, cols):
         """
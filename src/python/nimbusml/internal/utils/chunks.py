@@ -0,0 +1,68 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Streaming of the output of a graph chunk by chunk.
+"""
+
+import threading
+
+from six.moves.queue import Queue, Empty
+
+
+def iterate_chunks(run, chunksize):
+    """
+    Calls ``run(chunk_callback=..., chunksize=chunksize)`` in a
+    background thread and yields the DataFrames the bridge sends to the
+    callback every *chunksize* rows. The bridge waits until the previous
+    chunk is consumed so only one chunk is kept in memory at a time.
+    Closing the generator stops the bridge from sending the remaining
+    chunks.
+
+    :param run: function running the graph, such as
+        :meth:`Pipeline.transform <nimbusml.Pipeline.transform>`.
+    :param chunksize: number of rows of every chunk.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive.")
+
+    chunks = Queue(maxsize=1)
+    stopped = threading.Event()
+    done = object()
+    errors = []
+
+    def chunk_callback(chunk):
+        if stopped.is_set():
+            return False
+        chunks.put(chunk)
+        return not stopped.is_set()
+
+    def run_graph():
+        try:
+            run(chunk_callback=chunk_callback, chunksize=chunksize)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            chunks.put(done)
+
+    thread = threading.Thread(target=run_graph)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                break
+            yield chunk
+        if errors:
+            raise errors[0]
+    finally:
+        # Unblocks the bridge if the generator was closed early.
+        stopped.set()
+        while thread.is_alive():
+            try:
+                chunks.get(timeout=0.1)
+            except Empty:
+                pass
+        thread.join()
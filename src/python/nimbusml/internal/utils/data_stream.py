@@ -5,10 +5,14 @@
 """
 Owns nimbusml's containers.
 """
+import copy
 import os
 import tempfile
 from shutil import copyfile
 
+from pandas import DataFrame
+from scipy.sparse import csr_matrix
+
 from .data_roles import DataRoles
 from .data_schema import DataSchema
 from .utils import trace
@@ -190,6 +194,12 @@ class FileDataStream(DataStream):
         `Schema </nimbusml/concepts/schema#dataschema-class>`_
         and :py:func:`DataSchema <nimbusml.DataSchema>`.
 
+        With ``cache='auto'``, the first pipeline reading the stream
+        converts the file into a binary file kept in the directory set
+        by :py:func:`nimbusml.session.set_file_cache`, the next ones read
+        the binary file instead of parsing the text again. The file is
+        converted again once it is modified or its schema changes.
+
     .. seealso::
         :py:func:`DataSchema <nimbusml.DataSchema>`.
 
@@ -223,13 +233,19 @@ class FileDataStream(DataStream):
 
     """
 
-    def __init__(self, filename, schema, roles=None):
+    def __init__(self, filename, schema, roles=None, cache=None):
         """
         :param filename: filename of a datasets
         :param schema: filename schema
+        :param cache: ``'auto'`` to read a binary copy of the file kept
+            in the file cache, None to parse the file every time
         """
         super(FileDataStream, self).__init__(schema, roles)
+        if cache not in (None, 'auto'):
+            raise ValueError(
+                "cache must be None or 'auto', not {0}.".format(cache))
         self._filename = filename
+        self._cache = cache
 
     def __repr__(self):
         return "FileDataStream('{2}',\n    '{0}',\n    {1})".format(
@@ -246,7 +262,8 @@ class FileDataStream(DataStream):
         return FileDataStream(
             self._filename,
             self._schema.clone(),
-            self._roles.clone())
+            self._roles.clone(),
+            self._cache)
 
     def __getitem__(self, columns):
         """
@@ -262,9 +279,49 @@ class FileDataStream(DataStream):
     def filename(self):
         return self._filename
 
+    @property
+    def cache(self):
+        return self._cache
+
+    def head(self, n=5, skip=0, columns=None, collect=True):
+        """
+        Returns the first rows, see :meth:`DataStream.head`. They are
+        read from the text file, the file cache is not used.
+        """
+        stream = self
+        if self._cache is not None:
+            stream = self.clone()
+            stream._cache = None
+        return DataStream.head(stream, n=n, skip=skip, columns=columns,
+                               collect=collect)
+
+    def _get_cached_stream(self, verbose=0):
+        """
+        Returns the stream the graphs read, a
+        :py:class:`BinaryDataStream <nimbusml.BinaryDataStream>` on the
+        binary copy of the file if *cache* is ``'auto'``.
+        """
+        if self._cache is None:
+            return self
+        from .file_cache import get_cached_stream
+        return get_cached_stream(self, verbose=verbose)
+
+    def invalidate_cache(self):
+        """
+        Removes the binary copy of the file from the file cache, the next
+        pipeline reading the stream converts the file again.
+
+        :return: False if the file was not in the cache.
+        """
+        from .file_cache import get_file_cache
+        cache = get_file_cache()
+        key = cache.get_key(self)
+        return key is not None and cache.remove(key)
+
     @staticmethod
     @trace
-    def read_csv(filepath_or_buffer, tool=None, nrows=100, **kwargs):
+    def read_csv(filepath_or_buffer, tool=None, nrows=100, cache=None,
+                 **kwargs):
         """
         Creates a *FileDataStream* from a filename or a buffer. For more
         details of the schema format for
@@ -296,6 +353,9 @@ class FileDataStream(DataStream):
         :param dtype: overwrite the data column types, users can specify a
             dictionary with column name as the key, such as
             {'column1':numpy.float32}
+        :param cache: ``'auto'`` to read a binary copy of the file after
+            the first pipeline, see
+            :py:class:`FileDataStream <nimbusml.FileDataStream>`
         :param kwargs: additional parameters sent to *read_csv*
             or the internal parser.
         :return: a FileDataStream instance
@@ -305,12 +365,13 @@ class FileDataStream(DataStream):
 
         if tool == 'pandas':
             return FileDataStream.read_csv_pandas(
-                filepath_or_buffer, nrows=nrows, **kwargs)
+                filepath_or_buffer, nrows=nrows, cache=cache, **kwargs)
         elif tool == 'internal':
             if 'schema' not in kwargs:
                 raise ValueError(
                     "Parameter schema is not defined. Use tool='pandas'.")
-            return FileDataStream(filepath_or_buffer, kwargs['schema'])
+            return FileDataStream(filepath_or_buffer, kwargs['schema'],
+                                  cache=cache)
         else:
             raise ValueError("Unknown tool '{0}'.".format(tool))
 
@@ -321,6 +382,7 @@ class FileDataStream(DataStream):
             nrows=100,
             collapse=False,
             numeric_dtype=None,
+            cache=None,
             **kwargs):
         """
         Creates a *FileDataStream* from a filename or a buffer.
@@ -331,6 +393,8 @@ class FileDataStream(DataStream):
         :param numeric_dtype: changes all numeric types into the same one
         :param collapse: collapse into one vector column all columns sharing
             the same type
+        :param cache: ``'auto'`` to read a binary copy of the file after
+            the first pipeline
         :return: a FileDataStream instance
 
         The method leverages
@@ -340,7 +404,7 @@ class FileDataStream(DataStream):
         """
         schema = DataSchema.read_schema(filepath_or_buffer, collapse=collapse,
                                         numeric_dtype=numeric_dtype, **kwargs)
-        return FileDataStream(filepath_or_buffer, schema)
+        return FileDataStream(filepath_or_buffer, schema, cache=cache)
 
 
 class ViewDataStream:
@@ -509,4 +573,124 @@ class DprepDataStream(BinaryDataStream):
             raise NotImplementedError(
                 "Method clone was not overwritten for class '{0}'".format(
                     type(self)))
-        return DprepDataStream(self._filename)
\ No newline at end of file
+        return DprepDataStream(self._filename)
+
+
+class ChunkedDataStream(DataStream):
+    """
+    Data view over an iterable of DataFrames or csr_matrix which all
+    share the same columns, such as the chunks read from a database
+    cursor. The bridge pulls the chunks one by one while the graph runs,
+    only one chunk is in memory at a time so the size of the data is not
+    bounded by the memory.
+
+    Learners going several times over the data need *spill=True*:
+    the chunks are then written to a temporary binary file the graph
+    reads as many times as it needs. An iterator can be read once, a
+    list or any other iterable is iterated every time the data stream is
+    used. Only re-iterable containers are supported besides iterators:
+    the first chunk is read from a separate call to ``iter(chunks)`` to
+    get the schema, every call must start again from the first chunk.
+
+    :param chunks: iterable of DataFrames or csr_matrix.
+    :param schema: :py:class:`DataSchema <nimbusml.DataSchema>` of the
+        chunks, it is read from the first chunk if not specified.
+    :param roles: roles definition
+    :param spill: writes the chunks to a temporary binary file the graph
+        can read several times.
+
+    .. remarks::
+        Category columns are sent with the categories of the first chunk,
+        values missing from these categories are read as missing values.
+
+    Example:
+        .. code-block:: python
+
+            import pandas as pd
+            from nimbusml import ChunkedDataStream, Pipeline
+            from nimbusml.linear_model import FastLinearRegressor
+
+            chunks = pd.read_csv('data.csv', chunksize=100000)
+            ds = ChunkedDataStream(chunks)
+            pipeline = Pipeline([FastLinearRegressor()])
+            pipeline.fit(ds, 'y')
+    """
+
+    def __init__(self, chunks, schema=None, roles=None, spill=True):
+        if isinstance(chunks, (DataFrame, csr_matrix)):
+            raise TypeError(
+                "chunks must be an iterable of DataFrames or csr_matrix, "
+                "not a {0}.".format(type(chunks)))
+        if iter(chunks) is chunks:
+            # An iterator, the first chunk is kept until it is read.
+            first = next(chunks, None)
+            self._chunks = None
+            self._iterator = [first, chunks]
+        else:
+            first = next(iter(chunks), None)
+            self._chunks = chunks
+            self._iterator = None
+        if first is None:
+            raise ValueError("chunks must contain at least one chunk.")
+        if not isinstance(first, (DataFrame, csr_matrix)):
+            raise TypeError(
+                "chunks must be DataFrames or csr_matrix, not {0}.".format(
+                    type(first)))
+        if schema is None:
+            schema = DataSchema.read_schema(first)
+        super(ChunkedDataStream, self).__init__(schema, roles)
+        self._categories = {}
+        if isinstance(first, DataFrame):
+            for name, dtype in first.dtypes.items():
+                if dtype.name == 'category':
+                    self._categories[name] = dtype.categories
+        self._spill = spill
+
+    def __repr__(self):
+        return "ChunkedDataStream('{0}',\n    {1})".format(
+            self._schema, self._roles)
+
+    def clone(self):
+        """
+        Copy/clone the object, the clone reads the same chunks.
+        """
+        clone = copy.copy(self)
+        clone._schema = self._schema.clone()
+        clone._roles = self._roles.clone()
+        return clone
+
+    def _iter_chunks(self):
+        """
+        Returns an iterator on the chunks.
+        """
+        if self._chunks is not None:
+            return iter(self._chunks)
+        if not self._iterator:
+            raise RuntimeError(
+                "The chunks were already read, an iterator can only be "
+                "read once, use a list or another iterable instead.")
+        first, rest = self._iterator
+        del self._iterator[:]
+        return _chain_first(first, rest)
+
+    def _align_categories(self, chunk):
+        """
+        Gives the category columns the categories of the first chunk
+        so that every chunk has the same key types.
+        """
+        if not self._categories or not isinstance(chunk, DataFrame):
+            return chunk
+        changes = {}
+        for name, categories in self._categories.items():
+            serie = chunk[name]
+            if serie.dtype.name != 'category' or \
+                    not serie.cat.categories.equals(categories):
+                changes[name] = serie.astype('category').cat.set_categories(
+                    categories)
+        return chunk.assign(**changes) if changes else chunk
+
+
+def _chain_first(first, rest):
+    yield first
+    for chunk in rest:
+        yield chunk
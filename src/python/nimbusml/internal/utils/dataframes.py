@@ -11,131 +11,228 @@ from pandas.api.types import infer_dtype
 from scipy.sparse import csr_matrix
 
 
-def resolve_dataframe(dataframe):
+def resolve_dataframe(dataframe, y=None, columns=None):
+    """
+    Converts a DataFrame into the dictionary of columns sent to the
+    bridge. The columns of *y*, a DataFrame with the same number of rows,
+    follow the columns of *dataframe*, rows are matched by position.
+    Numeric columns are views on the arrays of the DataFrame, only the
+    columns which need a conversion are copied. If *columns* is not
+    None, the columns of *dataframe* not in *columns* are not sent.
+    """
     if isinstance(dataframe, DataFrame):
         ret = OrderedDict()
         ret['..mlVarInfo'] = {}
-        rx_var_info = getattr(dataframe, "var_info", None)
         types = []
 
-        for i in dataframe.columns:
-            if six.PY2 and isinstance(i, unicode):
-                i = i.encode('utf-8')
-            if rx_var_info is not None and i in rx_var_info.keys():
-                ret['..mlVarInfo'][i] = rx_var_info[i]
-            # Does not work with multiindex (confusion with tuple and list)
-            name_i = i if isinstance(i, str) else '.'.join(str(_) for _ in i)
-            serie = dataframe.loc[:, (i,)].iloc[:, 0]
-            if str(serie.dtype) == 'category':
-                # Workaround, empty dataframe needs to be sent as an array to
-                # convey type information
-                if len(serie) == 0:
-                    # Default numpy array will be float, categorical variable
-                    # needs to be int
-                    ret[name_i] = np.array(
-                        [x + 1 for x in serie.cat.codes.values.tolist()]) \
-                        .reshape((len(serie), 1)).astype(np.int)
+        for frame in [dataframe] if y is None else [dataframe, y]:
+            rx_var_info = getattr(frame, "var_info", None)
+            for j, i in enumerate(frame.columns):
+                if six.PY2 and isinstance(i, unicode):
+                    i = i.encode('utf-8')
+                # Multi-level column names are joined with a dot.
+                name_i = i if isinstance(i, str) else '.'.join(str(_) for _ in i)
+                if columns is not None and frame is dataframe and \
+                        name_i not in columns:
+                    continue
+                if rx_var_info is not None and i in rx_var_info.keys():
+                    ret['..mlVarInfo'][i] = rx_var_info[i]
+                if name_i in ret:
+                    raise RuntimeError(
+                        "Column '{0}' appears twice, X and y cannot contain "
+                        "the same column name.".format(name_i))
+                # Positional access returns a view on the column, selecting
+                # by name would copy it.
+                serie = frame.iloc[:, j]
+                if str(serie.dtype) == 'category':
+                    # Codes are shifted by one, 0 is the missing value of
+                    # the key type (pandas uses -1).
+                    ret[name_i] = np.add(serie.cat.codes.values, 1,
+                                         dtype=np.int32)
+                    ret['..mlVarInfo'][i] = [
+                        str(cast) for cast in serie.cat.categories.tolist()]
+                    types.extend(['c'])
+
                 else:
-                    ret[name_i] = [
-                        x + 1 for x in serie.cat.codes.values.tolist()]
-                ret['..mlVarInfo'][i] = [
-                    str(cast) for cast in serie.cat.categories.tolist()]
-                types.extend(['c'])
+                    if len(serie) == 0:
+                        # Workaround, empty dataframe needs to be sent as an array
+                        # to convey type information
+                        ret[name_i] = serie.values.reshape((len(serie), 1))
 
-            else:
-                if len(serie) == 0:
-                    # Workaround, empty dataframe needs to be sent as an array
-                    # to convey type information
-                    ret[name_i] = serie.values.reshape((len(serie), 1))
-
-                elif serie.dtype == np.dtype('datetime64[ns]'):
-                    values = serie.values.astype(np.int64, copy=False)
-                    values = values // 1000000 # convert from nanoseconds to milliseconds
-                    ret[str(i)] = values
-                    types.append(_global_dtype_to_char_dict[np.dtype('datetime64[ns]')])
-
-                elif serie.dtype == np.object or str(serie.dtype) == '<U1':
-                    # This column might still be numeric, so we do another
-                    # check.
-                    infered_dtype = infer_dtype(serie, skipna=True)
-                    if not infered_dtype == 'string' and \
-                            not infered_dtype == 'unicode':
-                        ret[name_i] = serie.values
-                        if infered_dtype == 'floating' or \
-                                infered_dtype == 'mixed-integer-float':
-                            s = serie.itemsize
-                            if s == 8:
-                                ret[str(i)] = serie.values.astype(
-                                    np.float64, copy=False)
+                    elif str(serie.dtype) == 'boolean':
+                        ret[name_i] = resolve_bool_column(serie)
+                        types.extend(
+                            [_global_dtype_to_char_dict[np.dtype(np.bool)]])
+
+                    elif serie.dtype == np.dtype('datetime64[ns]'):
+                        values = serie.values.astype(np.int64, copy=False)
+                        values = values // 1000000 # convert from nanoseconds to milliseconds
+                        ret[name_i] = values
+                        types.append(_global_dtype_to_char_dict[np.dtype('datetime64[ns]')])
+
+                    elif serie.dtype == np.object or str(serie.dtype) == '<U1':
+                        # This column might still be numeric, so we do another
+                        # check.
+                        infered_dtype = infer_dtype(serie, skipna=True)
+                        if not infered_dtype == 'string' and \
+                                not infered_dtype == 'unicode':
+                            ret[name_i] = serie.values
+                            if infered_dtype == 'floating' or \
+                                    infered_dtype == 'mixed-integer-float':
+                                s = serie.itemsize
+                                if s == 8:
+                                    ret[name_i] = serie.values.astype(
+                                        np.float64, copy=False)
+                                    types.extend(
+                                        [_global_dtype_to_char_dict[
+                                             np.dtype(np.float64)]])
+                                else:
+                                    ret[name_i] = serie.values.astype(
+                                        np.float32, copy=False)
+                                    types.extend(
+                                        [_global_dtype_to_char_dict[
+                                             np.dtype(np.float32)]])
+                            elif infered_dtype == 'integer':
+                                s = serie.itemsize
+                                if s == 8:
+                                    ret[name_i] = serie.values.astype(
+                                        np.int64, copy=False)
+                                    types.extend(
+                                        [_global_dtype_to_char_dict[
+                                             np.dtype(np.int64)]])
+                                elif s == 4:
+                                    ret[name_i] = serie.values.astype(
+                                        np.int32, copy=False)
+                                    types.extend(
+                                        [_global_dtype_to_char_dict[
+                                             np.dtype(np.int32)]])
+                                elif s == 2:
+                                    ret[name_i] = serie.values.astype(
+                                        np.int16, copy=False)
+                                    types.extend(
+                                        [_global_dtype_to_char_dict[
+                                             np.dtype(np.int16)]])
+                                else:
+                                    ret[name_i] = serie.values.astype(
+                                        np.int8, copy=False)
+                                    types.extend(
+                                        [_global_dtype_to_char_dict[
+                                             np.dtype(np.int8)]])
+                            elif infered_dtype == 'boolean':
+                                ret[name_i] = resolve_bool_column(serie)
                                 types.extend(
                                     [_global_dtype_to_char_dict[
-                                         np.dtype(np.float64)]])
+                                         np.dtype(np.bool)]])
+                            elif infered_dtype.startswith('mixed'):
+                                raise TypeError(
+                                    "argument must be a string or a number")
                             else:
-                                ret[str(i)] = serie.values.astype(
-                                    np.float32, copy=False)
-                                types.extend(
-                                    [_global_dtype_to_char_dict[
-                                         np.dtype(np.float32)]])
-                        elif infered_dtype == 'integer':
-                            s = serie.itemsize
-                            if s == 8:
-                                ret[str(i)] = serie.values.astype(
-                                    np.int64, copy=False)
-                                types.extend(
-                                    [_global_dtype_to_char_dict[
-                                         np.dtype(np.int64)]])
-                            elif s == 4:
-                                ret[str(i)] = serie.values.astype(
-                                    np.int32, copy=False)
-                                types.extend(
-                                    [_global_dtype_to_char_dict[
-                                         np.dtype(np.int32)]])
-                            elif s == 2:
-                                ret[str(i)] = serie.values.astype(
-                                    np.int16, copy=False)
+                                raise TypeError(
+                                    "Type %s not supported" % infered_dtype)
+                        else:
+                            if six.PY2:
+                                ret[name_i] = serie.values.tolist()
+                            else:
+                                ret[name_i] = resolve_text_column(serie)
+                            if infered_dtype == 'string':
                                 types.extend(
                                     [_global_dtype_to_char_dict[
-                                         np.dtype(np.int16)]])
+                                         np.dtype(np.string_)]])
                             else:
-                                ret[str(i)] = serie.values.astype(
-                                    np.int8, copy=False)
                                 types.extend(
                                     [_global_dtype_to_char_dict[
-                                         np.dtype(np.int8)]])
-                        elif infered_dtype == 'boolean':
-                            ret[str(i)] = serie.values.astype(
-                                np.float64, copy=False)
-                            types.extend(
-                                [_global_dtype_to_char_dict['bool64']])
-                        elif infered_dtype.startswith('mixed'):
-                            raise TypeError(
-                                "argument must be a string or a number")
-                        else:
-                            raise TypeError(
-                                "Type %s not supported" % infered_dtype)
+                                         np.dtype(np.unicode)]])
                     else:
-                        ret[name_i] = serie.values.tolist()
-                        if infered_dtype == 'string':
-                            types.extend(
-                                [_global_dtype_to_char_dict[
-                                     np.dtype(np.string_)]])
+                        ret[name_i] = serie.values
+                        if serie.dtype in _global_dtype_to_char_dict:
+                            ch = _global_dtype_to_char_dict[serie.dtype]
                         else:
-                            types.extend(
-                                [_global_dtype_to_char_dict[
-                                     np.dtype(np.unicode)]])
-                else:
-                    ret[name_i] = serie.values
-                    if serie.dtype in _global_dtype_to_char_dict:
-                        ch = _global_dtype_to_char_dict[serie.dtype]
-                    else:
-                        ch = _global_dtype_to_char_dict['unsupported']
-                    types.extend([ch])
+                            ch = _global_dtype_to_char_dict['unsupported']
+                        types.extend([ch])
 
         ret['..mlColTypes'] = types
         return ret
     return None
 
 
+def _encode_utf8(text, lengths):
+    """
+    Encodes the fixed width unicode array *text*, whose values have
+    *lengths* characters, into UTF-8 with numpy operations on the code
+    points. Returns the bytes of all the values and the number of bytes
+    of every value.
+    """
+    codes = text.view(np.uint32).reshape((len(text), -1))
+    used = np.arange(codes.shape[1]) < lengths[:, None]
+    if not codes.any() or codes.max() < 0x80:
+        # ASCII, one byte per character
+        return codes[used].astype(np.uint8), lengths
+    size = 1 + (codes >= 0x80).astype(np.int64) + (codes >= 0x800) + \
+        (codes >= 0x10000)
+    row_bytes = np.where(used, size, 0).sum(axis=1)
+    codes, size = codes[used], size[used]
+    starts = np.cumsum(size) - size
+    data = np.empty(row_bytes.sum(), dtype=np.uint8)
+    lead = np.array([0, 0, 0xC0, 0xE0, 0xF0], dtype=np.uint32)[size]
+    data[starts] = lead | (codes >> (6 * (size - 1)).astype(np.uint32))
+    for k in range(1, 4):
+        more = size > k
+        shift = (6 * (size[more] - 1 - k)).astype(np.uint32)
+        data[starts[more] + k] = 0x80 | ((codes[more] >> shift) & 0x3F)
+    return data, row_bytes
+
+
+def resolve_text_column(serie):
+    """
+    Encodes a text column as one contiguous buffer of UTF-8 bytes
+    (``..Data``), the offsets of every value in this buffer
+    (``..Offsets``, one more than the number of rows) and a bitmap of
+    the missing values (``..Missing``, see ``numpy.packbits``). The
+    bridge reads the values from these buffers without going through
+    the python objects.
+
+    The values are copied once into a fixed width numpy unicode array
+    and encoded by :func:`_encode_utf8` without creating any python
+    object per value. Reading the python strings still costs one visit
+    per value. Columns whose longest value is much longer than the
+    average one, or with values ending with a null character which
+    numpy drops, are encoded value by value with ``str.encode``.
+    """
+    missing = serie.isnull().values
+    filled = serie.where(~missing, '')
+    lengths = filled.str.len().values.astype(np.int64)
+    offsets = np.zeros(len(serie) + 1, dtype=np.int64)
+    if len(serie) > 0 and \
+            lengths.max() * len(serie) <= 4 * lengths.sum() + 4096:
+        text = filled.values.astype(np.str_)
+        if np.array_equal(np.char.str_len(text), lengths):
+            data, row_bytes = _encode_utf8(text, lengths)
+            np.cumsum(row_bytes, out=offsets[1:])
+            return {'..Data': data, '..Offsets': offsets,
+                    '..Missing': np.packbits(missing)}
+
+    encoded = filled.str.encode('utf-8')
+    np.cumsum(encoded.str.len().values, out=offsets[1:])
+    data = np.frombuffer(b''.join(encoded.values.tolist()), dtype=np.uint8)
+    return {'..Data': data, '..Offsets': offsets,
+            '..Missing': np.packbits(missing)}
+
+
+def resolve_bool_column(serie):
+    """
+    Converts a column of booleans stored as objects, or with the
+    nullable pandas dtype ``boolean``, into an int8 array, 1 for True,
+    0 for False and -1 for a missing value. The bridge reads it like a
+    numpy bool column.
+    """
+    missing = serie.isnull().values
+    if missing.any():
+        serie = serie.where(~missing, False)
+    values = np.asarray(serie.values, dtype=np.bool_).view(np.int8)
+    values[missing] = -1
+    return values
+
+
 def resolve_csr_matrix(matrix, y=None):
     ret = OrderedDict()
     ret['..mlVarInfo'] = {}
@@ -166,6 +263,37 @@ def resolve_csr_matrix(matrix, y=None):
     return ret
 
 
+def resolve_dense_matrix(matrix, y=None):
+    """
+    Sends a C-contiguous two dimensional array of floats to the bridge
+    as one vector column ``Data`` of fixed size, the bridge reads its
+    rows from the array instead of handling one column per feature.
+    The columns of *y* come first as in :func:`resolve_csr_matrix`.
+    """
+    ret = OrderedDict()
+    ret['..mlVarInfo'] = {}
+    if y is not None:
+        ret = resolve_dataframe(y)
+
+    if isinstance(matrix, np.ndarray):
+        if y is not None:
+            types = ret['..mlColTypes']
+        else:
+            types = []
+        if matrix.ndim != 2 or not matrix.flags['C_CONTIGUOUS'] or \
+                matrix.dtype not in (np.float32, np.float64):
+            raise TypeError(
+                "matrix must be a C-contiguous two dimensional array "
+                "of float32 or float64 not {0}".format(matrix.dtype))
+
+        ret['dense'] = OrderedDict()
+        ret['dense']['values'] = matrix
+        ret['dense']['colCount'] = matrix.shape[1]
+        types.extend([_global_dtype_to_char_dict[matrix.dtype]])
+        ret['..mlColTypes'] = types
+    return ret
+
+
 def pd_concat(els, axis=0, join='inner'):
     """
     Concatenates several arrays.
@@ -236,7 +364,6 @@ def resolve_output_as_csrmatrix(ret):
 # ML_PY_TYPE_MAP_ENUM defined in DataViewInterop.h.
 _global_dtype_to_char_dict = {
     np.dtype(np.bool): '?',
-    'bool64': '!',
     np.dtype(np.ubyte): 'B',
     np.dtype(np.uint16): 'H',
     np.dtype(np.uint32): 'I',
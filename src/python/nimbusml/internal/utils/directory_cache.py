@@ -0,0 +1,121 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Directory of files the bridge reads, shared by the caches of the
+featurized data and of the text files.
+"""
+
+import os
+import threading
+import uuid
+
+
+class DirectoryCache(object):
+    """
+    Directory of entries, an entry is made of the files named after its
+    key with the extensions in *_extensions*. The least recently used
+    entries are removed once the files take more than *max_bytes*. An
+    entry bigger than *max_bytes* stays until the next one is stored.
+
+    :param directory: directory of the files, created if it does not
+        exist.
+    :param max_bytes: size of the files in the directory.
+    """
+    _extensions = ()
+
+    def __init__(self, directory, max_bytes):
+        if max_bytes <= 0:
+            raise ValueError(
+                "max_bytes must be a positive integer, not {0}.".format(
+                    max_bytes))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def remove(self, key):
+        """
+        Removes the entry *key*, returns False if there is none.
+        """
+        with self._lock:
+            removed = False
+            for path in self._paths(key):
+                if os.path.isfile(path):
+                    os.remove(path)
+                    removed = True
+            return removed
+
+    def clear(self):
+        """
+        Removes all the entries and resets the counters.
+        """
+        with self._lock:
+            self._evict(0)
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Returns the number of entries, their size in bytes and the
+        number of hits and misses of :meth:`get`.
+        """
+        with self._lock:
+            entries = self._entries()
+            return dict(directory=self.directory, max_bytes=self.max_bytes,
+                        entries=len(entries),
+                        bytes=sum(e[1] for e in entries),
+                        hits=self.hits, misses=self.misses)
+
+    def _new_name(self):
+        # Files are written under a temporary name and renamed once
+        # complete, temporary files are not entries.
+        return os.path.join(self.directory, 'tmp' + uuid.uuid4().hex)
+
+    def _store(self, key, sources):
+        # Renames the files of sources to the entry key after making room
+        # for them, returns the paths of the entry.
+        with self._lock:
+            size = sum(os.path.getsize(p) for p in sources
+                       if os.path.isfile(p))
+            self._evict(self.max_bytes - size)
+            targets = self._paths(key)
+            for source, target in zip(sources, targets):
+                if os.path.isfile(source):
+                    if os.path.isfile(target):
+                        os.remove(target)
+                    os.rename(source, target)
+            return targets
+
+    def _paths(self, key):
+        return [os.path.join(self.directory, key + e)
+                for e in self._extensions]
+
+    def _entries(self):
+        # (key, size, last use) of every entry.
+        entries = {}
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext not in self._extensions or key.startswith('tmp'):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            size, used = entries.get(key, (0, 0))
+            entries[key] = (size + stat.st_size, max(used, stat.st_mtime))
+        return [(k, v[0], v[1]) for k, v in entries.items()]
+
+    def _evict(self, max_bytes):
+        # Removes the least recently used entries until they take at
+        # most max_bytes.
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(e[1] for e in entries)
+        for key, size, _ in entries:
+            if total <= max_bytes:
+                break
+            for path in self._paths(key):
+                if os.path.isfile(path):
+                    os.remove(path)
+            total -= size
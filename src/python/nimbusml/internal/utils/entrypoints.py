@@ -13,6 +13,7 @@ import tempfile
 from collections import OrderedDict
 from enum import Enum
 
+import numpy as np
 import pandas as pd
 import six
 from pandas import DataFrame
@@ -21,13 +22,17 @@ from nimbusml.utils import signature
 
 from .data_stream import DprepDataStream
 from .data_stream import BinaryDataStream
+from .data_stream import ChunkedDataStream
 from .data_stream import FileDataStream
 from .dataframes import resolve_dataframe, resolve_csr_matrix, pd_concat, \
-    resolve_output_as_dataframe, resolve_output_as_csrmatrix, \
+    resolve_dense_matrix, resolve_output_as_dataframe, resolve_output_as_csrmatrix, \
     resolve_output_as_list
-from .utils import try_set, set_clr_environment_vars, get_clr_path, \
-    get_mlnet_path, get_dprep_path
+from .models import ModelBytes, get_model_inputs
+from .utils import try_set, get_bridge_paths
 from ..libs.pybridge import px_call
+from ...session import get_session_mode, _get_num_threads, \
+    _check_num_threads
+from ...tracing import span
 
 
 class BridgeRuntimeError(RuntimeError):
@@ -208,6 +213,15 @@ class Graph(EntryPoint):
         self.nodes = nodes
         self._write_csv_time = 0
         self._data_output_format = data_output_format
+        # Path of the profile written by the bridge, see run(profile=True).
+        self._profile_filename = None
+        self.last_profile = None
+        # Number of folds trained at once, see CV.fit(n_jobs=k).
+        self._parallel_folds = None
+        # Columns of a DataFrame read by the graph, the others are not
+        # sent to the bridge, None for all of them, see
+        # Pipeline._select_input_columns.
+        self._input_columns = None
 
     def __iter__(self):
         return iter(self.nodes)
@@ -258,6 +272,10 @@ class Graph(EntryPoint):
         res = [node.to_dict() for node in self.nodes]
         if self.inputs is not None or self.outputs is not None:
             res = dict(nodes=res, inputs=self.inputs, outputs=self.outputs)
+            if self._profile_filename is not None:
+                res['profile'] = self._profile_filename
+            if self._parallel_folds is not None:
+                res['parallel_folds'] = self._parallel_folds
         return res
 
     @property
@@ -276,10 +294,10 @@ class Graph(EntryPoint):
             call_parameters,
             verbose,
             concatenated,
-            output_modelfilename,
-            output_predictor_modelfilename=None):
+            out_models):
         try:
-            ret = px_call(call_parameters)
+            with span('px_call'):
+                ret = px_call(call_parameters)
         except RuntimeError as e:
             if verbose:
                 vars = '?'
@@ -302,10 +320,10 @@ class Graph(EntryPoint):
                         "{0}.\n--GRAPH--\n{1}\n--DATA--\n{2}"
                         "\n--\nconcatenated={3}".format(
                             str(e), str(self), vars, concatenated),
-                        model=output_modelfilename)
+                        model=out_models.get('output_model'))
                 else:
                     raise BridgeRuntimeError(
-                        str(e), model=output_modelfilename)
+                        str(e), model=out_models.get('output_model'))
             else:
                 raise e
         return ret
@@ -324,11 +342,19 @@ class Graph(EntryPoint):
         return pieces[0].replace("sep=", "").strip()
 
     def run(self, X, y=None, max_slots=-1, random_state=None, verbose=1, **params):
+        # For a cross validation, n_jobs is the number of folds trained
+        # at once, the bridge splits the threads between them. Without
+        # n_jobs the macro of ML.NET runs the folds.
+        self._parallel_folds = None
+        if params.get('is_cv') and params.get('n_jobs', None) is not None:
+            self._parallel_folds = _check_num_threads(params['n_jobs']) or 0
+
         if params.get("dry_run", False):
             return str(self)
 
-        output_modelfilename = None
-        output_predictor_modelfilename = None
+        output_model = None
+        output_predictor_model = None
+        out_models = {}
         output_metricsfilename = None
         out_metrics = None
 
@@ -346,6 +372,12 @@ class Graph(EntryPoint):
         # checks whether this is a model summary call
         summary = params.get('is_summary')
 
+        spill_filename = None
+        self.last_profile = None
+        # The bridge runs the nodes one by one and measures every one of
+        # them. The profile is written to a file like the metrics.
+        if params.get('profile', False):
+            self._profile_filename = _get_temp_file(suffix='.profile.txt')
         try:
             concatenated = False
             call_parameters = {}
@@ -361,23 +393,43 @@ class Graph(EntryPoint):
                             "Unexpected type {0} for a column name.".format(
                                 type(c)))
 
-                if y is not None and isinstance(y, DataFrame):
-                    data = pd_concat([X, y], axis=1, join='inner')
-                else:
-                    # copy is mandatory here otherwise the order
-                    # of the results might not be the same depending
-                    # on the fact the dataframe is a view or not.
-                    data = X.copy()
-                # Removes Multi-Level index
-                data.columns = [
-                    remove_multi_level_index(c) for c in data.columns]
-                call_parameters["data"] = resolve_dataframe(data)
+                data_y = y if isinstance(y, DataFrame) else None
+                if data_y is not None and len(data_y) != len(X):
+                    # Rows can only be matched on the index.
+                    X, data_y = pd_concat([X, data_y], axis=1,
+                                          join='inner'), None
+                # Checks the column names, Multi-Level index are
+                # joined by resolve_dataframe.
+                for c in X.columns:
+                    remove_multi_level_index(c)
+                if data_y is not None:
+                    for c in data_y.columns:
+                        remove_multi_level_index(c)
+                # X and y are not copied nor concatenated, the bridge
+                # reads their columns by position.
+                with span('resolve_dataframe') as s:
+                    call_parameters["data"] = resolve_dataframe(
+                        X, data_y, columns=None if self._input_columns is None
+                        else set(self._input_columns))
+                    s.add_bytes(call_parameters["data"])
                 if y is not None:
                     concatenated = True
             elif isinstance(X, csr_matrix):
-                call_parameters["data"] = resolve_csr_matrix(X, y)
+                with span('resolve_csr_matrix') as s:
+                    call_parameters["data"] = resolve_csr_matrix(X, y)
+                    s.add_bytes(call_parameters["data"])
                 if y is not None:
                     concatenated = True
+            elif isinstance(X, np.ndarray):
+                # A single vector column, see Pipeline._get_vector_input.
+                with span('resolve_dense_matrix') as s:
+                    call_parameters["data"] = resolve_dense_matrix(X, y)
+                    s.add_bytes(call_parameters["data"])
+                if y is not None:
+                    concatenated = True
+            elif isinstance(X, ChunkedDataStream):
+                call_parameters["data"], spill_filename = \
+                    self._resolve_chunks(X)
             elif isinstance(X, FileDataStream):
                 self.inputs['file'] = X.filename
             elif isinstance(X, BinaryDataStream) or isinstance(X, DprepDataStream):
@@ -395,15 +447,10 @@ class Graph(EntryPoint):
                 params.pop('is_cv')
                 params.pop('output_types')
             else:
-                # set graph output model to temp file
-                if 'output_model' in self.outputs:
-                    output_modelfilename = _get_temp_file(suffix='.model.bin')
-                    self.outputs['output_model'] = output_modelfilename
-
-                # set graph output model to temp file
-                if 'output_predictor_model' in self.outputs:
-                    output_predictor_modelfilename = _get_temp_file(suffix='.predictor.model.bin')
-                    self.outputs['output_predictor_model'] = output_predictor_modelfilename
+                # graph output models are sent back in memory
+                for output_name in ['output_model', 'output_predictor_model']:
+                    if output_name in self.outputs:
+                        self.outputs[output_name] = ''
 
                 # set graph output metrics to temp file
                 if 'output_metrics' in self.outputs:
@@ -429,14 +476,16 @@ class Graph(EntryPoint):
                     f.write(self.nimbusml_runnable_graph)
 
             call_parameters['verbose'] = try_set(verbose, False, six.integer_types)
-            call_parameters['graph'] = try_set(str(self), False, str)
+            with span('serialize_graph') as s:
+                call_parameters['graph'] = try_set(str(self), False, str)
+                s.add_bytes(len(call_parameters['graph']))
             
             # Set paths to .NET Core CLR, ML.NET and DataPrep libs
-            set_clr_environment_vars()
-            call_parameters['dotnetClrPath'] = try_set(get_clr_path(), False, str)
-            call_parameters['mlnetPath'] = try_set(get_mlnet_path(), False, str)
-            call_parameters['dprepPath'] = try_set(get_dprep_path(), False, str)
-            call_parameters['pythonPath'] = try_set(sys.executable, False, str)
+            for name, path in get_bridge_paths().items():
+                call_parameters[name] = try_set(path, False, str)
+
+            # Reuse the ML.NET host environment if a session is open
+            call_parameters['session'] = get_session_mode()
 
             if random_state:
                 call_parameters['seed'] = try_set(random_state, False, six.integer_types)
@@ -444,30 +493,71 @@ class Graph(EntryPoint):
             if max_slots:
                 call_parameters['max_slots'] = try_set(max_slots, False, six.integer_types)
 
+            # Limits the threads of the trainers and of the data readers,
+            # see nimbusml.set_num_threads.
+            if self._parallel_folds is not None:
+                num_threads = _get_num_threads()
+            else:
+                num_threads = _get_num_threads(params.get('n_jobs', None))
+            if num_threads:
+                call_parameters['num_threads'] = num_threads
+
+            # The output data is sent to chunk_callback every chunksize
+            # rows while the graph runs instead of being returned.
+            chunk_callback = params.get('chunk_callback', None)
+            if chunk_callback is not None:
+                def batch_callback(ret):
+                    return chunk_callback(resolve_output_as_dataframe(ret))
+
+                call_parameters['batch_callback'] = batch_callback
+                call_parameters['batch_size'] = try_set(
+                    params['chunksize'], False, six.integer_types)
+
+            # Models are passed to and from the bridge as bytes,
+            # they are written to a file only by save_model.
+            models = get_model_inputs(self.inputs)
+            if models:
+                call_parameters['models'] = models
+
+            def model_callback(name, data):
+                out_models[name] = ModelBytes(data)
+
+            call_parameters['model_callback'] = model_callback
+
             ret = self._try_call_bridge(
                 px_call,
                 call_parameters,
                 verbose,
                 concatenated,
-                output_modelfilename,
-                output_predictor_modelfilename)
+                out_models)
+            output_model = out_models.get('output_model')
+            output_predictor_model = out_models.get('output_predictor_model')
 
             out_data = None
 
-            if not cv and self._data_output_format == DataOutputFormat.CSR:
-                out_data = resolve_output_as_csrmatrix(ret)
-            elif not cv and self._data_output_format == DataOutputFormat.LIST:
-                out_data = resolve_output_as_list(ret)
-            else:
-                out_data = resolve_output_as_dataframe(ret)
-                # remove label column from data
-                if out_data is not None and concatenated:
-                    out_columns = list(out_data.columns)
-                    if hasattr(y, 'columns'):
-                        y_column = y.columns[0]
-                        if y_column in out_columns:
-                            out_columns.remove(y_column)
-                            out_data = out_data[out_columns]
+            with span('resolve_output') as s:
+                if not cv and \
+                        self._data_output_format == DataOutputFormat.CSR:
+                    out_data = resolve_output_as_csrmatrix(ret)
+                elif not cv and \
+                        self._data_output_format == DataOutputFormat.LIST:
+                    out_data = resolve_output_as_list(ret)
+                else:
+                    out_data = resolve_output_as_dataframe(ret)
+                    # remove label column from data
+                    if out_data is not None and concatenated:
+                        out_columns = list(out_data.columns)
+                        if hasattr(y, 'columns'):
+                            y_column = y.columns[0]
+                            if y_column in out_columns:
+                                out_columns.remove(y_column)
+                                out_data = out_data[out_columns]
+                s.add_bytes(out_data)
+
+            if self._profile_filename:
+                self.last_profile = pd.read_csv(
+                    self._profile_filename, sep='\t', header=0,
+                    dtype=dict(Name=str))
 
             if output_metricsfilename:
                 out_metrics = pd.read_csv(
@@ -483,15 +573,45 @@ class Graph(EntryPoint):
                 return self._process_graph_run_results(out_data)
             elif self._data_output_format == DataOutputFormat.IDV:
                 output = BinaryDataStream(output_idvfilename)
-                return (output_modelfilename, output, out_metrics, output_predictor_modelfilename)
+                return (output_model, output, out_metrics, output_predictor_model)
             else:
-                return (output_modelfilename, out_data, out_metrics, output_predictor_modelfilename)
+                return (output_model, out_data, out_metrics, output_predictor_model)
         finally:
             if cv:
                 self._remove_temp_files()
             else:
                 if output_metricsfilename:
                     os.remove(output_metricsfilename)
+            if self._profile_filename:
+                if os.path.exists(self._profile_filename):
+                    os.remove(self._profile_filename)
+                self._profile_filename = None
+            if spill_filename:
+                schema_filename = os.path.splitext(spill_filename)[0] + \
+                    '.schema'
+                for filename in [spill_filename, schema_filename]:
+                    if os.path.exists(filename):
+                        os.remove(filename)
+
+    @staticmethod
+    def _resolve_chunks(X):
+        """
+        Converts the first chunk of a ChunkedDataStream, the bridge pulls
+        the following ones from an iterator while the graph runs.
+        """
+        def resolve(chunk):
+            if isinstance(chunk, csr_matrix):
+                return resolve_csr_matrix(chunk)
+            return resolve_dataframe(X._align_categories(chunk))
+
+        chunks = X._iter_chunks()
+        data = resolve(next(chunks))
+        data['..mlChunks'] = (resolve(chunk) for chunk in chunks)
+        spill_filename = None
+        if X._spill:
+            spill_filename = _get_temp_file(suffix='.idv')
+            data['..mlSpill'] = spill_filename
+        return data, spill_filename
 
     def _set_file_outputs(self, output_types):
         self.output_types = output_types
@@ -0,0 +1,178 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Cache of the data featurized by the transforms of a pipeline.
+
+An entry is the output of the transforms preceding the learner, stored
+as a binary IDV file, and the model of these transforms. It is found
+with a hash of the parameters of the transforms and of a fingerprint of
+the training data, so a sweep over the parameters of the learner only
+runs the transforms once per training set.
+"""
+
+import hashlib
+import json
+import numbers
+import os
+import tempfile
+
+import numpy as np
+import six
+from pandas import DataFrame, Series
+from pandas.util import hash_pandas_object
+from scipy.sparse import csr_matrix
+
+from .data_stream import BinaryDataStream, FileDataStream
+from .directory_cache import DirectoryCache
+
+_cache = None
+
+
+class FeaturizationCache(DirectoryCache):
+    """
+    Directory of featurized data, see :class:`DirectoryCache`.
+
+    :param directory: directory of the files, a new temporary directory
+        if None.
+    :param max_bytes: size of the files in the directory.
+    """
+    # Files of an entry, the schema is written by the bridge next to the
+    # data.
+    _extensions = ('.idv', '.schema', '.zip')
+
+    def __init__(self, directory=None, max_bytes=2 ** 30):
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='nimbusml_featurization_')
+        super(FeaturizationCache, self).__init__(directory, max_bytes)
+
+    def get_key(self, steps, nodes, data):
+        """
+        Returns the key of the entry of *data* featurized by *steps*, the
+        transforms of a pipeline, and *nodes*, the nodes of the graph they
+        are converted to, None if *data* cannot be fingerprinted.
+
+        :param data: list of the training data, the label and the weights.
+        """
+        from ... import __version__
+        fingerprints = [fingerprint(d) for d in data]
+        if any(f is None for f in fingerprints):
+            return None
+        description = dict(
+            version=__version__,
+            steps=[[type(s).__module__, type(s).__name__,
+                    s.get_params(deep=False)] for s in steps],
+            nodes=[n.to_dict() for n in nodes],
+            data=fingerprints)
+        description = json.dumps(description, sort_keys=True,
+                                 default=_describe)
+        return hashlib.sha256(description.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the paths of the data and of the model of the entry *key*,
+        None if there is none.
+        """
+        with self._lock:
+            data, _, model = self._paths(key)
+            if not (os.path.isfile(data) and os.path.isfile(model)):
+                self.misses += 1
+                return None
+            # The modification time of the data orders the entries for
+            # the eviction, the model keeps its own for the model cache of
+            # the bridge.
+            os.utime(data, None)
+            self.hits += 1
+            return data, model
+
+    def new_paths(self):
+        """
+        Returns the paths the bridge writes an entry to before it is
+        given to :meth:`put`.
+        """
+        name = self._new_name()
+        return name + self._extensions[0], name + self._extensions[2]
+
+    def put(self, key, data, model):
+        """
+        Stores the files written at the paths returned by
+        :meth:`new_paths` as the entry *key* and returns the paths of the
+        data and of the model of the entry.
+        """
+        sources = [os.path.splitext(data)[0] + e for e in self._extensions]
+        sources[2] = model
+        targets = self._store(key, sources)
+        return targets[0], targets[2]
+
+
+def fingerprint(data):
+    """
+    Returns a string identifying the content of *data*, None if it is
+    not supported. Files are identified by their path, size and last
+    modification time.
+    """
+    if data is None or isinstance(data, (six.string_types, numbers.Number)):
+        return repr(data)
+    if isinstance(data, Series):
+        data = data.to_frame()
+    if isinstance(data, DataFrame):
+        h = hashlib.sha256(hash_pandas_object(data, index=False).values)
+        h.update(repr([list(map(str, data.columns)),
+                       list(map(str, data.dtypes))]).encode('utf-8'))
+        return h.hexdigest()
+    if isinstance(data, np.ndarray):
+        return _hash_arrays(data)
+    if isinstance(data, csr_matrix):
+        return _hash_arrays(data.data, data.indices, data.indptr,
+                            np.array(data.shape))
+    if isinstance(data, (FileDataStream, BinaryDataStream)):
+        filename = data._filename
+        if not filename or not os.path.isfile(filename):
+            return None
+        stat = os.stat(filename)
+        return repr([os.path.abspath(filename), stat.st_size,
+                     stat.st_mtime, str(data.schema)])
+    return None
+
+
+def _describe(obj):
+    # Components given as parameters are described by their own
+    # parameters, the default representation of an object changes with
+    # its address.
+    if hasattr(obj, 'get_params'):
+        return [type(obj).__name__, obj.get_params()]
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return repr(obj)
+
+
+def _hash_arrays(*arrays):
+    h = hashlib.sha256()
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(repr((a.dtype.str, a.shape)).encode('utf-8'))
+        if a.dtype == np.object_:
+            h.update(hash_pandas_object(Series(a.ravel()),
+                                        index=False).values)
+        else:
+            h.update(a.view(np.uint8))
+    return h.hexdigest()
+
+
+def get_featurization_cache():
+    """
+    Returns the cache set by
+    :func:`nimbusml.session.enable_featurization_cache`, None if there is
+    none.
+    """
+    return _cache
+
+
+def set_featurization_cache(cache):
+    """
+    Sets the cache returned by :func:`get_featurization_cache`, None
+    disables it.
+    """
+    global _cache
+    _cache = cache
@@ -0,0 +1,141 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Cache of the text files read by a
+:py:class:`FileDataStream <nimbusml.FileDataStream>` created with
+``cache='auto'``.
+
+The first graph run on such a stream converts the file into a binary
+IDV file, the next runs read the binary file instead of parsing the
+text again. An entry is found with the path, the size and the last
+modification time of the file and the schema of the stream, a file
+modified since its conversion is converted again. The directory is
+kept between processes.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from .data_stream import BinaryDataStream
+from .directory_cache import DirectoryCache
+from .featurization_cache import fingerprint
+
+_cache = None
+
+
+class FileCache(DirectoryCache):
+    """
+    Directory of the binary copies of text files, see
+    :class:`DirectoryCache`.
+
+    :param directory: directory of the files, ``nimbusml_file_cache`` in
+        the temporary directory if None.
+    :param max_bytes: size of the files in the directory.
+    """
+    # Files of an entry, the schema is written by the bridge next to the
+    # data.
+    _extensions = ('.idv', '.schema')
+
+    def __init__(self, directory=None, max_bytes=2 ** 35):
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(),
+                                     'nimbusml_file_cache')
+        super(FileCache, self).__init__(directory, max_bytes)
+
+    def get_key(self, stream):
+        """
+        Returns the key of the entry of the FileDataStream *stream*, None
+        if its file does not exist.
+        """
+        from ... import __version__
+        description = fingerprint(stream)
+        if description is None:
+            return None
+        description = repr([__version__, description])
+        return hashlib.sha256(description.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the path of the binary data of the entry *key*, None if
+        there is none.
+        """
+        with self._lock:
+            data = self._paths(key)[0]
+            if not os.path.isfile(data):
+                self.misses += 1
+                return None
+            # The modification time orders the entries for the eviction.
+            os.utime(data, None)
+            self.hits += 1
+            return data
+
+    def new_path(self):
+        """
+        Returns the path the bridge writes an entry to before it is
+        given to :meth:`put`.
+        """
+        return self._new_name() + self._extensions[0]
+
+    def put(self, key, data):
+        """
+        Stores the file written at the path returned by :meth:`new_path`
+        as the entry *key* and returns the path of its data.
+        """
+        sources = [os.path.splitext(data)[0] + e for e in self._extensions]
+        return self._store(key, sources)[0]
+
+
+def get_file_cache():
+    """
+    Returns the cache set by :func:`nimbusml.session.set_file_cache`,
+    a cache with the default directory and size if it was not called.
+    """
+    global _cache
+    if _cache is None:
+        _cache = FileCache()
+    return _cache
+
+
+def set_file_cache(cache):
+    """
+    Sets the cache returned by :func:`get_file_cache`.
+    """
+    global _cache
+    _cache = cache
+
+
+def get_cached_stream(stream, verbose=0):
+    """
+    Returns a :py:class:`BinaryDataStream <nimbusml.BinaryDataStream>`
+    with the roles of the FileDataStream *stream* reading the binary copy
+    of its file, the file is converted if it is not in the cache. Returns
+    *stream* if its file cannot be cached.
+    """
+    # Do not move these imports or the module fails
+    # due to circular references.
+    from ..entrypoints.data_customtextloader import data_customtextloader
+    from .entrypoints import Graph, DataOutputFormat
+
+    cache = get_file_cache()
+    key = cache.get_key(stream)
+    if key is None:
+        return stream
+    data = cache.get(key)
+    if data is None:
+        data = cache.new_path()
+        import_text_node = data_customtextloader(
+            input_file='$file',
+            custom_schema=stream.schema.to_string(add_sep=True),
+            data='$data')
+        graph = Graph(dict(file=''), dict(data=data), DataOutputFormat.DF,
+                      import_text_node)
+        graph.run(X=stream, verbose=verbose,
+                  telemetry_info='FileDataStream.cache')
+        data = cache.put(key, data)
+
+    binary = BinaryDataStream(data)
+    binary._roles = stream.roles.clone()
+    return binary
@@ -0,0 +1,46 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Lazy loading of the attributes of a package.
+"""
+
+import importlib
+import sys
+
+
+def lazy_import(package_name, attributes):
+    """
+    Returns the functions ``__getattr__`` and ``__dir__`` of a package
+    (PEP 562) which import an attribute from its submodule the first time
+    it is accessed, so that importing the package does not import all its
+    submodules. Python versions older than 3.7 do not call the module
+    ``__getattr__``, the attributes are then imported immediately.
+
+    :param package_name: ``__name__`` of the package.
+    :param attributes: dictionary ``{attribute name: relative module
+        name}``, such as ``{'Pipeline': '.pipeline'}``.
+    """
+    package = sys.modules[package_name]
+
+    def load(name):
+        module = importlib.import_module(attributes[name], package_name)
+        value = getattr(module, name)
+        # Next accesses do not go through __getattr__.
+        setattr(package, name, value)
+        return value
+
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(
+                package_name, name))
+        return load(name)
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(attributes))
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            load(name)
+    return __getattr__, __dir__
@@ -0,0 +1,112 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Models kept in memory instead of files.
+"""
+
+import io
+import os
+import uuid
+from shutil import copyfile
+from zipfile import ZipFile
+
+# Must be the same as ModelCache.InMemoryPrefix in the managed code.
+_in_memory_prefix = 'memory:'
+
+# Entry of a saved model holding the dtype of the features when the
+# model was trained on a single vector column. ML.NET ignores it.
+_vector_input_entry = 'NimbusML/VectorInputType'
+
+
+class ModelBytes(str):
+    """
+    Model trained by the bridge and kept in memory. It is the unique name
+    the bridge uses to find the bytes of the model, so it can be given to a
+    graph wherever the path of a model file is expected.
+
+    :param data: bytes of the model.
+    :param name: name of the model, a new unique name if None.
+    """
+
+    def __new__(cls, data, name=None):
+        if name is None:
+            name = _in_memory_prefix + uuid.uuid4().hex
+        self = super(ModelBytes, cls).__new__(cls, name)
+        self.data = data
+        return self
+
+    def __reduce__(self):
+        # The bytes of a name never change, copies keep the name so that
+        # the bridge finds the model in its cache.
+        return (ModelBytes, (self.data, str(self)))
+
+
+def model_exists(model):
+    """
+    Tells if *model* is a model in memory or an existing model file.
+    """
+    if isinstance(model, ModelBytes):
+        return True
+    return bool(model) and os.path.isfile(model)
+
+
+def read_model_bytes(model):
+    """
+    Returns the bytes of a model in memory or stored in a file.
+    """
+    if isinstance(model, ModelBytes):
+        return model.data
+    with open(model, "rb") as f:
+        return f.read()
+
+
+def open_model(model):
+    """
+    Returns a file object or the filename to read *model* from.
+    """
+    if isinstance(model, ModelBytes):
+        return io.BytesIO(model.data)
+    return model
+
+
+def save_model_to_file(model, dst):
+    """
+    Writes a model in memory or stored in a file to *dst*.
+    """
+    if isinstance(model, ModelBytes):
+        with open(dst, "wb") as f:
+            f.write(model.data)
+    elif os.path.isfile(model):
+        copyfile(model, dst)
+
+
+def write_vector_input_dtype(dst, dtype):
+    """
+    Adds to the model file *dst* the name of the dtype of the features
+    the model was trained on as a single vector column.
+    """
+    with ZipFile(dst, 'a') as model_zip:
+        model_zip.writestr(_vector_input_entry, dtype)
+
+
+def read_vector_input_dtype(model):
+    """
+    Returns the name of the dtype written by
+    :func:`write_vector_input_dtype` in *model*, None if the model was
+    not trained on a single vector column.
+    """
+    with ZipFile(open_model(model)) as model_zip:
+        if _vector_input_entry not in model_zip.namelist():
+            return None
+        return model_zip.read(_vector_input_entry).decode('ascii')
+
+
+def get_model_inputs(inputs):
+    """
+    Returns the bytes of the models in memory among the values of the
+    graph inputs, indexed by their name.
+    """
+    return {str(value): value.data for value in inputs.values()
+            if isinstance(value, ModelBytes)}
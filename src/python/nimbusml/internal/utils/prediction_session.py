@@ -0,0 +1,113 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+prepared scorer returned by Pipeline.compile_predictor
+"""
+
+import numpy as np
+import six
+from pandas import DataFrame, Series
+
+from .dataframes import resolve_dataframe, resolve_dense_matrix, \
+    resolve_output_as_dataframe
+from .models import get_model_inputs
+from .utils import try_set, get_bridge_paths
+from ..libs.pybridge import px_call
+from ...session import get_session_mode, _unpin_model, \
+    _release as _release_session
+
+
+class PredictionSession(object):
+    """
+    Scorer prepared by :meth:`Pipeline.compile_predictor
+    <nimbusml.Pipeline.compile_predictor>`. The graph is serialized and
+    the bridge parameters are resolved once, :meth:`predict` only
+    converts the data and calls the bridge.
+
+    :param graph: scoring graph, its input data comes from the bridge.
+    :param model: model pinned in the model cache, unpinned by
+        :meth:`close`.
+    :param is_transformer_chain: tells if the model is an ML.NET
+        TransformerChain.
+    :param random_state: seed of the bridge.
+    :param vector_input_dtype: dtype of the features when the model was
+        trained on one vector column, arrays are then sent the same way.
+    :param release_session: releases the ML.NET host session acquired
+        for this scorer in :meth:`close`, the session is closed with the
+        last scorer using it.
+    """
+
+    def __init__(self, graph, model=None, is_transformer_chain=False,
+                 random_state=None, vector_input_dtype=None,
+                 release_session=False):
+        self._model = model
+        self._release_session = release_session
+        self._is_transformer_chain = is_transformer_chain
+        self._vector_input_dtype = vector_input_dtype
+        call_parameters = dict(
+            verbose=0,
+            graph=try_set(str(graph), False, str))
+        for name, path in get_bridge_paths().items():
+            call_parameters[name] = try_set(path, False, str)
+        if random_state:
+            call_parameters['seed'] = try_set(
+                random_state, False, six.integer_types)
+        models = get_model_inputs(graph.inputs)
+        if models:
+            call_parameters['models'] = models
+        self._call_parameters = call_parameters
+
+    def predict(self, X):
+        """
+        Scores the data.
+
+        :param X: {array-like [n_samples, n_features], DataFrame}, a one
+            dimensional array is a single row.
+
+        :return: a DataFrame, same as :meth:`Pipeline.predict
+            <nimbusml.Pipeline.predict>`.
+        """
+        if isinstance(X, Series):
+            X = DataFrame(X if X.name is not None else X.rename('F0'))
+        elif not isinstance(X, DataFrame):
+            X = np.asarray(X)
+            if X.ndim == 1:
+                X = X.reshape((1, -1))
+            if self._vector_input_dtype is None:
+                X = DataFrame(X, columns=['F' + str(i)
+                                          for i in range(X.shape[1])])
+
+        call_parameters = self._call_parameters.copy()
+        call_parameters['session'] = get_session_mode()
+        if isinstance(X, DataFrame):
+            call_parameters['data'] = resolve_dataframe(X)
+        else:
+            call_parameters['data'] = resolve_dense_matrix(
+                np.ascontiguousarray(X, dtype=self._vector_input_dtype))
+        out_data = resolve_output_as_dataframe(px_call(call_parameters))
+
+        if self._is_transformer_chain:
+            out_data['PredictedLabel'] = out_data['PredictedLabel'] * 1
+        return out_data
+
+    def close(self):
+        """
+        Unpins the model from the model cache of the bridge and releases
+        the session acquired by :meth:`Pipeline.compile_predictor
+        <nimbusml.Pipeline.compile_predictor>`, the other scorers keep
+        it open.
+        """
+        if self._model is not None:
+            _unpin_model(self._model)
+            self._model = None
+        if self._release_session:
+            _release_session()
+            self._release_session = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -9,12 +9,15 @@ general utility functions
 import logging
 import os
 import pkg_resources
+import sys
 import tempfile
 from datetime import datetime
 
 import six
 from pandas import Series
 
+from ...tracing import span
+
 logger_trace = logging.getLogger("nimbusml")
 
 
@@ -154,7 +157,8 @@ if six.PY2:
     @decorator.decorator
     def trace(func, *args, **kwargs):
         """
-        Decorator for tracing enter and exit times
+        Decorator for tracing enter and exit times, the call is recorded
+        as a span when tracing is enabled (see nimbusml.tracing).
         """
 
         verbose = 0
@@ -174,7 +178,8 @@ if six.PY2:
                      func,
                      '__qualname__',
                      func.__name__)))
-        params = func(*args, **kwargs)
+        with span(getattr(func, '__qualname__', func.__name__)):
+            params = func(*args, **kwargs)
         if verbose > 0:
             logger_trace.info(
                 "[%s] exit %s.%s " %
@@ -192,7 +197,8 @@ else:
 
     def trace(func):
         """
-        Decorator for tracing enter and exit times
+        Decorator for tracing enter and exit times, the call is recorded
+        as a span when tracing is enabled (see nimbusml.tracing).
         """
 
         @wraps(func)
@@ -217,7 +223,8 @@ else:
                          func,
                          '__qualname__',
                          func.__name__)))
-            params = func(*args, **kwargs)
+            with span(getattr(func, '__qualname__', func.__name__)):
+                params = func(*args, **kwargs)
             if verbose > 0:
                 logger_trace.info(
                     "[%s] exit %s.%s " %
@@ -346,3 +353,14 @@ def get_mlnet_path():
     """
     return os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 
                                         'libs'))
+
+def get_bridge_paths():
+    """
+    Return the paths the bridge needs to load the .NET CLR, ML.NET and
+    DataPrep libraries, keyed by the name of the px_call parameter.
+    """
+    set_clr_environment_vars()
+    return dict(dotnetClrPath=get_clr_path(),
+                mlnetPath=get_mlnet_path(),
+                dprepPath=get_dprep_path(),
+                pythonPath=sys.executable)
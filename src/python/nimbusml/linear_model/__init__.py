@@ -1,17 +1,4 @@
-from .averagedperceptronbinaryclassifier import \
-    AveragedPerceptronBinaryClassifier
-from .fastlinearbinaryclassifier import FastLinearBinaryClassifier
-from .fastlinearclassifier import FastLinearClassifier
-from .fastlinearregressor import FastLinearRegressor
-from .linearsvmbinaryclassifier import LinearSvmBinaryClassifier
-from .logisticregressionbinaryclassifier import \
-    LogisticRegressionBinaryClassifier
-from .logisticregressionclassifier import LogisticRegressionClassifier
-from .onlinegradientdescentregressor import OnlineGradientDescentRegressor
-from .ordinaryleastsquaresregressor import OrdinaryLeastSquaresRegressor
-from .poissonregressionregressor import PoissonRegressionRegressor
-from .sgdbinaryclassifier import SgdBinaryClassifier
-from .symsgdbinaryclassifier import SymSgdBinaryClassifier
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'AveragedPerceptronBinaryClassifier',
@@ -27,3 +14,20 @@ __all__ = [
     'SgdBinaryClassifier',
     'SymSgdBinaryClassifier'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'AveragedPerceptronBinaryClassifier':
+        '.averagedperceptronbinaryclassifier',
+    'FastLinearBinaryClassifier': '.fastlinearbinaryclassifier',
+    'FastLinearClassifier': '.fastlinearclassifier',
+    'FastLinearRegressor': '.fastlinearregressor',
+    'LinearSvmBinaryClassifier': '.linearsvmbinaryclassifier',
+    'LogisticRegressionBinaryClassifier':
+        '.logisticregressionbinaryclassifier',
+    'LogisticRegressionClassifier': '.logisticregressionclassifier',
+    'OnlineGradientDescentRegressor': '.onlinegradientdescentregressor',
+    'OrdinaryLeastSquaresRegressor': '.ordinaryleastsquaresregressor',
+    'PoissonRegressionRegressor': '.poissonregressionregressor',
+    'SgdBinaryClassifier': '.sgdbinaryclassifier',
+    'SymSgdBinaryClassifier': '.symsgdbinaryclassifier'
+})
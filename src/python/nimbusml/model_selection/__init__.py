@@ -1,5 +1,11 @@
-from .cv import CV
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
-    'CV'
+    'CV',
+    'HalvingSearch'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'CV': '.cv',
+    'HalvingSearch': '.halving'
+})
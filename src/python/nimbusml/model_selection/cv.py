@@ -350,6 +350,7 @@ class CV:
             cv=2,
             groups=None,
             split_start='before_transforms',
+            n_jobs=None,
             **params):
         '''
         Cross validate the pipeline and return the results.
@@ -400,6 +401,17 @@ class CV:
               'after_transforms' is equivalent to -1,
               and 'before_transforms' is equivalent to 0.
 
+        :param n_jobs: number of folds trained at the same time, -1 to
+            train all of them at once. The threads allowed by
+            :func:`nimbusml.set_num_threads`, all the cores by default,
+            are divided by the number of folds trained at the same time
+            and every fold gets its own seed derived from the random
+            state of the pipeline. The results do not depend on
+            *n_jobs* as long as the learners set their
+            ``number_of_threads`` or do not depend on it. None runs the
+            cross validation macro of ML.NET, which trains the folds
+            one after the other.
+
         :param params: Additional arguments sent to compute engine.
 
         :return: dict of pandas dataframes. The possible keys for this
@@ -606,6 +618,7 @@ class CV:
                 is_cv=True,
                 output_types=self.output_types,
                 dry_run=dry_run,
+                n_jobs=n_jobs,
                 **params)
         except RuntimeError as e:
             self._run_time = time.time() - start_time
@@ -0,0 +1,243 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import math
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+from pandas import DataFrame, Series
+from scipy.sparse import csr_matrix
+from sklearn.model_selection import ParameterGrid
+
+from .. import Pipeline, FileDataStream
+from .cv import CV
+
+# Metric of the summary of a cross validation ranking the candidates
+# and whether it is better when greater, per type of learner.
+_default_scoring = {
+    'binary': ('AUC', True),
+    'multiclass': ('Accuracy(micro-avg)', True),
+    'regressor': ('L2(avg)', False),
+    'ranker': ('NDCG@3', True),
+    'clusterer': ('AvgMinScore', False)
+}
+
+
+class HalvingSearch(object):
+    '''
+    **Description**
+        Successive halving search of the parameters of a pipeline.
+
+    .. remarks::
+        All the candidates of the grid are evaluated on a small sample of
+        the data, only the best *1 / factor* of them are evaluated again
+        on *factor* times more rows, and so on until one candidate is left
+        or the samples reach all the data. Every evaluation is a
+        :py:class:`CV <nimbusml.model_selection.CV>`, so a candidate is
+        trained on all the folds and scored in one call to the bridge,
+        and the candidates of a step run at the same time with
+        *n_jobs*. The samples of the steps are the first rows of the
+        same shuffle of the data, a bigger sample contains the smaller
+        ones.
+
+    :param pipeline: Pipeline object or a list of pipeline steps.
+
+    :param param_grid: dictionary or list of dictionaries of parameters,
+        like ``GridSearchCV``, the parameters of a step are named
+        ``<step>__<parameter>``.
+
+    :param factor: ratio between the number of rows of two consecutive
+        steps, and between the number of candidates they evaluate.
+
+    :param min_resources: number of rows of the first step, by default
+        the last step uses all the rows.
+
+    :param max_resources: number of rows of the last step, all the rows
+        if None.
+
+    :param cv: number of folds of the evaluation of a candidate.
+
+    :param scoring: column of the ``metrics_summary`` of
+        :py:class:`CV <nimbusml.model_selection.CV>` ranking the
+        candidates, ``AUC`` for a binary classifier, ``Accuracy(micro-avg)``
+        for a multi-class classifier, ``L2(avg)`` for a regressor,
+        ``NDCG@3`` for a ranker and ``AvgMinScore`` for a clusterer by
+        default.
+
+    :param greater_is_better: tells if a greater *scoring* is better,
+        inferred for the default metrics.
+
+    :param n_jobs: number of candidates evaluated at the same time.
+
+    :param refit: if True, the best candidate is trained on all the data
+        and stored in :py:attr:`best_pipeline_`.
+
+    :param random_state: seed of the shuffle of the rows.
+
+    Example:
+       .. literalinclude:: /../nimbusml/examples/HalvingSearch.py
+              :language: python
+    '''
+
+    def __init__(self, pipeline, param_grid, factor=3, min_resources=None,
+                 max_resources=None, cv=3, scoring=None,
+                 greater_is_better=None, n_jobs=1, refit=True,
+                 random_state=None):
+        if isinstance(pipeline, list):
+            pipeline = Pipeline(pipeline)
+        if factor < 2:
+            raise ValueError(
+                "factor must be at least 2, not {0}.".format(factor))
+        if n_jobs is None or n_jobs < 1:
+            raise ValueError(
+                "n_jobs must be a positive integer, not {0}.".format(n_jobs))
+
+        self._pipeline = pipeline
+        self.param_grid = param_grid
+        self.factor = factor
+        self.min_resources = min_resources
+        self.max_resources = max_resources
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.refit = refit
+        self.random_state = random_state
+
+        learner_type = pipeline._last_node_type()
+        if scoring is None:
+            if learner_type not in _default_scoring:
+                raise ValueError(
+                    "The pipeline must end with a predictor.")
+            scoring, default_greater = _default_scoring[learner_type]
+            if greater_is_better is None:
+                greater_is_better = default_greater
+        elif greater_is_better is None:
+            raise ValueError(
+                "greater_is_better must be specified with scoring "
+                "'{0}'.".format(scoring))
+        self.scoring = scoring
+        self.greater_is_better = greater_is_better
+
+    def _get_resources(self, n_rows, n_candidates):
+        # Rows of every step, the last one evaluates at most factor
+        # candidates or uses all the rows.
+        max_resources = min(self.max_resources or n_rows, n_rows)
+        n_steps = 1 + int(math.ceil(
+            math.log(max(n_candidates, 1)) / math.log(self.factor) - 1e-9))
+        if self.min_resources is None:
+            # At least two rows per fold in the first step.
+            smallest = 2 * self.cv
+            n_steps = max(1, min(n_steps, 1 + int(math.floor(
+                math.log(max_resources / float(smallest)) /
+                math.log(self.factor) + 1e-9))))
+            min_resources = max(
+                max_resources // self.factor ** (n_steps - 1), smallest)
+        else:
+            min_resources = self.min_resources
+            if min_resources > max_resources:
+                raise ValueError(
+                    "min_resources={0} is greater than the number of rows "
+                    "{1}.".format(min_resources, max_resources))
+            n_steps = max(1, min(n_steps, 1 + int(math.floor(
+                math.log(max_resources / float(min_resources)) /
+                math.log(self.factor) + 1e-9))))
+        resources = [min(min_resources * self.factor ** i, max_resources)
+                     for i in range(n_steps)]
+        if self.min_resources is None:
+            resources[-1] = max_resources
+        return resources
+
+    def _evaluate(self, params, X, y, fit_params):
+        pipeline = self._pipeline.clone()
+        pipeline.set_params(**params)
+        results = CV(pipeline).fit(X, y, cv=self.cv, **fit_params)
+        return results['metrics_summary'].loc['Average', self.scoring]
+
+    def fit(self, X, y=None, **params):
+        '''
+        Searches the best candidate of the grid.
+
+        :param X: the data, a DataFrame, an array, a sparse matrix or a
+            :py:func:`FileDataStream <nimbusml.FileDataStream>` which
+            is loaded in memory.
+
+        :param y: target values.
+
+        :param params: additional arguments of
+            :py:meth:`CV.fit <nimbusml.model_selection.CV.fit>`.
+
+        :return: self.
+        '''
+        if isinstance(X, FileDataStream):
+            X = X.to_df()
+        n_rows = X.shape[0]
+        if y is not None and len(y) != n_rows:
+            raise ValueError(
+                "X and y must have the same number of rows.")
+
+        candidates = list(ParameterGrid(self.param_grid))
+        if len(candidates) == 0:
+            raise ValueError("param_grid has no candidate.")
+        resources = self._get_resources(n_rows, len(candidates))
+        rows = np.random.RandomState(self.random_state).permutation(n_rows)
+
+        results = []
+        pool = ThreadPool(self.n_jobs) if self.n_jobs > 1 else None
+        try:
+            for step, n_resources in enumerate(resources):
+                X_step = _take(X, rows[:n_resources])
+                y_step = _take(y, rows[:n_resources])
+
+                def evaluate(candidate):
+                    return self._evaluate(candidate, X_step, y_step, params)
+
+                if pool is None:
+                    scores = [evaluate(c) for c in candidates]
+                else:
+                    scores = pool.map(evaluate, candidates)
+                for c, s in zip(candidates, scores):
+                    results.append(dict(step=step, n_resources=n_resources,
+                                        params=c, score=s))
+
+                # Keeps the best candidates, ties keep the grid order.
+                order = np.argsort(
+                    [-s if self.greater_is_better else s for s in scores],
+                    kind='mergesort')
+                if step < len(resources) - 1:
+                    n_kept = max(1, int(math.ceil(
+                        len(candidates) / float(self.factor))))
+                else:
+                    n_kept = 1
+                candidates = [candidates[i] for i in order[:n_kept]]
+                if len(candidates) == 1 and step < len(resources) - 1:
+                    break
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        self.cv_results_ = DataFrame(results)
+        self.best_params_ = candidates[0]
+        self.best_score_ = [r['score'] for r in results
+                            if r['params'] == self.best_params_][-1]
+        self.n_resources_ = resources[:step + 1]
+        if self.refit:
+            self.best_pipeline_ = self._pipeline.clone()
+            self.best_pipeline_.set_params(**self.best_params_)
+            self.best_pipeline_.fit(X, y)
+        return self
+
+
+def _take(data, rows):
+    # Rows of data in the given order, the index is reset so that X and
+    # y are aligned.
+    if data is None:
+        return None
+    if isinstance(data, (DataFrame, Series)):
+        return data.iloc[rows].reset_index(drop=True)
+    if isinstance(data, (np.ndarray, csr_matrix)):
+        return data[rows]
+    if isinstance(data, list):
+        return [data[i] for i in rows]
+    raise TypeError(
+        "Unsupported type {0} for HalvingSearch.".format(type(data)))
@@ -1,5 +1,9 @@
-from .onevsrestclassifier import OneVsRestClassifier
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'OneVsRestClassifier'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'OneVsRestClassifier': '.onevsrestclassifier'
+})
@@ -1,5 +1,9 @@
-from .naivebayesclassifier import NaiveBayesClassifier
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'NaiveBayesClassifier'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'NaiveBayesClassifier': '.naivebayesclassifier'
+})
@@ -4,13 +4,10 @@
 # --------------------------------------------------------------------------------------------
 import inspect
 import itertools
-import os
-import tempfile
 import time
 import warnings
 from collections import OrderedDict, namedtuple, defaultdict
 from copy import deepcopy
-from shutil import copyfile
 
 import numpy as np
 import six
@@ -65,10 +62,24 @@ from .internal.entrypoints.transforms_texttokeyconverter import \
     transforms_texttokeyconverter
 from .internal.utils.data_roles import Role, DataRoles
 from .internal.utils.data_schema import DataSchema
+from .internal.utils.chunks import iterate_chunks
 from .internal.utils.data_stream import DataStream, ViewDataStream, \
     FileDataStream, BinaryDataStream
 from .internal.utils.entrypoints import Graph, DataOutputFormat
+from .internal.utils.featurization_cache import get_featurization_cache
+from .internal.utils.models import ModelBytes, model_exists, open_model, \
+    read_model_bytes, save_model_to_file, read_vector_input_dtype, \
+    write_vector_input_dtype
 from .internal.utils.utils import trace, unlist
+from .internal.utils.prediction_session import PredictionSession
+from .session import _pin_model, _unpin_model, \
+    _acquire as _acquire_session
+from .tracing import span, traced
+
+
+# Entrypoints reading the columns whose name starts with a prefix given
+# in their inputs, see Pipeline._get_column_names.
+_column_prefix_entrypoints = {'Transforms.PrefixColumnConcatenator'}
 
 
 class TrainedWarning(UserWarning):
@@ -133,6 +144,12 @@ class Pipeline:
         self.steps = steps
         self.model = model
         self.random_state = random_state
+        # Columns of the data read by the model, see
+        # _select_input_columns.
+        self._input_columns = None
+        # dtype of the features when the model was trained on a single
+        # vector column, see _get_vector_input.
+        self._vector_input_dtype = self._read_vector_input_dtype(model)
         self._validate_schema()
 
     def clone(self):
@@ -341,7 +358,39 @@ class Pipeline:
         node_type = self.last_node.type
         return node_type != 'transform'
 
-    def _preprocess_X_y(self, X, y=None, w=None):
+    def _get_vector_input(self, X, fitting):
+        """
+        Returns *X* as a C-contiguous two dimensional array of floats
+        when it is sent to the bridge as one vector column instead of
+        one column per feature, None otherwise. Only a pipeline made of
+        a single learner reading every column is trained on such a
+        column. Once trained, it scores arrays, and DataFrames with the
+        default column names, the same way, even after the model is
+        saved and loaded again.
+        """
+        if fitting:
+            if not self.steps or len(self.steps) != 1:
+                return None
+            node = self.last_node
+            if (node.type == 'transform' or node.has_defined_columns() or
+                    not isinstance(X, np.ndarray) or X.ndim != 2 or
+                    not X.flags['C_CONTIGUOUS'] or
+                    X.dtype not in (np.float32, np.float64)):
+                return None
+            return X
+        dtype = self._get_vector_input_dtype()
+        if dtype is None:
+            return None
+        if isinstance(X, DataFrame):
+            if list(X.columns) != ['F' + str(i) for i in range(X.shape[1])]:
+                return None
+            X = X.values
+        if not isinstance(X, np.ndarray) or X.ndim != 2:
+            return None
+        return np.ascontiguousarray(X, dtype=dtype)
+
+    @traced('preprocess_X_y')
+    def _preprocess_X_y(self, X, y=None, w=None, fitting=False):
         """
         Handles data preparation for fit, predict, transform
         """
@@ -394,21 +443,28 @@ class Pipeline:
             X = DataFrame(X)
 
         elif not isinstance(X, DataStream):
-            if y is None or isinstance(y, (str, tuple)):
-                X = check_array(
-                    X,
-                    accept_sparse=['csr'],
-                    dtype=None,
-                    ensure_2d=False,
-                    force_all_finite=False)
-            else:
-                X, y = check_X_y(X, y, accept_sparse=['csr'],
-                                 y_numeric=False, multi_output=True,
-                                 dtype=None,
-                                 ensure_2d=False, force_all_finite=False)
+            with span('check_array') as s:
+                if y is None or isinstance(y, (str, tuple)):
+                    X = check_array(
+                        X,
+                        accept_sparse=['csr'],
+                        dtype=None,
+                        ensure_2d=False,
+                        force_all_finite=False)
+                else:
+                    X, y = check_X_y(X, y, accept_sparse=['csr'],
+                                     y_numeric=False, multi_output=True,
+                                     dtype=None,
+                                     ensure_2d=False,
+                                     force_all_finite=False)
+                s.add_bytes(X)
 
         # X --> Feature
-        if isinstance(X, np.ndarray):
+        vector_input = self._get_vector_input(X, fitting)
+        if vector_input is not None:
+            # One vector column Data, see resolve_dense_matrix.
+            X = vector_input
+        elif isinstance(X, np.ndarray):
             X = DataFrame(X)
             if feature_columns is None:
                 feature_columns = ['F' + str(x) for x in
@@ -518,6 +574,11 @@ class Pipeline:
                 if weight_column is None:
                     weight_column = X._get_role(Role.Weight)
 
+        # A file created with cache='auto' is read from its binary copy,
+        # the roles set above are kept.
+        if isinstance(X, FileDataStream):
+            X = X._get_cached_stream()
+
         # construct schema if necessary (DataFrame, Array, Categorical)
         if columns_renamed:
             schema = DataSchema.read_schema(X, y, w)
@@ -526,7 +587,7 @@ class Pipeline:
                 schema = X.schema
             elif isinstance(X, ViewDataStream):
                 schema = X.parent.schema
-            elif isinstance(X, (DataFrame, csr_matrix)):
+            elif isinstance(X, (DataFrame, csr_matrix, np.ndarray)):
                 schema = DataSchema.read_schema(X, y, w)
             else:
                 raise ValueError(
@@ -610,7 +671,8 @@ class Pipeline:
         return graph_nodes, feature_columns, inputs, transform_nodes, \
             columns_out
 
-    def _fit_graph(self, X, y, verbose, **params):
+    def _fit_graph(self, X, y, verbose, featurization_cache=False,
+                   **params):
         # start the clock!
         start_time = time.time()
         self.verbose = verbose
@@ -624,10 +686,18 @@ class Pipeline:
         output_binary_data_stream = params.pop(
             'output_binary_data_stream', False)
         params.pop('parallel', None)
+        # read by Graph.run
+        n_jobs = params.pop('n_jobs', None)
+        params.pop('profile', None)
         do_output_predictor_model = params.pop('output_predictor_model', None)
 
         X, y, columns_renamed, feature_columns, label_column, schema, \
-            weights, weight_column = self._preprocess_X_y(X, y, weights)
+            weights, weight_column = self._preprocess_X_y(
+                X, y, weights, fitting=True)
+        # Scoring sends the features the same way, see _get_vector_input.
+        # The learner keeps it too for the predictors trained alone.
+        self._vector_input_dtype = self.last_node._vector_input_dtype = \
+            X.dtype if isinstance(X, np.ndarray) else None
 
         self._check_ambiguities(X, y, weights)
 
@@ -649,6 +719,32 @@ class Pipeline:
                 feature_columns, label_column, output_data, output_model,
                 strategy_iosklearn=strategy_iosklearn)
 
+        # The columns read by the pipeline are found in the nodes of the
+        # transforms before the featurization cache removes them. A model
+        # given as input, Models.DatasetTransformer, or a node selecting
+        # columns by prefix reads unknown columns.
+        source = X
+        column_names = None
+        if len(inputs) == 1:
+            column_names = self._get_column_names(
+                itertools.chain(*graph_nodes.values()))
+
+        # The learner is trained on the output of the transforms kept by
+        # the featurization cache, see nimbusml.session.
+        featurization_model = None
+        if featurization_cache:
+            featurized = self._get_featurized_data(
+                X, y, weights, graph_nodes, inputs, transform_nodes,
+                output_data, verbose, n_jobs=n_jobs)
+            if featurized is not None:
+                X = BinaryDataStream(featurized[0])
+                featurization_model = "$featurization_model"
+                inputs = OrderedDict([
+                    (input_data.replace('$', ''), ''),
+                    (featurization_model.replace('$', ''), featurized[1])])
+                graph_nodes = OrderedDict()
+                transform_nodes = []
+
         last_node = self.last_node
         learner_exists = False
         learner_features = None
@@ -664,6 +760,11 @@ class Pipeline:
                     strategy_iosklearn=strategy_iosklearn)
 
             graph_nodes.update(learner_graph_nodes)
+            if column_names is not None:
+                learner_names = self._get_column_names(
+                    itertools.chain(*learner_graph_nodes.values()))
+                column_names = None if learner_names is None else \
+                    column_names | learner_names
 
         # graph_nodes contain graph sections, which is needed for CV.
         # Save it, then flatten it, which is what the rest of the code
@@ -672,7 +773,8 @@ class Pipeline:
         graph_nodes = list(itertools.chain(*graph_nodes.values()))
 
         # combine output models
-        transform_models = []
+        transform_models = [] if featurization_model is None else \
+            [featurization_model]
         for node in graph_nodes:
             if node.name == 'Models.DatasetTransformer':
                 transform_models.append(node.inputs['TransformModel'])
@@ -738,6 +840,12 @@ class Pipeline:
             data_output_format,
             *(graph_nodes))
 
+        # The data is not returned when a learner is trained, only the
+        # columns named by the nodes are read.
+        if learner_exists and not do_fit_transform and \
+                column_names is not None:
+            self._select_input_columns(source, graph, column_names)
+
         # Checks that every parameter in params was used.
         if len(params) > 0:
             raise ValueError(
@@ -765,6 +873,57 @@ class Pipeline:
         return graph, X, y, weights, start_time, schema, telemetry_info, \
             learner_features, cv_aux_info, max_slots
 
+    def _get_featurized_data(self, X, y, weights, graph_nodes, inputs,
+                             transform_nodes, output_data, verbose,
+                             **params):
+        """
+        Returns the paths of the output of the transforms preceding the
+        learner and of the model of these transforms, found in the
+        featurization cache or stored in it after running the
+        transforms, None if the pipeline or the data cannot be cached.
+        """
+        cache = get_featurization_cache()
+        # imported here to avoid circular reference
+        from .ensemble.votingensemble import VotingEnsemble
+        if cache is None or not transform_nodes or \
+                self.last_node.type == 'transform' or \
+                isinstance(self.last_node, VotingEnsemble):
+            return None
+
+        nodes = list(itertools.chain(*graph_nodes.values()))
+        key = cache.get_key(
+            self.nodes[:-1], nodes,
+            [X, y, weights, self.random_state, repr(list(inputs.items()))])
+        if key is None:
+            return None
+        featurized = cache.get(key)
+        if featurized is not None:
+            return featurized
+
+        # The learner reads the output of the last transform.
+        data_path, model_path = cache.new_paths()
+        transform_models = []
+        for node in nodes:
+            if node.name == 'Models.DatasetTransformer':
+                transform_models.append(node.inputs['TransformModel'])
+            elif "Model" in node.outputs:
+                transform_models.append(node.outputs["Model"])
+        combine_model_node = transforms_modelcombiner(
+            models=transform_models,
+            output_model="$featurization_model")
+        combine_model_node._implicit = True
+        nodes.append(combine_model_node)
+        outputs = OrderedDict([
+            ((output_data + str(len(transform_nodes))).replace('$', ''),
+             data_path),
+            ('featurization_model', model_path)])
+        graph = Graph(OrderedDict(inputs), outputs, DataOutputFormat.DF,
+                      *nodes)
+        graph.run(X=X, y=y, random_state=self.random_state, w=weights,
+                  verbose=verbose, telemetry_info='Pipeline.featurize',
+                  **params)
+        return cache.put(key, data_path, model_path)
+
     def get_fit_info(self, X, y=None, **params):
         """
         Returns information about the pipeline.
@@ -1002,6 +1161,13 @@ class Pipeline:
         :param X: {array-like [n_samples, n_features],
            :py:func:`FileDataStream <nimbusml.FileDataStream>` }
         :param y: {array-like [n_samples]}
+        :param n_jobs: maximum number of threads of the trainers and of
+            the bridge for this call, overrides
+            :func:`nimbusml.set_num_threads`.
+        :param profile: if True, the wall time, the number of output
+            rows and the allocated bytes of every node of the graph are
+            stored in :attr:`last_profile_`. This parameter is also
+            accepted by ``predict``, ``transform``...
 
         Example:
            .. literalinclude::
@@ -1047,16 +1213,14 @@ class Pipeline:
 
         graph, X, y, weights, start_time, schema, telemetry_info, \
             learner_features, _, max_slots = self._fit_graph(
-                X, y, verbose, **params)
+                X, y, verbose, featurization_cache=True, **params)
         params.pop('max_slots', max_slots)
 
         def move_information_about_roles_once_used():
             DataRoles.move_role_info(self)
             self.last_node._move_role_info()
 
-        # run the graph
-        # REVIEW: we should have the possibility to keep the model in
-        # memory and not in a file.
+        # run the graph, the model is returned in memory
         try:
             (out_model, out_data, out_metrics, out_predictor_model) = graph.run(
                 X=X,
@@ -1084,12 +1248,14 @@ class Pipeline:
         move_information_about_roles_once_used()
         self.graph_ = graph
         self.model = out_model
+        self._input_columns = graph._input_columns
         if out_predictor_model:
             self.predictor_model = out_predictor_model
         self.data = out_data
         # stop the clock
         self._run_time = time.time() - start_time
         self._write_csv_time = graph._write_csv_time
+        self.last_profile_ = graph.last_profile
         delattr(self, "_cache_predictor")
         return self
 
@@ -1403,7 +1569,7 @@ class Pipeline:
         """
         if not hasattr(self, 'model'):
             return False
-        if self.model is None or not os.path.isfile(self.model):
+        if not model_exists(self.model):
             return False
         if hasattr(self, "_run_time_error"):
             return False
@@ -1903,19 +2069,160 @@ class Pipeline:
                 isinstance(X, DataFrame) and isinstance(y, (str, tuple))):
             y = y_temp
 
-        is_transformer_chain = False
-        with ZipFile(self.model) as model_zip:
-            is_transformer_chain = any('TransformerChain' in item
-                                   for item in model_zip.namelist())
+        is_transformer_chain = self._is_transformer_chain()
+        inputs, all_nodes = self._scoring_nodes(
+            is_transformer_chain,
+            schema if isinstance(X, FileDataStream) else None,
+            evaltype)
+
+        if y is not None:
+            evaluate_nodes = self._evaluation_infer(
+                evaltype, label_column, group_id, **params)
+            for node in evaluate_nodes:
+                all_nodes.extend([node])
+            output_scores = '' if params.get(
+                'output_scores', False) else '<null>'
+            outputs = OrderedDict(
+                [('output_metrics', ''), ('output_data', output_scores)])
+        else:
+            outputs = dict(output_data="")
+
+        data_output_format = DataOutputFormat.IDV if as_binary_data_stream \
+                             else DataOutputFormat.DF,
+
+        graph = Graph(
+            inputs,
+            outputs,
+            data_output_format,
+            *all_nodes)
+
+        # The output only contains the scores, the data is restricted to
+        # the columns read by the model and by the evaluation.
+        input_columns = getattr(self, '_input_columns', None)
+        if input_columns is not None:
+            names = self._get_column_names(all_nodes)
+            if names is not None:
+                self._select_input_columns(
+                    X, graph, set(input_columns) | names)
+
+        class_name = type(self).__name__
+        method_name = inspect.currentframe().f_code.co_name
+        telemetry_info = ".".join([class_name, method_name])
+
+        chunk_callback = params.get('chunk_callback', None)
+        if is_transformer_chain and chunk_callback is not None:
+            def fix_predicted_label(chunk):
+                chunk['PredictedLabel'] = chunk['PredictedLabel']*1
+                return chunk_callback(chunk)
+
+            params['chunk_callback'] = fix_predicted_label
+
+        try:
+            (out_model, out_data, out_metrics, _) = graph.run(
+                X=X,
+                y=y,
+                random_state=self.random_state,
+                model=self.model,
+                verbose=verbose,
+                telemetry_info=telemetry_info,
+                **params)
+        except RuntimeError as e:
+            self._run_time = time.time() - start_time
+            raise e
+
+        # The chunks were fixed by fix_predicted_label, nothing is
+        # returned once they are all sent.
+        if is_transformer_chain and chunk_callback is None:
+            with span('fix_labels'):
+                out_data['PredictedLabel'] = out_data['PredictedLabel']*1
+
+
+        if y is not None:
+            # We need to fix the schema for ranking metrics
+            if evaltype == 'ranking':
+                out_metrics = self._fix_ranking_metrics_schema(out_metrics)
+
+        # stop the clock
+        self._run_time = time.time() - start_time
+        self._write_csv_time = graph._write_csv_time
+        self.last_profile_ = graph.last_profile
+        return out_data, out_metrics
 
+    @staticmethod
+    def _get_column_names(nodes):
+        """
+        Returns the strings found in the inputs of *nodes*, they contain
+        the names of all the columns the nodes read. Returns None if a
+        node selects its columns with a prefix, the names of the columns
+        it reads are not in its inputs.
+        """
+        nodes = list(nodes)
+        if any(node.name in _column_prefix_entrypoints for node in nodes):
+            return None
+        names = set()
+        values = [node.inputs for node in nodes]
+        while values:
+            value = values.pop()
+            if isinstance(value, six.string_types):
+                names.add(value)
+            elif isinstance(value, dict):
+                values.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                values.extend(value)
+        return names
+
+    def _select_input_columns(self, X, graph, names):
+        """
+        Restricts the columns of X read by *graph* to the ones in
+        *names*. The text loader of a FileDataStream only parses them,
+        the other columns of a DataFrame are not sent to the bridge.
+        The columns kept are stored in ``graph._input_columns``, it stays
+        None if X cannot be restricted.
+        """
+        if isinstance(X, DataFrame):
+            if not all(isinstance(c, six.string_types) for c in X.columns):
+                return
+            graph._input_columns = [c for c in X.columns if c in names]
+        elif isinstance(X, (FileDataStream, BinaryDataStream)):
+            columns = [c.Name for c in X.schema if c.Name in names]
+            graph._input_columns = columns
+            if not isinstance(X, FileDataStream) or \
+                    len(columns) == len(X.schema):
+                return
+            schema = DataSchema([X.schema[c].clone() for c in columns],
+                                **X.schema.options)
+            nodes = list(graph.nodes)
+            for i, node in enumerate(nodes):
+                if node.name == 'Data.CustomTextLoader':
+                    # A new node, the one of the graph may be shared
+                    # with the sections given to CV.
+                    nodes[i] = data_customtextloader(
+                        input_file=node.inputs['InputFile'],
+                        custom_schema=schema.to_string(add_sep=True),
+                        data=node.outputs['Data'])
+                    nodes[i]._implicit = True
+            graph.nodes = tuple(nodes)
+
+    def _is_transformer_chain(self):
+        with ZipFile(open_model(self.model)) as model_zip:
+            return any('TransformerChain' in item
+                       for item in model_zip.namelist())
+
+    def _scoring_nodes(self, is_transformer_chain, file_schema=None,
+                       evaltype='auto'):
+        """
+        Returns the graph inputs and the nodes scoring the data with the
+        fitted model. The data is read from a file with schema
+        *file_schema* if specified, from the bridge otherwise.
+        """
         all_nodes = []
         if is_transformer_chain:
             inputs = dict([('data', ''), ('transform_model', self.model)])
-            if isinstance(X, FileDataStream):
+            if file_schema is not None:
                 importtext_node = data_customtextloader(
                     input_file="$file",
                     data="$data",
-                    custom_schema=schema.to_string(
+                    custom_schema=file_schema.to_string(
                         add_sep=True))
                 all_nodes = [importtext_node]
                 inputs = dict([('file', ''), ('transform_model', self.model)])
@@ -1927,11 +2234,11 @@ class Pipeline:
             all_nodes.extend([score_node])
         else:
             inputs = dict([('data', ''), ('predictor_model', self.model)])
-            if isinstance(X, FileDataStream):
+            if file_schema is not None:
                 importtext_node = data_customtextloader(
                     input_file="$file",
                     data="$data",
-                    custom_schema=schema.to_string(
+                    custom_schema=file_schema.to_string(
                         add_sep=True))
                 all_nodes = [importtext_node]
                 inputs = dict([('file', ''), ('predictor_model', self.model)])
@@ -1963,57 +2270,49 @@ class Pipeline:
                 output_data="$output_data", score_column="Score")
             all_nodes.extend([select_node])
 
-        if y is not None:
-            evaluate_nodes = self._evaluation_infer(
-                evaltype, label_column, group_id, **params)
-            for node in evaluate_nodes:
-                all_nodes.extend([node])
-            output_scores = '' if params.get(
-                'output_scores', False) else '<null>'
-            outputs = OrderedDict(
-                [('output_metrics', ''), ('output_data', output_scores)])
-        else:
-            outputs = dict(output_data="")
+        return inputs, all_nodes
 
-        data_output_format = DataOutputFormat.IDV if as_binary_data_stream \
-                             else DataOutputFormat.DF,
+    def compile_predictor(self, pin=True):
+        """
+        Prepares everything :meth:`predict` does on every call (model
+        inspection, scoring graph, bridge parameters) once and returns a
+        ``PredictionSession`` whose ``predict(X)`` only marshals the
+        data and runs the prepared scorer. It is meant for
+        low latency scoring of small requests. The ML.NET host session is
+        opened (see :mod:`nimbusml.session`) so that the bridge and the
+        deserialized model stay warm between calls. A session opened here
+        is closed with the last handle using it, one opened by
+        :func:`nimbusml.session.open` is left open.
+
+        :param pin: pins the model in the model cache of the bridge
+            until the handle is closed.
+
+        :return: a PredictionSession.
+        """
+        if not self._is_fitted:
+            raise ValueError(
+                "Model is not fitted. Train or load a model before "
+                "compile_predictor().")
 
+        is_transformer_chain = self._is_transformer_chain()
+        inputs, all_nodes = self._scoring_nodes(is_transformer_chain)
         graph = Graph(
             inputs,
-            outputs,
-            data_output_format,
+            dict(output_data=""),
+            DataOutputFormat.DF,
             *all_nodes)
 
-        class_name = type(self).__name__
-        method_name = inspect.currentframe().f_code.co_name
-        telemetry_info = ".".join([class_name, method_name])
-
-        try:
-            (out_model, out_data, out_metrics, _) = graph.run(
-                X=X,
-                y=y,
-                random_state=self.random_state,
-                model=self.model,
-                verbose=verbose,
-                telemetry_info=telemetry_info,
-                **params)
-        except RuntimeError as e:
-            self._run_time = time.time() - start_time
-            raise e
-
-        if is_transformer_chain:
-            out_data['PredictedLabel'] = out_data['PredictedLabel']*1
-
-
-        if y is not None:
-            # We need to fix the schema for ranking metrics
-            if evaltype == 'ranking':
-                out_metrics = self._fix_ranking_metrics_schema(out_metrics)
+        _acquire_session()
+        if pin:
+            _pin_model(self.model)
 
-        # stop the clock
-        self._run_time = time.time() - start_time
-        self._write_csv_time = graph._write_csv_time
-        return out_data, out_metrics
+        return PredictionSession(
+            graph,
+            model=self.model if pin else None,
+            is_transformer_chain=is_transformer_chain,
+            random_state=self.random_state,
+            vector_input_dtype=self._get_vector_input_dtype(),
+            release_session=True)
 
     def _extract_classes(self, y):
         if (self.steps and
@@ -2058,6 +2357,31 @@ class Pipeline:
             as_binary_data_stream=as_binary_data_stream, **params)
         return out_data
 
+    @trace
+    def predict_iter(self, X, chunksize=100000, verbose=0, **params):
+        """
+        Predict based on the input data, chunk by chunk. The predictions
+        are streamed from the bridge while the data is scored, only one
+        chunk is held in memory at a time.
+
+        :param X: {array-like [n_samples, n_features],
+            :py:class:`nimbusml.FileDataStream` }
+        :param chunksize: number of rows of every chunk.
+
+        :return: a generator of DataFrames, the same as :meth:`predict`
+            once concatenated.
+        """
+        if not self._is_fitted:
+            raise ValueError(
+                "Model is not fitted. Train or load a model before "
+                "predict_iter().")
+
+        def run(**chunk_params):
+            params.update(chunk_params)
+            self._predict(X, verbose=verbose, **params)
+
+        return iterate_chunks(run, chunksize)
+
     @trace
     def predict_proba(self, X, verbose=0, **params):
         """
@@ -2354,8 +2678,34 @@ class Pipeline:
         # stop the clock
         self._run_time = time.time() - start_time
         self._write_csv_time = graph._write_csv_time
+        self.last_profile_ = graph.last_profile
         return out_data
 
+    @trace
+    def transform_iter(self, X, chunksize=100000, verbose=0, **params):
+        """
+        Apply transforms, chunk by chunk. The transformed data is streamed
+        from the bridge while it is computed, only one chunk is held in
+        memory at a time.
+
+        :param X: {array-like [n_samples, n_features],
+            :py:class:`nimbusml.FileDataStream` }
+        :param chunksize: number of rows of every chunk.
+
+        :return: a generator of DataFrames, the same as :meth:`transform`
+            once concatenated.
+        """
+        if not self._is_fitted:
+            raise ValueError(
+                "Model is not fitted. Train or load a model before "
+                "transform_iter().")
+
+        def run(**chunk_params):
+            params.update(chunk_params)
+            self.transform(X, verbose=verbose, **params)
+
+        return iterate_chunks(run, chunksize)
+
     @trace
     def summary(self, verbose=0, **params):
         """
@@ -2432,6 +2782,7 @@ class Pipeline:
         # stop the clock
         self._run_time = time.time() - start_time
         self._write_csv_time = graph._write_csv_time
+        self.last_profile_ = graph.last_profile
         return self.model_summary
 
     @trace
@@ -2444,8 +2795,32 @@ class Pipeline:
 
         """
         if self.model is not None:
-            if os.path.isfile(self.model):
-                copyfile(self.model, dst)
+            save_model_to_file(self.model, dst)
+            # The model read by load_model scores arrays the same way.
+            dtype = self._get_vector_input_dtype()
+            if dtype is not None:
+                write_vector_input_dtype(dst, dtype.name)
+
+    def pin_model(self):
+        """
+        Keeps the model of the pipeline in the model cache of the bridge
+        until :meth:`unpin_model` is called, it is never evicted to make
+        room for other models. The model stays deserialized between
+        calls to ``predict``, ``predict_proba``, ``decision_function``,
+        ``test`` and ``transform``. See :mod:`nimbusml.session`.
+        """
+        if not model_exists(self.model):
+            raise ValueError("Model is not fitted. Train or load a model "
+                             "before pinning it.")
+        _pin_model(self.model)
+
+    def unpin_model(self):
+        """
+        Lets the model cache of the bridge evict the model of the
+        pipeline again.
+        """
+        if self.model is not None:
+            _unpin_model(self.model)
 
     @trace
     def load_model(self, src):
@@ -2458,10 +2833,25 @@ class Pipeline:
         :param dst: source filename to be loaded
 
         """
-        if not os.path.isfile(src):
+        if not model_exists(src):
             raise ValueError("file not found %s" % src)
         self.model = src
         self.steps = []
+        self._input_columns = None
+        self._vector_input_dtype = self._read_vector_input_dtype(src)
+
+    @staticmethod
+    def _read_vector_input_dtype(model):
+        if not model_exists(model):
+            return None
+        dtype = read_vector_input_dtype(model)
+        return None if dtype is None else np.dtype(dtype)
+
+    def _get_vector_input_dtype(self):
+        dtype = getattr(self, '_vector_input_dtype', None)
+        if dtype is None and self.steps and len(self.steps) == 1:
+            dtype = getattr(self.last_node, '_vector_input_dtype', None)
+        return dtype
 
     def __getstate__(self):
         odict = {'export_version': 2}
@@ -2469,19 +2859,19 @@ class Pipeline:
         if hasattr(self, 'steps'):
             odict['steps'] = self.steps
 
-        if (hasattr(self, 'model') and 
-            self.model is not None and
-            os.path.isfile(self.model)):
+        if hasattr(self, 'model') and model_exists(self.model):
+            odict['modelbytes'] = read_model_bytes(self.model)
 
-            with open(self.model, "rb") as f:
-                odict['modelbytes'] = f.read()
+        if (hasattr(self, 'predictor_model') and
+                model_exists(self.predictor_model)):
+            odict['predictor_model_bytes'] = read_model_bytes(
+                self.predictor_model)
 
-        if (hasattr(self, 'predictor_model') and 
-            self.predictor_model is not None and
-            os.path.isfile(self.predictor_model)):
+        if getattr(self, '_input_columns', None) is not None:
+            odict['input_columns'] = self._input_columns
 
-            with open(self.predictor_model, "rb") as f:
-                odict['predictor_model_bytes'] = f.read()
+        if self._get_vector_input_dtype() is not None:
+            odict['vector_input_dtype'] = self._get_vector_input_dtype().name
 
         return odict
 
@@ -2489,6 +2879,8 @@ class Pipeline:
         self.steps = []
         self.model = None
         self.random_state = None
+        self._input_columns = None
+        self._vector_input_dtype = None
 
         if state.get('export_version', 0) == 0:
             # Pickled pipelines which were created
@@ -2503,18 +2895,16 @@ class Pipeline:
                 self.steps = state['steps']
 
             if 'modelbytes' in state:
-                (fd, modelfile) = tempfile.mkstemp()
-                fl = os.fdopen(fd, "wb")
-                fl.write(state['modelbytes'])
-                fl.close()
-                self.model = modelfile
+                self.model = ModelBytes(state['modelbytes'])
 
             if 'predictor_model_bytes' in state:
-                (fd, modelfile) = tempfile.mkstemp()
-                fl = os.fdopen(fd, "wb")
-                fl.write(state['predictor_model_bytes'])
-                fl.close()
-                self.predictor_model = modelfile
+                self.predictor_model = ModelBytes(
+                    state['predictor_model_bytes'])
+
+            self._input_columns = state.get('input_columns', None)
+            if 'vector_input_dtype' in state:
+                self._vector_input_dtype = np.dtype(
+                    state['vector_input_dtype'])
 
         else:
             raise ValueError('Pipeline version not supported.')
@@ -2665,6 +3055,7 @@ class Pipeline:
         # stop the clock
         pipeline._run_time = time.time() - start_time
         pipeline._write_csv_time = graph._write_csv_time
+        pipeline.last_profile_ = graph.last_profile
 
         return pipeline
 
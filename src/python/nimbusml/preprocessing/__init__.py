@@ -1,7 +1,4 @@
-from .fromkey import FromKey
-from .tokey import ToKey
-from .tensorflowscorer import TensorFlowScorer
-from .datasettransformer import DatasetTransformer
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'FromKey',
@@ -9,3 +6,10 @@ __all__ = [
     'TensorFlowScorer',
     'DatasetTransformer'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'FromKey': '.fromkey',
+    'ToKey': '.tokey',
+    'TensorFlowScorer': '.tensorflowscorer',
+    'DatasetTransformer': '.datasettransformer'
+})
@@ -1,7 +1,4 @@
-from .bootstrapsampler import BootstrapSampler
-from .rangefilter import RangeFilter
-from .skipfilter import SkipFilter
-from .takefilter import TakeFilter
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'BootstrapSampler',
@@ -9,3 +6,10 @@ __all__ = [
     'SkipFilter',
     'TakeFilter'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'BootstrapSampler': '.bootstrapsampler',
+    'RangeFilter': '.rangefilter',
+    'SkipFilter': '.skipfilter',
+    'TakeFilter': '.takefilter'
+})
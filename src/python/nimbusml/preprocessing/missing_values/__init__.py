@@ -1,9 +1,13 @@
-from .filter import Filter
-from .handler import Handler
-from .indicator import Indicator
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'Filter',
     'Handler',
     'Indicator'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'Filter': '.filter',
+    'Handler': '.handler',
+    'Indicator': '.indicator'
+})
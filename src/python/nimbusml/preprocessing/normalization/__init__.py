@@ -1,9 +1,4 @@
-from .binner import Binner
-from .globalcontrastrowscaler import GlobalContrastRowScaler
-from .logmeanvariancescaler import LogMeanVarianceScaler
-from .lpscaler import LpScaler
-from .meanvariancescaler import MeanVarianceScaler
-from .minmaxscaler import MinMaxScaler
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'Binner',
@@ -13,3 +8,12 @@ __all__ = [
     'MeanVarianceScaler',
     'MinMaxScaler'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'Binner': '.binner',
+    'GlobalContrastRowScaler': '.globalcontrastrowscaler',
+    'LogMeanVarianceScaler': '.logmeanvariancescaler',
+    'LpScaler': '.lpscaler',
+    'MeanVarianceScaler': '.meanvariancescaler',
+    'MinMaxScaler': '.minmaxscaler'
+})
@@ -1,9 +1,4 @@
-from .columnconcatenator import ColumnConcatenator
-from .columndropper import ColumnDropper
-from .columnduplicator import ColumnDuplicator
-from .columnselector import ColumnSelector
-from .prefixcolumnconcatenator import PrefixColumnConcatenator
-from .typeconverter import TypeConverter
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'ColumnConcatenator',
@@ -13,3 +8,12 @@ __all__ = [
     'PrefixColumnConcatenator',
     'TypeConverter'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'ColumnConcatenator': '.columnconcatenator',
+    'ColumnDropper': '.columndropper',
+    'ColumnDuplicator': '.columnduplicator',
+    'ColumnSelector': '.columnselector',
+    'PrefixColumnConcatenator': '.prefixcolumnconcatenator',
+    'TypeConverter': '.typeconverter'
+})
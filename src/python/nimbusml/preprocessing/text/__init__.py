@@ -1,7 +1,11 @@
-from .chartokenizer import CharTokenizer
-from .wordtokenizer import WordTokenizer
+from ...internal.utils.lazy import lazy_import
 
 __all__ = [
     'CharTokenizer',
     'WordTokenizer'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'CharTokenizer': '.chartokenizer',
+    'WordTokenizer': '.wordtokenizer'
+})
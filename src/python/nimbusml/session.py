@@ -0,0 +1,475 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Session keeping the ML.NET host environment alive between calls
+to the bridge.
+
+Without a session, every graph run (``fit``, ``predict``,
+``transform``...) creates a new ML.NET environment and registers all
+the ML.NET assemblies, which costs a lot for small inputs. Once a
+session is opened, every graph run reuses the same environment until
+the session is closed.
+
+.. code-block:: python
+
+    import nimbusml.session
+
+    nimbusml.session.open()
+    for df in many_small_dataframes:
+        pipeline.predict(df)
+    nimbusml.session.close()
+
+The bridge also keeps the models it reads in a cache shared by all the
+calls of the process, so a model is deserialized once and not on every
+``predict``. A cached model is identified by the path, the size and the
+last modification time of its file. The least recently used models are
+evicted once the cache goes over its memory budget, except the models
+pinned with :meth:`Pipeline.pin_model`.
+
+The first call to the bridge in a process starts the .NET runtime and
+compiles the code running the graphs, which takes seconds. A service can
+pay for it at start up with :func:`warmup`, in a background thread if
+it should not wait for it:
+
+.. code-block:: python
+
+    import nimbusml
+
+    nimbusml.warmup(models=['model.zip'], background=True)
+    ...
+    nimbusml.session.wait_ready()
+
+By default the trainers and the bridge use all the cores. Several fits
+running at the same time on a shared machine then compete for them.
+:func:`set_num_threads` sets the maximum number of threads of every call
+to the bridge in the process, the argument ``n_jobs`` of ``fit``,
+``predict``, ``transform``... overrides it for one call.
+
+A sweep over the parameters of a learner, with ``GridSearchCV`` for
+example, runs the same transforms on the same data for every candidate.
+Once :func:`enable_featurization_cache` is called, ``Pipeline.fit`` stores
+the output of the transforms preceding the learner and their model in a
+directory, and the next fits with the same transforms and the same data
+only train the learner:
+
+.. code-block:: python
+
+    import nimbusml.session
+
+    nimbusml.session.enable_featurization_cache(max_bytes=2 ** 30)
+    GridSearchCV(pipeline, param_grid).fit(X, y)
+    nimbusml.session.disable_featurization_cache()
+
+A :py:class:`FileDataStream <nimbusml.FileDataStream>` created with
+``cache='auto'`` is converted into a binary file the first time a
+pipeline reads it, the next pipelines, in this process or another one,
+read the binary file instead of parsing the text. The binary files are
+kept in the directory set by :func:`set_file_cache`:
+
+.. code-block:: python
+
+    import nimbusml.session
+    from nimbusml import FileDataStream
+
+    nimbusml.session.set_file_cache('/data/cache', max_bytes=2 ** 36)
+    ds = FileDataStream.read_csv('big.tsv', sep='\\t', cache='auto')
+    pipeline.fit(ds, 'y')
+"""
+
+import threading
+
+import pandas as pd
+
+import six
+
+from .internal.libs.pybridge import px_call
+from .internal.utils import featurization_cache, file_cache
+from .internal.utils.models import get_model_inputs
+from .internal.utils.utils import try_set, get_bridge_paths
+
+# WARNING: These values are defined by the managed code, see
+# SessionMode in Bridge.cs.
+_SESSION_NONE = 0
+_SESSION_USE = 1
+_SESSION_CLOSE = 2
+
+# WARNING: These values are defined by the managed code, see
+# CacheCommand in Bridge.cs.
+_CACHE_STATS = 1
+_CACHE_PIN = 2
+_CACHE_UNPIN = 3
+_CACHE_CLEAR = 4
+_CACHE_SET_BUDGET = 5
+_CACHE_LOAD = 6
+
+_session_lock = threading.Lock()
+_session_opened = False
+# Number of the scorers of Pipeline.compile_predictor using the session,
+# see _acquire. The session is closed with the last one when it was
+# opened by the first one and not by open.
+_session_users = 0
+_session_acquired = False
+
+# Maximum number of threads of a call to the bridge, None for no limit.
+_num_threads = None
+
+_runtime_ready = threading.Event()
+# Exception raised by a warm-up running in the background.
+_warmup_error = None
+
+
+def _call_bridge(mode, verbose=0, graph='{"nodes": []}', **params):
+    call_parameters = dict(
+        graph=graph,
+        verbose=try_set(verbose, False, six.integer_types),
+        session=mode)
+    call_parameters.update(params)
+    for name, path in get_bridge_paths().items():
+        call_parameters[name] = try_set(path, False, str)
+    return px_call(call_parameters)
+
+
+def _call_model_cache(command, argument='', **params):
+    ret = _call_bridge(get_session_mode(), graph=argument,
+                       cache_command=command, **params)
+    return {name.lower(): int(values[0]) for name, values in ret.items()}
+
+
+def open(verbose=0):
+    """
+    Opens the session. The ML.NET host environment is created and the
+    ML.NET assemblies are registered right away, all the following calls
+    to the bridge reuse them. Opening a session which is already opened
+    does nothing.
+
+    :param verbose: verbosity level of the bridge while the environment
+        is created.
+    """
+    global _session_opened, _session_acquired
+    with _session_lock:
+        # The caller owns the session now, it stays open once the
+        # scorers release it.
+        _session_acquired = False
+        if _session_opened:
+            return
+        _call_bridge(_SESSION_USE, verbose)
+        _session_opened = True
+
+
+def close():
+    """
+    Closes the session and releases the ML.NET host environment. The
+    following calls to the bridge create their own environment again.
+    Closing a session which is not opened does nothing.
+    """
+    global _session_opened, _session_users, _session_acquired
+    with _session_lock:
+        _session_users = 0
+        _session_acquired = False
+        if not _session_opened:
+            return
+        _session_opened = False
+        _call_bridge(_SESSION_CLOSE)
+
+
+def _acquire():
+    """
+    Opens the session if needed and counts one more user of it. Every
+    call must be followed by a call to :func:`_release`.
+    """
+    global _session_opened, _session_users, _session_acquired
+    with _session_lock:
+        if not _session_opened:
+            _call_bridge(_SESSION_USE)
+            _session_opened = True
+            _session_acquired = True
+        _session_users += 1
+
+
+def _release():
+    """
+    Counts one user less of the session and closes it after the last
+    one if it was opened by :func:`_acquire`.
+    """
+    global _session_opened, _session_users, _session_acquired
+    with _session_lock:
+        if _session_users == 0:
+            return
+        _session_users -= 1
+        if _session_users == 0 and _session_acquired:
+            _session_acquired = False
+            _session_opened = False
+            _call_bridge(_SESSION_CLOSE)
+
+
+def is_open():
+    """
+    Tells if a session is opened.
+    """
+    return _session_opened
+
+
+def get_session_mode():
+    """
+    Returns the session mode the bridge must be called with.
+    """
+    return _SESSION_USE if _session_opened else _SESSION_NONE
+
+
+def model_cache_info():
+    """
+    Returns the state of the model cache as a dictionary with keys
+    ``hits``, ``misses``, ``evictions`` (counters since the last call to
+    :func:`clear_model_cache`), ``count`` (number of cached models),
+    ``bytes`` (approximated memory used by the cached models) and
+    ``budget`` (memory budget in bytes).
+    """
+    return _call_model_cache(_CACHE_STATS)
+
+
+def set_model_cache_budget(budget):
+    """
+    Sets the memory budget of the model cache. The least recently used
+    models are evicted until the cache fits in the budget.
+
+    :param budget: budget in bytes, ``0`` disables the cache.
+    """
+    budget = try_set(budget, False, six.integer_types)
+    return _call_model_cache(_CACHE_SET_BUDGET, cache_budget=budget)
+
+
+def clear_model_cache():
+    """
+    Removes all the models from the cache, including the pinned ones
+    which are unpinned, and resets the counters.
+    """
+    return _call_model_cache(_CACHE_CLEAR)
+
+
+def set_num_threads(n):
+    """
+    Sets the maximum number of threads used by every call to the bridge:
+    the trainers and transforms which have an argument
+    ``number_of_threads`` left to its default use *n* threads and the
+    data is read by at most *n* threads. An explicit
+    ``number_of_threads`` on an estimator is kept. The limit is not
+    given to the ML.NET host environment, whose constructors take no
+    number of threads, so components without such an argument still
+    use their own default.
+
+    :param n: number of threads, None or -1 to use all the cores.
+    """
+    global _num_threads
+    _num_threads = _check_num_threads(n)
+
+
+def get_num_threads():
+    """
+    Returns the maximum number of threads set by :func:`set_num_threads`,
+    None if there is no limit.
+    """
+    return _num_threads
+
+
+def _check_num_threads(n):
+    if n is None or n == -1:
+        return None
+    if not isinstance(n, six.integer_types) or n <= 0:
+        raise ValueError(
+            "The number of threads must be a positive integer or -1, "
+            "not {0}.".format(n))
+    return n
+
+
+def _get_num_threads(n_jobs=None):
+    # n_jobs overrides the process wide setting, 0 means no limit
+    # for the bridge.
+    if n_jobs is None:
+        n = _num_threads
+    else:
+        n = _check_num_threads(n_jobs)
+    return n or 0
+
+
+def _preload_model(model):
+    models = get_model_inputs({'model': model})
+    if models:
+        return _call_model_cache(_CACHE_LOAD, str(model), models=models)
+    return _call_model_cache(_CACHE_LOAD, model)
+
+
+def _warmup(models, verbose):
+    global _warmup_error
+    try:
+        # Starts the .NET runtime and registers the ML.NET assemblies.
+        _call_bridge(get_session_mode(), verbose)
+
+        # Trains a learner on a tiny DataFrame and scores it to compile
+        # the code reading a DataFrame, training, loading a model in
+        # memory and scoring. The pipeline imports this module.
+        from .pipeline import Pipeline
+        from .linear_model import OnlineGradientDescentRegressor
+        data = pd.DataFrame(dict(a=[0., 1.], b=[1., 0.]))
+        pipeline = Pipeline([OnlineGradientDescentRegressor()])
+        pipeline.fit(data[['a']], data['b'], verbose=verbose)
+        pipeline.predict(data[['a']], verbose=verbose)
+
+        for model in models or []:
+            _preload_model(model)
+        _warmup_error = None
+    except Exception as e:
+        _warmup_error = e
+        raise
+    finally:
+        _runtime_ready.set()
+
+
+def _background_warmup(models, verbose):
+    try:
+        _warmup(models, verbose)
+    except Exception:
+        # wait_ready raises it.
+        pass
+
+
+def warmup(models=None, background=False, verbose=0):
+    """
+    Gets the runtime ready before the first call to ``fit`` or
+    ``predict``: starts the .NET runtime, registers the ML.NET
+    assemblies, compiles the code training and scoring a pipeline on a
+    DataFrame and loads *models* in the model cache. The first
+    ``predict`` does not take seconds more than the following ones.
+
+    :param models: paths of the model files, or models of fitted
+        pipelines, to load in the model cache.
+    :param background: if True, the warm-up runs in a daemon thread and
+        the function returns the thread right away. :func:`is_ready` and
+        :func:`wait_ready` tell when it is done.
+    :param verbose: verbosity level of the bridge.
+    """
+    _runtime_ready.clear()
+    if not background:
+        _warmup(models, verbose)
+        return None
+    thread = threading.Thread(target=_background_warmup,
+                              args=(models, verbose),
+                              name='nimbusml-warmup')
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def is_ready():
+    """
+    Tells if the last call to :func:`warmup` is done.
+    """
+    return _runtime_ready.is_set()
+
+
+def wait_ready(timeout=None):
+    """
+    Waits for the last call to :func:`warmup` to be done and raises the
+    exception it failed with, if any.
+
+    :param timeout: maximum time to wait in seconds, None to wait as long
+        as needed.
+    :return: True if the warm-up is done, False if it timed out.
+    """
+    if not _runtime_ready.wait(timeout):
+        return False
+    if _warmup_error is not None:
+        raise _warmup_error
+    return True
+
+
+def enable_featurization_cache(directory=None, max_bytes=2 ** 30):
+    """
+    Enables the cache of the data featurized by the transforms of the
+    pipelines, see the module documentation.
+
+    :param directory: directory of the cache, a new temporary directory
+        if None.
+    :param max_bytes: size of the files of the cache, the least recently
+        used entries are removed once it is reached.
+    """
+    featurization_cache.set_featurization_cache(
+        featurization_cache.FeaturizationCache(directory, max_bytes))
+
+
+def disable_featurization_cache():
+    """
+    Disables the cache of the featurized data, the files of its
+    directory are kept.
+    """
+    featurization_cache.set_featurization_cache(None)
+
+
+def featurization_cache_info():
+    """
+    Returns a dictionary with the directory, the budget (``max_bytes``),
+    the number of entries and their size (``bytes``), and the number of
+    fits which found their data in the cache (``hits``) or not
+    (``misses``), None if the cache is disabled.
+    """
+    cache = featurization_cache.get_featurization_cache()
+    return None if cache is None else cache.info()
+
+
+def clear_featurization_cache():
+    """
+    Removes all the entries of the featurization cache and resets its
+    counters.
+    """
+    cache = featurization_cache.get_featurization_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def set_file_cache(directory=None, max_bytes=2 ** 35):
+    """
+    Sets the directory and the size of the cache of the files read by a
+    :py:class:`FileDataStream <nimbusml.FileDataStream>` created with
+    ``cache='auto'``, see the module documentation.
+
+    :param directory: directory of the cache, ``nimbusml_file_cache`` in
+        the temporary directory if None.
+    :param max_bytes: size of the files of the cache, the least recently
+        used entries are removed once it is reached.
+    """
+    file_cache.set_file_cache(file_cache.FileCache(directory, max_bytes))
+
+
+def file_cache_info():
+    """
+    Returns a dictionary with the directory, the budget (``max_bytes``),
+    the number of files in the cache (``entries``) and their size
+    (``bytes``), and the number of reads which found the file in the
+    cache (``hits``) or converted it (``misses``).
+    """
+    return file_cache.get_file_cache().info()
+
+
+def clear_file_cache():
+    """
+    Removes all the files of the file cache and resets its counters,
+    :meth:`FileDataStream.invalidate_cache` removes only one file.
+    """
+    file_cache.get_file_cache().clear()
+
+
+def _pin_model(path):
+    return _call_model_cache(_CACHE_PIN, path)
+
+
+def _unpin_model(path):
+    return _call_model_cache(_CACHE_UNPIN, path)
+
+
+__all__ = ['open', 'close', 'is_open', 'model_cache_info',
+           'set_model_cache_budget', 'clear_model_cache', 'warmup',
+           'is_ready', 'wait_ready', 'set_num_threads', 'get_num_threads',
+           'enable_featurization_cache', 'disable_featurization_cache',
+           'featurization_cache_info', 'clear_featurization_cache',
+           'set_file_cache', 'file_cache_info', 'clear_file_cache']
@@ -15,8 +15,9 @@ from nimbusml.datasets import get_dataset
 from nimbusml.ensemble import FastForestRegressor, LightGbmRanker, LightGbmRegressor
 from nimbusml.feature_extraction.categorical import OneHotVectorizer, \
     OneHotHashVectorizer
-from nimbusml.linear_model import FastLinearClassifier, \
-    LogisticRegressionBinaryClassifier, LogisticRegressionClassifier
+from nimbusml.linear_model import FastLinearBinaryClassifier, \
+    FastLinearClassifier, LogisticRegressionBinaryClassifier, \
+    LogisticRegressionClassifier
 from nimbusml.model_selection import CV
 from nimbusml.preprocessing import ToKey
 from nimbusml.preprocessing.missing_values import Indicator, Handler
@@ -573,6 +574,59 @@ class TestCvRanker(unittest.TestCase):
         self.check_cv_with_non_defaults(split_start='try_all')
 
 
+class TestCvParallelFolds(unittest.TestCase):
+
+    def check_same_results(self, learner_type, pipeline, X, y=None,
+                           n_folds=4):
+        expected = CV(pipeline).fit(X, y, cv=n_folds, n_jobs=1)
+        for n_jobs in [2, -1]:
+            results = CV(pipeline).fit(X, y, cv=n_folds, n_jobs=n_jobs)
+            self.assertEqual(set(results.keys()), set(expected.keys()))
+            for name in ['metrics', 'metrics_summary', 'predictions']:
+                pd.testing.assert_frame_equal(results[name], expected[name])
+            check_cv_results(learner_type, results, n_folds, {})
+
+    def test_binary(self):
+        pipeline = default_pipeline(
+            learner=LogisticRegressionBinaryClassifier,
+            transforms=default_infert_transforms(),
+            learner_arguments=default_infert_learner_arguments())
+        self.check_same_results('binary', pipeline, infert_ds(5, 'case'))
+
+    def test_thread_sensitive_learner(self):
+        # the results of the learner depend on its number of threads,
+        # which n_jobs does not change once it is set
+        arguments = dict(default_infert_learner_arguments(),
+                         number_of_threads=2)
+        pipeline = default_pipeline(
+            learner=FastLinearBinaryClassifier,
+            transforms=default_infert_transforms(),
+            learner_arguments=arguments)
+        self.check_same_results('binary', pipeline, infert_ds(5, 'case'))
+
+    def test_regressor_df(self):
+        X, y = infert_df('case')
+        self.check_same_results(
+            'regressor', Pipeline([FastForestRegressor(number_of_trees=5)]),
+            X, y)
+
+    def test_graph(self):
+        pipeline = default_pipeline(
+            learner=LogisticRegressionBinaryClassifier,
+            learner_arguments={'feature': 'Features'})
+        graph = json.loads(CV(pipeline).fit(
+            infert_ds(5, 'case'), cv=3, n_jobs=2, dry_run=True))
+        self.assertEqual(graph['parallel_folds'], 2)
+        graph = json.loads(CV(pipeline).fit(
+            infert_ds(5, 'case'), cv=3, dry_run=True))
+        self.assertNotIn('parallel_folds', graph)
+
+    def test_invalid_n_jobs(self):
+        with self.assertRaises(ValueError):
+            CV([FastForestRegressor()]).fit(
+                infert_ds(5, 'case'), n_jobs=0)
+
+
 class TestCvClusterer(unittest.TestCase):
     def test_defaults(self):
         schema = DataSchema.read_schema(infert_file, numeric_dtype=np.float32)
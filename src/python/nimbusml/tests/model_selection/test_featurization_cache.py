@@ -0,0 +1,105 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+import shutil
+import unittest
+
+import nimbusml.session
+import numpy as np
+import pandas as pd
+from nimbusml import Pipeline
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import FastLinearBinaryClassifier
+from nimbusml.preprocessing.normalization import MinMaxScaler
+from numpy.testing import assert_almost_equal
+from sklearn.model_selection import GridSearchCV
+
+np.random.seed(0)
+df = pd.DataFrame(dict(education=np.random.choice(['A', 'B', 'C'], 100),
+                       workclass=np.random.choice(['X', 'Y'], 100),
+                       age=np.random.rand(100) * 50,
+                       y=np.random.choice([0, 1], 100)))
+X = df.drop('y', axis=1)
+y = df['y']
+
+
+def get_pipeline(l2=0.01, output_kind='Indicator'):
+    return Pipeline([
+        ('cat', OneHotVectorizer(output_kind=output_kind) << [
+            'education', 'workclass']),
+        ('scale', MinMaxScaler() << 'age'),
+        ('learner', FastLinearBinaryClassifier(
+            l2_regularization=l2, number_of_threads=1, shuffle=False))])
+
+
+def get_scores(pipeline):
+    return pipeline.predict(X)['Score'].values
+
+
+class TestFeaturizationCache(unittest.TestCase):
+
+    def setUp(self):
+        nimbusml.session.enable_featurization_cache()
+        self.directory = nimbusml.session.featurization_cache_info()[
+            'directory']
+
+    def tearDown(self):
+        nimbusml.session.disable_featurization_cache()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_same_scores(self):
+        first = get_scores(get_pipeline().fit(X, y))
+        second = get_scores(get_pipeline().fit(X, y))
+        info = nimbusml.session.featurization_cache_info()
+        self.assertEqual((info['entries'], info['hits'], info['misses']),
+                         (1, 1, 1))
+        assert_almost_equal(second, first)
+
+        nimbusml.session.disable_featurization_cache()
+        expected = get_scores(get_pipeline().fit(X, y))
+        assert_almost_equal(first, expected, decimal=5)
+
+    def test_keys(self):
+        get_pipeline().fit(X, y)
+        # only the learner changes
+        get_pipeline(l2=0.1).fit(X, y)
+        self.assertEqual(nimbusml.session.featurization_cache_info()['hits'],
+                         1)
+        # a transform changes
+        get_pipeline(output_kind='Binary').fit(X, y)
+        # the data changes
+        get_pipeline().fit(X[:50], y[:50])
+        info = nimbusml.session.featurization_cache_info()
+        self.assertEqual((info['entries'], info['hits'], info['misses']),
+                         (3, 1, 3))
+
+    def test_grid_search(self):
+        param_grid = dict(learner__l2_regularization=[0.001, 0.01, 0.1])
+        grid = GridSearchCV(get_pipeline(), param_grid, cv=3)
+        grid.fit(X, y)
+        info = nimbusml.session.featurization_cache_info()
+        # one entry per training set, the final fit on all the data
+        self.assertEqual(info['entries'], 4)
+        self.assertEqual(info['hits'], 6)
+
+    def test_eviction(self):
+        nimbusml.session.enable_featurization_cache(self.directory,
+                                                    max_bytes=1)
+        get_pipeline().fit(X, y)
+        get_pipeline().fit(X[:50], y[:50])
+        self.assertEqual(
+            nimbusml.session.featurization_cache_info()['entries'], 1)
+        nimbusml.session.clear_featurization_cache()
+        info = nimbusml.session.featurization_cache_info()
+        self.assertEqual((info['entries'], info['bytes']), (0, 0))
+
+    def test_transforms_only(self):
+        Pipeline([OneHotVectorizer() << 'education']).fit_transform(X)
+        self.assertEqual(
+            nimbusml.session.featurization_cache_info()['misses'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
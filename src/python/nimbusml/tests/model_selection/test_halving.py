@@ -0,0 +1,96 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from nimbusml import Pipeline
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import FastLinearBinaryClassifier, \
+    FastLinearRegressor
+from nimbusml.model_selection import HalvingSearch
+from nimbusml.preprocessing.normalization import MinMaxScaler
+
+np.random.seed(0)
+df = pd.DataFrame(dict(education=np.random.choice(['A', 'B', 'C'], 300),
+                       age=np.random.rand(300) * 50))
+df['y'] = ((df['age'] > 25) ^ (np.random.rand(300) > 0.9)).astype(int)
+X = df.drop('y', axis=1)
+y = df['y']
+
+
+def get_pipeline():
+    return Pipeline([
+        ('cat', OneHotVectorizer() << 'education'),
+        ('scale', MinMaxScaler() << 'age'),
+        ('learner', FastLinearBinaryClassifier(number_of_threads=1,
+                                               shuffle=False))])
+
+
+param_grid = dict(learner__l2_regularization=[0.0001, 0.001, 0.01, 0.1, 1.0,
+                                              10.0, 100.0, 1000.0, 10000.0])
+
+
+class TestHalvingSearch(unittest.TestCase):
+
+    def test_search(self):
+        search = HalvingSearch(get_pipeline(), param_grid, random_state=0)
+        search.fit(X, y)
+        self.assertEqual(search.n_resources_, [33, 99, 300])
+        self.assertEqual(
+            list(search.cv_results_.groupby('step').size()), [9, 3, 1])
+        self.assertEqual(search.scoring, 'AUC')
+        self.assertIn(search.best_params_['learner__l2_regularization'],
+                      param_grid['learner__l2_regularization'])
+        last = search.cv_results_[search.cv_results_['step'] == 2]
+        self.assertEqual(last['score'].iloc[0], search.best_score_)
+        self.assertEqual(len(search.best_pipeline_.predict(X)), len(X))
+
+    def test_n_jobs(self):
+        first = HalvingSearch(get_pipeline(), param_grid, random_state=0,
+                              refit=False).fit(X, y)
+        second = HalvingSearch(get_pipeline(), param_grid, random_state=0,
+                               refit=False, n_jobs=3).fit(X, y)
+        self.assertEqual(first.best_params_, second.best_params_)
+        self.assertEqual(list(first.cv_results_['score']),
+                         list(second.cv_results_['score']))
+        self.assertFalse(hasattr(second, 'best_pipeline_'))
+
+    def test_resources(self):
+        search = HalvingSearch(get_pipeline(), param_grid)
+        self.assertEqual(search._get_resources(300, 9), [33, 99, 300])
+        self.assertEqual(search._get_resources(300, 1), [300])
+        # at least two rows per fold in the first step
+        self.assertEqual(search._get_resources(20, 27), [6, 20])
+        search = HalvingSearch(get_pipeline(), param_grid, factor=2,
+                               min_resources=50, max_resources=200)
+        self.assertEqual(search._get_resources(300, 9), [50, 100, 200])
+
+    def test_scoring(self):
+        pipeline = Pipeline([MinMaxScaler() << 'age',
+                             FastLinearRegressor(feature='age',
+                                                 number_of_threads=1,
+                                                 shuffle=False)])
+        search = HalvingSearch(pipeline, {})
+        self.assertEqual((search.scoring, search.greater_is_better),
+                         ('L2(avg)', False))
+        with self.assertRaises(ValueError):
+            HalvingSearch(pipeline, {}, scoring='L1(avg)')
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            HalvingSearch(get_pipeline(), param_grid, factor=1)
+        with self.assertRaises(ValueError):
+            HalvingSearch(get_pipeline(), param_grid, n_jobs=0)
+        with self.assertRaises(ValueError):
+            HalvingSearch([OneHotVectorizer() << 'education'], param_grid)
+        with self.assertRaises(ValueError):
+            HalvingSearch(get_pipeline(), param_grid,
+                          min_resources=500).fit(X, y)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from nimbusml import FileDataStream, Pipeline
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import FastLinearRegressor
+from nimbusml.preprocessing.normalization import MinMaxScaler
+from nimbusml.preprocessing.schema import PrefixColumnConcatenator
+from numpy.testing import assert_almost_equal
+
+np.random.seed(0)
+df = pd.DataFrame({'c%d' % i: np.random.rand(100) for i in range(20)})
+df['education'] = np.random.choice(['A', 'B', 'C'], 100)
+df['y'] = np.random.rand(100)
+
+
+def get_pipeline():
+    return Pipeline([
+        OneHotVectorizer() << 'education',
+        MinMaxScaler() << {'scaled': 'c1'},
+        FastLinearRegressor(feature=['education', 'scaled', 'c2'],
+                            number_of_threads=1, shuffle=False)])
+
+
+class TestColumnProjection(unittest.TestCase):
+
+    def test_dataframe(self):
+        pipeline = get_pipeline().fit(df, 'y')
+        self.assertEqual(pipeline._input_columns, ['c1', 'c2', 'education'])
+        self.assertEqual(pipeline.graph_._input_columns,
+                         ['c1', 'c2', 'education'])
+
+        # the other columns are not needed to score
+        scores = pipeline.predict(df)['Score']
+        assert_almost_equal(
+            scores, pipeline.predict(df[['c1', 'c2', 'education']])['Score'])
+        metrics = pipeline.test(df, 'y')[1]
+        self.assertIn('L2(avg)', metrics.columns)
+
+        clone = pickle.loads(pickle.dumps(pipeline))
+        self.assertEqual(clone._input_columns, pipeline._input_columns)
+        assert_almost_equal(clone.predict(df)['Score'], scores)
+
+    def test_prefix(self):
+        # the columns c0...c19 are read through their prefix
+        pipeline = Pipeline([
+            PrefixColumnConcatenator(columns={'features': 'c'}),
+            FastLinearRegressor(feature='features', number_of_threads=1,
+                                shuffle=False)])
+        pipeline.fit(df.drop('education', axis=1), 'y')
+        self.assertIsNone(pipeline._input_columns)
+        self.assertIsNone(pipeline.graph_._input_columns)
+        scores = pipeline.predict(df)['Score']
+        self.assertEqual(len(scores), len(df))
+        metrics = pipeline.test(df, 'y')[1]
+        self.assertIn('L2(avg)', metrics.columns)
+
+    def test_file(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv',
+                                         delete=False) as f:
+            df.to_csv(f, index=False)
+        try:
+            ds = FileDataStream.read_csv(f.name)
+            pipeline = get_pipeline().fit(ds, 'y')
+            loader = [n for n in pipeline.graph_.nodes
+                      if n.name == 'Data.CustomTextLoader'][0]
+            schema = loader.inputs['CustomSchema']
+            self.assertIn('col=c1:', schema)
+            self.assertIn('col=y:', schema)
+            self.assertNotIn('col=c3:', schema)
+            # the stream keeps all its columns
+            self.assertEqual(len(ds.schema), 22)
+
+            expected = get_pipeline().fit(df, 'y').predict(df)['Score']
+            assert_almost_equal(pipeline.predict(ds)['Score'], expected,
+                                decimal=5)
+        finally:
+            os.remove(f.name)
+
+    def test_transform_keeps_all_columns(self):
+        pipeline = Pipeline([MinMaxScaler() << {'scaled': 'c1'}])
+        out = pipeline.fit_transform(df)
+        self.assertEqual(len(out.columns), len(df.columns) + 1)
+        self.assertIsNone(pipeline._input_columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import unittest
+
+import nimbusml.session
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.linear_model import OnlineGradientDescentRegressor
+from nimbusml.tests.test_utils import split_features_and_label
+from pandas.testing import assert_frame_equal
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+df.Label = [1 if x == 1 else 0 for x in df.Label]
+X, y = split_features_and_label(df, 'Label')
+
+
+class TestCompilePredictor(unittest.TestCase):
+
+    def tearDown(self):
+        nimbusml.session.close()
+
+    def test_same_predictions(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        expected = pipeline.predict(X)
+
+        with pipeline.compile_predictor() as predictor:
+            assert_frame_equal(predictor.predict(X), expected)
+            assert_frame_equal(predictor.predict(X.iloc[3:4]),
+                               expected.iloc[3:4].reset_index(drop=True))
+
+    def test_ndarray_input(self):
+        pipeline = Pipeline([OnlineGradientDescentRegressor()])
+        pipeline.fit(X.values, y.values)
+        expected = pipeline.predict(X.values)
+
+        with pipeline.compile_predictor() as predictor:
+            assert_frame_equal(predictor.predict(X.values), expected)
+            assert_frame_equal(predictor.predict(X.values[0]),
+                               expected.iloc[:1])
+
+    def test_transforms(self):
+        data = get_dataset("infert").as_df()
+        data.columns = [c.replace('.', '_') for c in data.columns]
+        pipeline = Pipeline([
+            OneHotVectorizer(columns={'edu': 'education'}),
+            OnlineGradientDescentRegressor(
+                feature=['edu', 'parity', 'induced'], label='age')])
+        pipeline.fit(data)
+        expected = pipeline.predict(data)
+
+        with pipeline.compile_predictor() as predictor:
+            assert_frame_equal(predictor.predict(data), expected)
+
+    def test_not_fitted(self):
+        with self.assertRaises(ValueError):
+            Pipeline([LogisticRegressionBinaryClassifier()]) \
+                .compile_predictor()
+
+    def test_single_row(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+
+        with pipeline.compile_predictor() as predictor:
+            for i in range(0, len(X), 10):
+                row = X.iloc[i:i + 1]
+                assert_frame_equal(predictor.predict(row),
+                                   pipeline.predict(row))
+
+    def test_session(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+
+        with pipeline.compile_predictor():
+            self.assertTrue(nimbusml.session.is_open())
+        self.assertFalse(nimbusml.session.is_open())
+
+        # the session stays open until the last handle is closed
+        first = pipeline.compile_predictor()
+        second = pipeline.compile_predictor()
+        first.close()
+        self.assertTrue(nimbusml.session.is_open())
+        assert_frame_equal(second.predict(X), pipeline.predict(X))
+        second.close()
+        self.assertFalse(nimbusml.session.is_open())
+
+        # a session opened by the caller stays open
+        nimbusml.session.open()
+        with pipeline.compile_predictor():
+            pass
+        self.assertTrue(nimbusml.session.is_open())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.internal.utils.dataframes import resolve_dense_matrix
+from nimbusml.linear_model import FastLinearRegressor
+from nimbusml.preprocessing.normalization import MinMaxScaler
+from nimbusml.tests.test_utils import split_features_and_label
+from numpy.testing import assert_almost_equal
+from pandas import DataFrame
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+X, y = split_features_and_label(df, 'Label')
+X.columns = ['F' + str(i) for i in range(X.shape[1])]
+
+
+def get_pipeline():
+    return Pipeline([FastLinearRegressor(number_of_threads=1, shuffle=False)])
+
+
+def get_scores(pipeline, data):
+    return pipeline.predict(data)['Score'].values
+
+
+class TestDenseInput(unittest.TestCase):
+
+    def test_resolve_dense_matrix(self):
+        values = X.values.astype(np.float32)
+        data = resolve_dense_matrix(values)
+        self.assertIs(data['dense']['values'], values)
+        self.assertEqual(data['dense']['colCount'], 4)
+        self.assertEqual(data['..mlColTypes'], ['f'])
+        with self.assertRaises(TypeError):
+            resolve_dense_matrix(np.asfortranarray(values))
+
+    def test_same_predictions(self):
+        for dtype in [np.float32, np.float64]:
+            expected = get_scores(
+                get_pipeline().fit(X.astype(dtype), y), X)
+            pipeline = get_pipeline()
+            pipeline.fit(X.values.astype(dtype), y.values)
+            self.assertEqual(pipeline.last_node._vector_input_dtype, dtype)
+            assert_almost_equal(get_scores(pipeline, X.values), expected,
+                                decimal=5)
+            # a DataFrame with the default column names is an array
+            assert_almost_equal(
+                get_scores(pipeline, DataFrame(X.values)), expected,
+                decimal=5)
+
+    def test_not_contiguous(self):
+        pipeline = get_pipeline()
+        pipeline.fit(np.asfortranarray(X.values), y.values)
+        self.assertIsNone(pipeline.last_node._vector_input_dtype)
+        self.assertEqual(len(pipeline.predict(X.values)), len(X))
+
+    def test_transforms(self):
+        pipeline = Pipeline([MinMaxScaler(), FastLinearRegressor()])
+        pipeline.fit(X.values, y.values)
+        self.assertIsNone(pipeline.last_node._vector_input_dtype)
+        self.assertEqual(len(pipeline.predict(X.values)), len(X))
+
+    def test_save_load_model(self):
+        pipeline = get_pipeline()
+        pipeline.fit(X.values.astype(np.float32), y.values)
+        expected = get_scores(pipeline, X.values)
+        (fd, model_filename) = tempfile.mkstemp(suffix='.zip')
+        os.close(fd)
+        try:
+            pipeline.save_model(model_filename)
+            for loaded in [Pipeline(model=model_filename), Pipeline()]:
+                if loaded.model is None:
+                    loaded.load_model(model_filename)
+                self.assertEqual(loaded._vector_input_dtype, np.float32)
+                assert_almost_equal(
+                    get_scores(loaded, X.values), expected, decimal=5)
+                # so does a pickled copy
+                assert_almost_equal(
+                    get_scores(pickle.loads(pickle.dumps(loaded)),
+                               X.values),
+                    expected, decimal=5)
+        finally:
+            os.remove(model_filename)
+
+    def test_estimator(self):
+        estimator = FastLinearRegressor(number_of_threads=1, shuffle=False)
+        estimator.fit(X.values, y.values)
+        expected = get_scores(get_pipeline().fit(X, y), X)
+        assert_almost_equal(estimator.predict(X.values).values, expected,
+                            decimal=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@ import pandas as pd
 
 from nimbusml import Pipeline
 from nimbusml.datasets import get_dataset
+from nimbusml.internal.utils.models import ModelBytes
 from nimbusml.feature_extraction.categorical import OneHotVectorizer
 from nimbusml.linear_model import FastLinearBinaryClassifier, OnlineGradientDescentRegressor
 from nimbusml.utils import get_X_y
@@ -167,10 +168,10 @@ class TestLoadSave(unittest.TestCase):
         with open(pickle_filename, 'wb') as f:
             pickle.dump(model_nimbusml, f)
 
-        # Remove the pipeline model from disk so
-        # that the unpickled pipeline is forced
-        # to get its model from the pickled file.
-        os.remove(model_nimbusml.model)
+        # Drop the pipeline model so that the
+        # unpickled pipeline is forced to get
+        # its model from the pickled file.
+        model_nimbusml.model = None
 
         with open(pickle_filename, "rb") as f:
             model_nimbusml_pickle = pickle.load(f)
@@ -360,8 +361,8 @@ class TestLoadSave(unittest.TestCase):
         with open(pickle_filename, 'wb') as f:
             pickle.dump(pipeline, f)
 
-        os.remove(pipeline.model)
-        os.remove(pipeline.predictor_model)
+        pipeline.model = None
+        pipeline.predictor_model = None
 
         with open(pickle_filename, "rb") as f:
             pipeline_pickle = pickle.load(f)
@@ -375,6 +376,36 @@ class TestLoadSave(unittest.TestCase):
 
         self.assertTrue(result_1.equals(result_2))
 
+    def test_model_stays_in_memory(self):
+        temp_files = set(os.listdir(tempfile.gettempdir()))
+
+        pipeline = Pipeline([OnlineGradientDescentRegressor()])
+        pipeline.fit(train[['age', 'fnlwgt']], label)
+        self.assertIsInstance(pipeline.model, ModelBytes)
+        result_1 = pipeline.predict(test[['age', 'fnlwgt']])
+        pipeline_pickle = pickle.loads(pickle.dumps(pipeline))
+        self.assertIsInstance(pipeline_pickle.model, ModelBytes)
+        result_2 = pipeline_pickle.predict(test[['age', 'fnlwgt']])
+
+        self.assertTrue(result_1.equals(result_2))
+        new_files = set(os.listdir(tempfile.gettempdir())) - temp_files
+        self.assertEqual(
+            [f for f in new_files if f.endswith('.bin')], [])
+
+    def test_save_model_of_model_in_memory(self):
+        pipeline = Pipeline([OnlineGradientDescentRegressor()])
+        pipeline.fit(train[['age', 'fnlwgt']], label)
+        model_filename = get_temp_file(suffix='.zip')
+        pipeline.save_model(model_filename)
+        with open(model_filename, 'rb') as f:
+            self.assertEqual(f.read(), pipeline.model.data)
+
+        loaded = Pipeline()
+        loaded.load_model(model_filename)
+        self.assertTrue(loaded.predict(test[['age', 'fnlwgt']]).equals(
+            pipeline.predict(test[['age', 'fnlwgt']])))
+        os.remove(model_filename)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,76 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import unittest
+
+import numpy as np
+import pandas as pd
+from nimbusml import Pipeline, FileDataStream
+from nimbusml.datasets import get_dataset
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.tests.test_utils import split_features_and_label
+from pandas.testing import assert_frame_equal
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+df.Label = [1 if x == 1 else 0 for x in df.Label]
+X, y = split_features_and_label(df, 'Label')
+
+infert_file = get_dataset('infert').as_filepath()
+
+
+def concat_chunks(chunks):
+    return pd.concat(chunks, ignore_index=True)
+
+
+class TestPredictIter(unittest.TestCase):
+
+    def test_same_predictions(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        expected = pipeline.predict(X)
+
+        chunks = list(pipeline.predict_iter(X, chunksize=40))
+        self.assertEqual([len(chunk) for chunk in chunks], [40, 40, 40, 30])
+        assert_frame_equal(concat_chunks(chunks), expected)
+
+    def test_chunksize_larger_than_data(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        chunks = list(pipeline.predict_iter(X, chunksize=1000))
+        self.assertEqual(len(chunks), 1)
+        assert_frame_equal(chunks[0], pipeline.predict(X))
+
+    def test_transform_iter(self):
+        data = FileDataStream.read_csv(infert_file, sep=',',
+                                      numeric_dtype=np.float32)
+        pipeline = Pipeline([OneHotVectorizer() << 'education'])
+        pipeline.fit(data)
+        expected = pipeline.transform(data)
+
+        chunks = list(pipeline.transform_iter(data, chunksize=100))
+        self.assertEqual(len(chunks), 3)
+        assert_frame_equal(concat_chunks(chunks), expected)
+
+    def test_stop_early(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        chunks = pipeline.predict_iter(X, chunksize=10)
+        first = next(chunks)
+        chunks.close()
+        self.assertEqual(len(first), 10)
+        self.assertEqual(len(pipeline.predict(X)), len(X))
+
+    def test_errors(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        with self.assertRaises(ValueError):
+            pipeline.predict_iter(X)
+        pipeline.fit(X, y)
+        with self.assertRaises(ValueError):
+            list(pipeline.predict_iter(X, chunksize=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
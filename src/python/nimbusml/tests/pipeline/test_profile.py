@@ -0,0 +1,61 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import unittest
+
+import numpy as np
+from nimbusml import Pipeline, FileDataStream
+from nimbusml.datasets import get_dataset
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.preprocessing.normalization import MinMaxScaler
+from pandas.testing import assert_frame_equal
+
+path = get_dataset('infert').as_filepath()
+data = FileDataStream.read_csv(path, sep=',', numeric_dtype=np.float32)
+
+
+def get_pipeline():
+    return Pipeline([
+        OneHotVectorizer() << 'education_str',
+        MinMaxScaler() << ['age', 'parity'],
+        LogisticRegressionBinaryClassifier(
+            feature=['education_str', 'age', 'parity'],
+            label='case', number_of_threads=1)])
+
+
+class TestProfile(unittest.TestCase):
+
+    def test_fit_profile(self):
+        pipeline = get_pipeline()
+        pipeline.fit(data, profile=True)
+        profile = pipeline.last_profile_
+        self.assertEqual(list(profile.columns),
+                         ['Step', 'Name', 'Time', 'Rows', 'AllocatedBytes'])
+        names = list(profile['Name'])
+        for name in ['Data.CustomTextLoader',
+                     'Transforms.CategoricalOneHotVectorizer',
+                     'Transforms.MinMaxNormalizer',
+                     'Trainers.LogisticRegressionBinaryClassifier',
+                     'Reading outputs']:
+            self.assertIn(name, names)
+        self.assertTrue((profile['Time'] >= 0).all())
+        self.assertEqual(list(profile['Step']), list(range(len(profile))))
+
+    def test_same_results(self):
+        expected = get_pipeline().fit(data).predict(data)
+        pipeline = get_pipeline()
+        pipeline.fit(data, profile=True)
+        scores = pipeline.predict(data, profile=True)
+        assert_frame_equal(scores, expected)
+        self.assertIn('Reading outputs', list(pipeline.last_profile_['Name']))
+
+    def test_no_profile(self):
+        pipeline = get_pipeline()
+        pipeline.fit(data)
+        self.assertIsNone(pipeline.last_profile_)
+
+
+if __name__ == '__main__':
+    unittest.main()
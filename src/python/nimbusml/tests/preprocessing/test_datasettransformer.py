@@ -3,6 +3,7 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------------------------
 import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -17,6 +18,14 @@ from nimbusml import FileDataStream
 
 seed = 0
 
+
+def save_to_file(pipeline):
+    (fd, filename) = tempfile.mkstemp(suffix='.zip')
+    os.close(fd)
+    pipeline.save_model(filename)
+    return filename
+
+
 train_data = {'c0': ['a', 'b', 'a', 'b'],
               'c1': [1, 2, 3, 4],
               'c2': [2, 3, 4, 5]}
@@ -50,14 +59,15 @@ class TestDatasetTransformer(unittest.TestCase):
         # Create combined pipeline
         transform_pipeline = Pipeline([RangeFilter(min=0.0, max=rf_max) << 'c2'])
         transform_pipeline.fit(train_df_updated)
+        transform_model = save_to_file(transform_pipeline)
 
         combined_pipeline = Pipeline([
-            DatasetTransformer(transform_model=transform_pipeline.model),
+            DatasetTransformer(transform_model=transform_model),
             OnlineGradientDescentRegressor(label='c2', feature=['c1'])
         ], random_state=seed)
         combined_pipeline.fit(train_df_updated)
 
-        os.remove(transform_pipeline.model)
+        os.remove(transform_model)
 
         result_2 = combined_pipeline.predict(test_df_updated)
 
@@ -77,14 +87,15 @@ class TestDatasetTransformer(unittest.TestCase):
         # Create combined pipeline
         transform_pipeline = Pipeline([OneHotVectorizer() << 'c0'], random_state=seed)
         transform_pipeline.fit(train_df)
+        transform_model = save_to_file(transform_pipeline)
 
         combined_pipeline = Pipeline([
-            DatasetTransformer(transform_model=transform_pipeline.model),
+            DatasetTransformer(transform_model=transform_model),
             OnlineGradientDescentRegressor(label='c2', feature=['c0', 'c1'])
         ], random_state=seed)
         combined_pipeline.fit(train_df)
 
-        os.remove(transform_pipeline.model)
+        os.remove(transform_model)
 
         result_2 = combined_pipeline.predict(test_df)
 
@@ -112,14 +123,15 @@ class TestDatasetTransformer(unittest.TestCase):
         # Create combined pipeline
         transform_pipeline = Pipeline([OneHotVectorizer() << 'c0'], random_state=seed)
         transform_pipeline.fit(train_data_stream)
+        transform_model = save_to_file(transform_pipeline)
 
         combined_pipeline = Pipeline([
-            DatasetTransformer(transform_model=transform_pipeline.model),
+            DatasetTransformer(transform_model=transform_model),
             OnlineGradientDescentRegressor(label='c2', feature=['c0', 'c1'])
         ], random_state=seed)
         combined_pipeline.fit(train_data_stream)
 
-        os.remove(transform_pipeline.model)
+        os.remove(transform_model)
 
         result_2 = combined_pipeline.predict(test_data_stream)
 
@@ -145,19 +157,21 @@ class TestDatasetTransformer(unittest.TestCase):
         # Create combined pipeline
         transform_pipeline1 = Pipeline([RangeFilter(min=0.0, max=rf_max) << 'c2'])
         transform_pipeline1.fit(train_df)
+        transform_model1 = save_to_file(transform_pipeline1)
 
         transform_pipeline2 = Pipeline([OneHotVectorizer() << 'c0'], random_state=seed)
         transform_pipeline2.fit(train_df)
+        transform_model2 = save_to_file(transform_pipeline2)
 
         combined_pipeline = Pipeline([
-            DatasetTransformer(transform_model=transform_pipeline1.model),
-            DatasetTransformer(transform_model=transform_pipeline2.model),
+            DatasetTransformer(transform_model=transform_model1),
+            DatasetTransformer(transform_model=transform_model2),
             OnlineGradientDescentRegressor(label='c2', feature=['c0', 'c1'])
         ], random_state=seed)
         combined_pipeline.fit(train_df)
 
-        os.remove(transform_pipeline1.model)
-        os.remove(transform_pipeline2.model)
+        os.remove(transform_model1)
+        os.remove(transform_model2)
 
         result_2 = combined_pipeline.predict(test_df)
 
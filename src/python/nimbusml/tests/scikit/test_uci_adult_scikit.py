@@ -3,7 +3,6 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------------------------
 
-import os
 import pickle
 import unittest
 
@@ -125,7 +124,7 @@ class TestUciAdultScikit(unittest.TestCase):
         # Unpickle model and score. We should get the exact same accuracy as
         # above
         s = pickle.dumps(ftree)
-        os.remove(ftree.model_)
+        ftree.model_ = None
         ftree2 = pickle.loads(s)
         scores2 = ftree2.predict(X_test)
         accu2 = np.mean(y_test.values.ravel() == scores2.values)
@@ -145,7 +144,7 @@ class TestUciAdultScikit(unittest.TestCase):
         # Unpickle transform and generate output.
         # We should get the exact same output as above
         s = pickle.dumps(cat)
-        os.remove(cat.model_)
+        cat.model_ = None
         cat2 = pickle.loads(s)
         out2 = cat2.transform(X_train)
         assert_equal(
@@ -174,8 +173,8 @@ class TestUciAdultScikit(unittest.TestCase):
         # Unpickle model and score. We should get the exact same accuracy as
         # above
         s = pickle.dumps(pipe)
-        os.remove(cat.model_)
-        os.remove(ftree.model_)
+        cat.model_ = None
+        ftree.model_ = None
         pipe2 = pickle.loads(s)
 
         scores2 = pipe2.predict(X_test)
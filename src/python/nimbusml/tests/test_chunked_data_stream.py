@@ -0,0 +1,71 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import unittest
+
+import numpy as np
+import pandas as pd
+from nimbusml import ChunkedDataStream, Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.preprocessing import FromKey
+from nimbusml.preprocessing.schema import ColumnConcatenator
+from pandas.testing import assert_frame_equal
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+df.Label = [1 if x == 1 else 0 for x in df.Label]
+features = ['Sepal_Length', 'Sepal_Width', 'Petal_Length', 'Petal_Width']
+
+
+def split(data, chunksize):
+    return [data.iloc[i:i + chunksize] for i in range(0, len(data), chunksize)]
+
+
+class TestChunkedDataStream(unittest.TestCase):
+
+    def test_fit_same_model(self):
+        expected = Pipeline([LogisticRegressionBinaryClassifier(
+            number_of_threads=1)])
+        expected.fit(df[features], df['Label'])
+
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier(
+            number_of_threads=1)])
+        pipeline.fit(ChunkedDataStream(iter(split(df, 40))), 'Label')
+
+        assert_frame_equal(pipeline.predict(df[features]),
+                           expected.predict(df[features]))
+
+    def test_single_pass_without_spill(self):
+        pipeline = Pipeline([ColumnConcatenator() << {'f': features}])
+        data = ChunkedDataStream(split(df, 32), spill=False)
+        result = pipeline.fit_transform(data)
+        self.assertEqual(len(result), len(df))
+        np.testing.assert_almost_equal(result['f.Sepal_Length'].values,
+                                       df['Sepal_Length'].values)
+
+    def test_iterator_is_read_once(self):
+        data = ChunkedDataStream(iter(split(df, 50)))
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(data, 'Label')
+        with self.assertRaises(RuntimeError):
+            pipeline.fit(data, 'Label')
+
+    def test_categories_of_first_chunk(self):
+        chunks = [pd.DataFrame(dict(cat=pd.Categorical(['a', 'b']))),
+                  pd.DataFrame(dict(cat=pd.Categorical(['b', 'c'])))]
+        result = (FromKey() << 'cat').fit_transform(ChunkedDataStream(chunks))
+        self.assertEqual(list(result['cat'][:3]), ['a', 'b', 'b'])
+        # 'c' is not a category of the first chunk.
+        self.assertNotEqual(result['cat'][3], 'c')
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            ChunkedDataStream(df)
+        with self.assertRaises(ValueError):
+            ChunkedDataStream([])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import threading
+import unittest
+
+import numpy as np
+import six
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.tests.test_utils import split_features_and_label
+
+if not six.PY2:
+    from concurrent.futures import ThreadPoolExecutor
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+df.Label = [1 if x == 1 else 0 for x in df.Label]
+X, y = split_features_and_label(df, 'Label')
+
+infert = get_dataset("infert").as_df()
+infert.columns = [c.replace('.', '_') for c in infert.columns]
+
+
+@unittest.skipIf(six.PY2, "concurrent.futures is not available")
+class TestConcurrentCalls(unittest.TestCase):
+
+    def test_concurrent_predictions(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        expected = pipeline.predict_proba(X)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(pipeline.predict_proba, X)
+                       for i in range(64)]
+            results = [f.result() for f in futures]
+
+        for result in results:
+            np.testing.assert_almost_equal(result, expected)
+
+    def test_concurrent_fit_and_transform(self):
+        # Text input goes through the native callbacks which take the GIL
+        # back while the other graphs run.
+        def fit_transform(i):
+            pipeline = Pipeline([OneHotVectorizer() << ['education']])
+            return pipeline.fit_transform(infert)
+
+        expected = fit_transform(0)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(fit_transform, range(16)))
+
+        for result in results:
+            self.assertEqual(list(result.columns), list(expected.columns))
+            np.testing.assert_array_equal(result.values, expected.values)
+
+    def test_python_threads_run_during_fit(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        calls = [0]
+        done = threading.Event()
+
+        def fit():
+            try:
+                pipeline.fit(X, y)
+            finally:
+                done.set()
+
+        thread = threading.Thread(target=fit)
+        thread.start()
+        # The main thread keeps running python code while the graph executes.
+        while not done.is_set():
+            calls[0] += 1
+            done.wait(0.001)
+        thread.join()
+
+        self.assertGreater(calls[0], 1)
+        self.assertEqual(len(pipeline.predict(X)), len(X))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import nimbusml.session
+import numpy as np
+import pandas as pd
+from nimbusml import FileDataStream, Pipeline
+from nimbusml.feature_extraction.categorical import OneHotVectorizer
+from nimbusml.linear_model import FastLinearRegressor
+from nimbusml.model_selection import CV
+from numpy.testing import assert_almost_equal
+
+np.random.seed(0)
+df = pd.DataFrame(dict(education=np.random.choice(['A', 'B', 'C'], 100),
+                       age=np.random.rand(100) * 50,
+                       y=np.random.rand(100)))
+
+
+def get_pipeline():
+    return Pipeline([
+        OneHotVectorizer() << 'education',
+        FastLinearRegressor(feature=['education', 'age'],
+                            number_of_threads=1, shuffle=False)])
+
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        nimbusml.session.set_file_cache(
+            os.path.join(self.directory, 'cache'))
+        self.filename = os.path.join(self.directory, 'data.csv')
+        df.to_csv(self.filename, index=False)
+
+    def tearDown(self):
+        nimbusml.session.set_file_cache()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get_counts(self):
+        info = nimbusml.session.file_cache_info()
+        return info['entries'], info['hits'], info['misses']
+
+    def test_same_predictions(self):
+        ds = FileDataStream.read_csv(self.filename, cache='auto')
+        pipeline = get_pipeline().fit(ds, 'y')
+        self.assertEqual(self.get_counts(), (1, 0, 1))
+        scores = pipeline.predict(ds)['Score'].values
+        self.assertEqual(self.get_counts(), (1, 1, 1))
+
+        expected_ds = FileDataStream.read_csv(self.filename)
+        expected = get_pipeline().fit(expected_ds, 'y')
+        assert_almost_equal(scores, expected.predict(expected_ds)['Score'])
+        self.assertEqual(self.get_counts(), (1, 1, 1))
+
+    def test_roles_and_cv(self):
+        ds = FileDataStream.read_csv(self.filename, cache='auto')
+        ds._set_role('Label', 'y')
+        metrics = get_pipeline().fit(ds).test(ds)[1]
+        self.assertIn('L2(avg)', metrics.columns)
+        results = CV(get_pipeline()).fit(ds, cv=3)
+        self.assertEqual(len(results['metrics']), 3)
+        self.assertEqual(self.get_counts()[0], 1)
+
+    def test_head_does_not_convert(self):
+        ds = FileDataStream.read_csv(self.filename, cache='auto')
+        self.assertEqual(len(ds.head(3)), 3)
+        self.assertEqual(self.get_counts(), (0, 0, 0))
+        self.assertEqual(ds.clone().cache, 'auto')
+
+    def test_invalidation(self):
+        ds = FileDataStream.read_csv(self.filename, cache='auto')
+        get_pipeline().fit(ds, 'y')
+        self.assertTrue(ds.invalidate_cache())
+        self.assertFalse(ds.invalidate_cache())
+        get_pipeline().fit(ds, 'y')
+        self.assertEqual(self.get_counts(), (1, 0, 2))
+
+        # a modified file is converted again
+        df[:50].to_csv(self.filename, index=False)
+        os.utime(self.filename, (0, 0))
+        get_pipeline().fit(ds, 'y')
+        self.assertEqual(self.get_counts(), (2, 0, 3))
+
+        nimbusml.session.clear_file_cache()
+        self.assertEqual(self.get_counts(), (0, 0, 0))
+
+    def test_max_bytes(self):
+        nimbusml.session.set_file_cache(
+            os.path.join(self.directory, 'cache'), max_bytes=1)
+        ds = FileDataStream.read_csv(self.filename, cache='auto')
+        get_pipeline().fit(ds, 'y')
+        other = os.path.join(self.directory, 'other.csv')
+        df[:50].to_csv(other, index=False)
+        get_pipeline().fit(FileDataStream.read_csv(other, cache='auto'), 'y')
+        self.assertEqual(self.get_counts(), (1, 0, 2))
+
+    def test_invalid_cache(self):
+        with self.assertRaises(ValueError):
+            FileDataStream.read_csv(self.filename, cache='always')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import unittest
+
+import nimbusml
+import nimbusml.linear_model
+
+# Maximum time in seconds to import nimbusml in a new process.
+IMPORT_TIME_BUDGET = 0.5
+
+
+def run_python(code):
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return output.decode('utf-8').strip()
+
+
+@unittest.skipIf(sys.version_info < (3, 7),
+                 "module __getattr__ needs python 3.7")
+class TestImportTime(unittest.TestCase):
+
+    def test_import_is_lazy(self):
+        modules = run_python(
+            "import sys, nimbusml\n"
+            "print(' '.join(sys.modules))").split()
+        for name in ['sklearn', 'scipy', 'pandas', 'nimbusml.pipeline']:
+            self.assertNotIn(name, modules)
+        entrypoints = [m for m in modules
+                       if m.startswith('nimbusml.internal.entrypoints')]
+        self.assertEqual(entrypoints, [])
+
+    @unittest.skipUnless(os.environ.get('NIMBUSML_TIMING_TESTS'),
+                         "timing test, set NIMBUSML_TIMING_TESTS to run it")
+    def test_import_time_budget(self):
+        code = ("import time\n"
+                "begin = time.perf_counter()\n"
+                "import nimbusml\n"
+                "print(time.perf_counter() - begin)")
+        elapsed = min(float(run_python(code)) for i in range(3))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_only_used_estimators_are_imported(self):
+        loaded = run_python(
+            "import sys\n"
+            "from nimbusml.linear_model import FastLinearRegressor\n"
+            "print('nimbusml.pipeline' in sys.modules, "
+            "'nimbusml.linear_model.sgdbinaryclassifier' in sys.modules)")
+        self.assertEqual(loaded, 'True False')
+
+    def test_attributes(self):
+        self.assertIs(nimbusml.Pipeline,
+                      nimbusml.pipeline.Pipeline)
+        for name in nimbusml.linear_model.__all__:
+            self.assertIn(name, dir(nimbusml.linear_model))
+            self.assertTrue(hasattr(nimbusml.linear_model, name))
+        with self.assertRaises(AttributeError):
+            nimbusml.NotAnEstimator
+
+
+if __name__ == '__main__':
+    unittest.main()
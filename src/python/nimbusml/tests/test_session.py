@@ -0,0 +1,215 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import nimbusml
+import nimbusml.session
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.tests.test_utils import split_features_and_label
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+df.Label = [1 if x == 1 else 0 for x in df.Label]
+X, y = split_features_and_label(df, 'Label')
+
+
+class TestSession(unittest.TestCase):
+
+    def tearDown(self):
+        nimbusml.session.close()
+
+    def test_open_close(self):
+        assert not nimbusml.session.is_open()
+        nimbusml.session.open()
+        assert nimbusml.session.is_open()
+        # opening twice does nothing
+        nimbusml.session.open()
+        assert nimbusml.session.is_open()
+        nimbusml.session.close()
+        assert not nimbusml.session.is_open()
+        # closing twice does nothing
+        nimbusml.session.close()
+        assert not nimbusml.session.is_open()
+
+    def test_same_results_with_session(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        expected = pipeline.predict_proba(X)
+
+        nimbusml.session.open()
+        pipeline.fit(X, y)
+        np.testing.assert_almost_equal(pipeline.predict_proba(X), expected)
+        np.testing.assert_almost_equal(pipeline.predict_proba(X), expected)
+
+    def test_session_reuses_model(self):
+        # The timings are measured by benchmarks/latency.py.
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        X_small = X.iloc[:5]
+        n = 20
+
+        nimbusml.session.open()
+        expected = pipeline.predict(X_small)
+        info = nimbusml.session.model_cache_info()
+        for i in range(n):
+            pipeline.predict(X_small)
+        # every call finds the model deserialized by the first one
+        after = nimbusml.session.model_cache_info()
+        self.assertEqual(after['misses'], info['misses'])
+        self.assertGreaterEqual(after['hits'], info['hits'] + n)
+        self.assertTrue(nimbusml.session.is_open())
+        np.testing.assert_array_equal(
+            pipeline.predict(X_small).values, expected.values)
+
+
+class TestModelCache(unittest.TestCase):
+
+    def tearDown(self):
+        nimbusml.session.set_model_cache_budget(1 << 30)
+        nimbusml.session.clear_model_cache()
+
+    def test_hits_and_misses(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        nimbusml.session.clear_model_cache()
+
+        expected = pipeline.predict_proba(X)
+        info = nimbusml.session.model_cache_info()
+        self.assertEqual(info['hits'], 0)
+        self.assertGreater(info['misses'], 0)
+        self.assertGreater(info['count'], 0)
+
+        misses = info['misses']
+        np.testing.assert_almost_equal(pipeline.predict_proba(X), expected)
+        info = nimbusml.session.model_cache_info()
+        self.assertGreater(info['hits'], 0)
+        self.assertEqual(info['misses'], misses)
+
+    def test_disabled_cache(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        info = nimbusml.session.set_model_cache_budget(0)
+        self.assertEqual(info['count'], 0)
+        pipeline.predict(X)
+        pipeline.predict(X)
+        info = nimbusml.session.model_cache_info()
+        self.assertEqual(info['hits'], 0)
+        self.assertEqual(info['count'], 0)
+
+    def test_pinned_model_is_not_evicted(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        pipeline.pin_model()
+        try:
+            pipeline.predict(X)
+            # a budget of one byte evicts every model except the pinned one
+            info = nimbusml.session.set_model_cache_budget(1)
+            self.assertGreater(info['count'], 0)
+
+            pipeline.predict(X)
+            info = nimbusml.session.model_cache_info()
+            self.assertGreater(info['hits'], 0)
+        finally:
+            pipeline.unpin_model()
+        info = nimbusml.session.model_cache_info()
+        self.assertEqual(info['count'], 0)
+
+    def test_pin_unfitted_model(self):
+        with self.assertRaises(ValueError):
+            Pipeline([LogisticRegressionBinaryClassifier()]).pin_model()
+
+
+class TestWarmup(unittest.TestCase):
+
+    def tearDown(self):
+        nimbusml.session.clear_model_cache()
+
+    def test_warmup_loads_models(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        (fd, path) = tempfile.mkstemp(suffix='.zip')
+        os.close(fd)
+        try:
+            pipeline.save_model(path)
+            expected = pipeline.predict_proba(X)
+            nimbusml.session.clear_model_cache()
+
+            nimbusml.warmup(models=[path])
+            self.assertTrue(nimbusml.session.is_ready())
+            misses = nimbusml.session.model_cache_info()['misses']
+
+            loaded = Pipeline()
+            loaded.load_model(path)
+            np.testing.assert_almost_equal(loaded.predict_proba(X), expected)
+            info = nimbusml.session.model_cache_info()
+            self.assertGreater(info['hits'], 0)
+            self.assertEqual(info['misses'], misses)
+        finally:
+            os.remove(path)
+
+    def test_warmup_model_in_memory(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        nimbusml.session.clear_model_cache()
+        nimbusml.warmup(models=[pipeline.model])
+        self.assertGreater(nimbusml.session.model_cache_info()['count'], 0)
+
+    def test_background(self):
+        thread = nimbusml.warmup(background=True)
+        self.assertTrue(nimbusml.session.wait_ready(timeout=600))
+        self.assertTrue(nimbusml.session.is_ready())
+        thread.join()
+
+    def test_background_error(self):
+        nimbusml.warmup(models=['does_not_exist.zip'], background=True)
+        with self.assertRaises(RuntimeError):
+            nimbusml.session.wait_ready(timeout=600)
+
+
+class TestNumThreads(unittest.TestCase):
+
+    def tearDown(self):
+        nimbusml.set_num_threads(None)
+
+    def test_set_num_threads(self):
+        self.assertIsNone(nimbusml.get_num_threads())
+        nimbusml.set_num_threads(2)
+        self.assertEqual(nimbusml.get_num_threads(), 2)
+        nimbusml.set_num_threads(-1)
+        self.assertIsNone(nimbusml.get_num_threads())
+        with self.assertRaises(ValueError):
+            nimbusml.set_num_threads(0)
+        with self.assertRaises(ValueError):
+            nimbusml.set_num_threads(1.5)
+
+    def test_same_model_as_one_thread(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier(
+            number_of_threads=1)])
+        pipeline.fit(X, y)
+        expected = pipeline.predict_proba(X)
+
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y, n_jobs=1)
+        np.testing.assert_almost_equal(pipeline.predict_proba(X), expected)
+
+        nimbusml.set_num_threads(1)
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        np.testing.assert_almost_equal(
+            pipeline.predict_proba(X, n_jobs=2), expected)
+
+    def test_invalid_n_jobs(self):
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        with self.assertRaises(ValueError):
+            pipeline.fit(X, y, n_jobs=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import json
+import os
+import tempfile
+import unittest
+
+import nimbusml.tracing
+from nimbusml import Pipeline
+from nimbusml.datasets import get_dataset
+from nimbusml.linear_model import LogisticRegressionBinaryClassifier
+from nimbusml.tests.test_utils import split_features_and_label
+
+df = get_dataset("iris").as_df()
+df.drop(['Species'], inplace=True, axis=1)
+df.Label = [1 if x == 1 else 0 for x in df.Label]
+X, y = split_features_and_label(df, 'Label')
+
+
+def span_names(span):
+    yield span['name']
+    for child in span['children']:
+        for name in span_names(child):
+            yield name
+
+
+class TestTracing(unittest.TestCase):
+
+    def tearDown(self):
+        nimbusml.tracing.disable()
+
+    def test_callback(self):
+        spans = []
+        nimbusml.tracing.enable(callback=spans.append)
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        pipeline.predict(X)
+        nimbusml.tracing.disable()
+
+        # the constructors are traced too
+        spans = [s for s in spans if not s['name'].endswith('__init__')]
+        self.assertEqual([s['name'] for s in spans],
+                         ['Pipeline.fit', 'Pipeline.predict'])
+        for s in spans:
+            names = list(span_names(s))
+            for name in ['preprocess_X_y', 'resolve_dataframe',
+                         'serialize_graph', 'px_call']:
+                self.assertIn(name, names)
+            self.assertGreater(s['duration'], 0)
+        self.assertIn('resolve_output', list(span_names(spans[1])))
+
+    def test_nothing_recorded_once_disabled(self):
+        spans = []
+        nimbusml.tracing.enable(callback=spans.append)
+        nimbusml.tracing.disable()
+        pipeline = Pipeline([LogisticRegressionBinaryClassifier()])
+        pipeline.fit(X, y)
+        self.assertEqual(spans, [])
+
+    def test_bytes(self):
+        spans = []
+        nimbusml.tracing.enable(callback=spans.append)
+        with nimbusml.tracing.span('outer') as outer:
+            with nimbusml.tracing.span('inner') as inner:
+                inner.add_bytes(X)
+            outer.add_bytes(10)
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(spans[0]['bytes'], 10)
+        inner = spans[0]['children'][0]
+        self.assertEqual(inner['name'], 'inner')
+        self.assertEqual(inner['bytes'], X.values.nbytes)
+
+    def test_trace_file(self):
+        (fd, filename) = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            nimbusml.tracing.enable(filename=filename)
+            Pipeline([LogisticRegressionBinaryClassifier()]).fit(X, y)
+            nimbusml.tracing.disable()
+            with open(filename) as f:
+                trace = json.load(f)
+            names = [e['name'] for e in trace['traceEvents']]
+            self.assertIn('Pipeline.fit', names)
+            self.assertIn('px_call', names)
+            for e in trace['traceEvents']:
+                self.assertEqual(e['ph'], 'X')
+                self.assertGreaterEqual(e['dur'], 0)
+        finally:
+            os.remove(filename)
+
+    def test_disabled(self):
+        self.assertFalse(nimbusml.tracing.is_enabled())
+        with nimbusml.tracing.span('phase') as s:
+            s.add_bytes(X)
+        self.assertIs(nimbusml.tracing.span('other'), s)
+
+
+if __name__ == '__main__':
+    unittest.main()
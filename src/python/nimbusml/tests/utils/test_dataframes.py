@@ -0,0 +1,156 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+import unittest
+
+import numpy as np
+import pandas as pd
+import six
+from nimbusml import Pipeline
+from nimbusml.linear_model import FastLinearRegressor
+from nimbusml.internal.utils.dataframes import resolve_dataframe, \
+    resolve_text_column, resolve_bool_column
+from nimbusml.preprocessing import FromKey, ToKey
+
+
+class TestResolveDataFrame(unittest.TestCase):
+
+    def test_resolve_text_column(self):
+        serie = pd.Series(['ab', None, u'é', np.nan, ''], dtype=object)
+        text = resolve_text_column(serie)
+        self.assertEqual(text['..Data'].dtype, np.uint8)
+        self.assertEqual(text['..Data'].tobytes(), b'ab\xc3\xa9')
+        self.assertEqual(text['..Offsets'].dtype, np.int64)
+        self.assertEqual(list(text['..Offsets']), [0, 2, 2, 4, 4, 4])
+        self.assertEqual(list(np.unpackbits(text['..Missing'])[:5]),
+                         [0, 1, 0, 1, 0])
+
+    def test_resolve_text_column_utf8(self):
+        values = [u'a\u07ff', u'\u0800\uffff', None, u'\U0001f600b',
+                  'x' * 10000, u'c\x00']
+        for serie in [pd.Series(values[:4]), pd.Series(values)]:
+            text = resolve_text_column(serie)
+            expected = [v.encode('utf-8') for v in serie if v is not None]
+            self.assertEqual(text['..Data'].tobytes(), b''.join(expected))
+            self.assertEqual(text['..Offsets'][-1],
+                             sum(len(v) for v in expected))
+
+    @unittest.skipIf(six.PY2, "text columns are sent as lists")
+    def test_resolve_dataframe_text(self):
+        df = pd.DataFrame(dict(text=['a', 'bc'], num=[1.0, 2.0]))
+        data = resolve_dataframe(df)
+        self.assertEqual(data['..mlColTypes'], ['t', 'd'])
+        self.assertEqual(list(data['text']['..Offsets']), [0, 1, 3])
+
+    def test_resolve_dataframe_category(self):
+        df = pd.DataFrame(dict(cat=pd.Categorical(['b', 'a', None, 'b'])))
+        data = resolve_dataframe(df)
+        self.assertEqual(data['..mlColTypes'], ['c'])
+        self.assertEqual(data['cat'].dtype, np.int32)
+        self.assertEqual(list(data['cat']), [2, 1, 0, 2])
+        self.assertEqual(data['..mlVarInfo']['cat'], ['a', 'b'])
+
+    def test_resolve_dataframe_category_codes(self):
+        # see benchmarks/marshalling.py for the timings
+        codes = np.random.randint(-1, 100, 1000)
+        serie = pd.Series(pd.Categorical.from_codes(
+            codes, [str(i) for i in range(100)]))
+        data = resolve_dataframe(pd.DataFrame(dict(cat=serie)))
+        self.assertEqual(data['cat'].dtype, np.int32)
+        self.assertTrue(data['cat'].flags['C_CONTIGUOUS'])
+        self.assertEqual(list(data['cat']), list(codes + 1))
+        self.assertEqual(data['..mlVarInfo']['cat'],
+                         [str(i) for i in range(100)])
+
+    def test_resolve_bool_column(self):
+        serie = pd.Series([True, None, False, np.nan], dtype=object)
+        values = resolve_bool_column(serie)
+        self.assertEqual(values.dtype, np.int8)
+        self.assertEqual(list(values), [1, -1, 0, -1])
+        data = resolve_dataframe(pd.DataFrame(dict(flag=serie)))
+        self.assertEqual(data['..mlColTypes'], ['?'])
+
+    def test_bool_round_trip(self):
+        df = pd.DataFrame(dict(flag=pd.Series([True, False, True],
+                                              dtype=object),
+                               y=[1.0, 0.0, 1.0]))
+        pipeline = Pipeline([FastLinearRegressor(
+            feature=['flag'], label='y', maximum_number_of_iterations=1)])
+        pipeline.fit(df)
+        self.assertEqual(len(pipeline.predict(df)), 3)
+
+    def test_resolve_dataframe_bool(self):
+        # see benchmarks/marshalling.py for the memory used
+        values = np.random.rand(1000) < 0.5
+        df = pd.DataFrame(dict(flag=values,
+                               obj=pd.Series(values, dtype=object)))
+        data = resolve_dataframe(df)
+        self.assertEqual(data['..mlColTypes'], ['?', '?'])
+        # one byte per value instead of a float64 copy
+        self.assertEqual(data['obj'].dtype, np.int8)
+        self.assertEqual(list(data['obj']), list(values.astype(np.int8)))
+        # a numpy bool column is sent without a copy
+        self.assertEqual(data['flag'].dtype, np.bool_)
+        self.assertTrue(np.shares_memory(data['flag'], df['flag'].values))
+
+    def test_category_round_trip(self):
+        values = ['a', 'b', None, 'a']
+        df = pd.DataFrame(dict(cat=pd.Categorical(values)))
+        result = (FromKey() << 'cat').fit_transform(df)
+        for i in [0, 1, 3]:
+            self.assertEqual(result['cat'][i], values[i])
+
+    def test_text_round_trip(self):
+        values = ['a', u'été', 'a', None, u'日本']
+        df = pd.DataFrame(dict(text=values))
+        pipeline = Pipeline([ToKey() << 'text', FromKey() << 'text'])
+        result = pipeline.fit_transform(df)
+        for i in [0, 1, 2, 4]:
+            self.assertEqual(result['text'][i], values[i])
+
+
+class TestDataFrameIsNotCopied(unittest.TestCase):
+
+    def setUp(self):
+        n, d = 200000, 20
+        self.X = pd.DataFrame({'c%d' % i: np.random.rand(n)
+                               for i in range(d)})
+        self.y = pd.DataFrame(dict(Label=np.random.rand(n)))
+
+    def test_resolve_dataframe_with_label(self):
+        data = resolve_dataframe(self.X, self.y)
+        self.assertEqual(list(data.keys())[1:-1],
+                         list(self.X.columns) + ['Label'])
+        self.assertTrue(np.shares_memory(data['c0'], self.X['c0'].values))
+        self.assertTrue(np.shares_memory(data['Label'],
+                                         self.y['Label'].values))
+
+    def test_resolve_dataframe_from_ndarray(self):
+        # Columns of a DataFrame built from a 2-D array are strided views.
+        X = pd.DataFrame(self.X.values, columns=self.X.columns)
+        data = resolve_dataframe(X)
+        self.assertTrue(np.shares_memory(data['c0'], X.values))
+
+    def test_resolve_dataframe_columns(self):
+        data = resolve_dataframe(self.X, self.y, columns={'c3', 'c1'})
+        self.assertEqual(list(data.keys())[1:-1], ['c1', 'c3', 'Label'])
+        self.assertEqual(len(data['..mlColTypes']), 3)
+
+    def test_same_column_in_X_and_y(self):
+        with self.assertRaises(RuntimeError):
+            resolve_dataframe(self.X, self.X[['c0']])
+
+    def test_fit(self):
+        data = resolve_dataframe(self.X, self.y)
+        for name in self.X.columns:
+            self.assertEqual(data[name].dtype, np.float64)
+            self.assertTrue(np.shares_memory(data[name],
+                                             self.X[name].values))
+        pipeline = Pipeline([FastLinearRegressor(maximum_number_of_iterations=1)])
+        pipeline.fit(self.X, self.y)
+        self.assertEqual(len(pipeline.predict(self.X)), len(self.X))
+
+
+if __name__ == '__main__':
+    unittest.main()
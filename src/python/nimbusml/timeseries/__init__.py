@@ -1,8 +1,4 @@
-from .iidspikedetector import IidSpikeDetector
-from .iidchangepointdetector import IidChangePointDetector
-from .ssaspikedetector import SsaSpikeDetector
-from .ssachangepointdetector import SsaChangePointDetector
-from .ssaforecaster import SsaForecaster
+from ..internal.utils.lazy import lazy_import
 
 __all__ = [
     'IidSpikeDetector',
@@ -11,3 +7,11 @@ __all__ = [
     'SsaChangePointDetector',
     'SsaForecaster'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'IidSpikeDetector': '.iidspikedetector',
+    'IidChangePointDetector': '.iidchangepointdetector',
+    'SsaSpikeDetector': '.ssaspikedetector',
+    'SsaChangePointDetector': '.ssachangepointdetector',
+    'SsaForecaster': '.ssaforecaster'
+})
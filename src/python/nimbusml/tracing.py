@@ -0,0 +1,246 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+"""
+Tracing of the time spent in python around the calls to the bridge.
+
+Once tracing is enabled, every public method of a pipeline or of an
+estimator records a span, with nested spans for the phases between the
+user call and the bridge: validation of the inputs, conversion of the
+data for the bridge, serialization of the graph, the bridge itself and
+conversion of its outputs. A span has a duration and, for the phases
+moving data, the number of bytes they handle.
+
+.. code-block:: python
+
+    import nimbusml.tracing
+
+    nimbusml.tracing.enable(callback=print, filename='trace.json')
+    pipeline.fit(X, y)
+    pipeline.predict(X)
+    nimbusml.tracing.disable()
+
+The callback receives every top level span as a dictionary, the file
+uses the Chrome trace event format (``chrome://tracing``, Perfetto) and
+is written by :func:`disable`. When tracing is disabled, a span costs a
+function call.
+"""
+
+import json
+import numbers
+import os
+import threading
+from functools import wraps
+from timeit import default_timer
+
+_enabled = False
+_callback = None
+_filename = None
+# Time tracing was enabled at, the file events are relative to it.
+_origin = 0.
+# Top level spans recorded for the file.
+_spans = []
+_local = threading.local()
+
+
+class Span(object):
+    """
+    Phase of a call, created by :func:`span`.
+    """
+    __slots__ = ['name', 'start', 'duration', 'bytes', 'thread', 'children']
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.
+        self.duration = 0.
+        self.bytes = 0
+        self.thread = threading.current_thread().ident
+        self.children = []
+
+    def __enter__(self):
+        stack = _get_stack()
+        stack.append(self)
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.duration = default_timer() - self.start
+        stack = _get_stack()
+        stack.pop()
+        if stack:
+            stack[-1].children.append(self)
+        else:
+            _record(self)
+        return False
+
+    def add_bytes(self, data):
+        """
+        Adds the size of *data* to the bytes of the span, *data* is a
+        number of bytes or a DataFrame, an array, a sparse matrix, or a
+        dictionary or list of them.
+        """
+        self.bytes += get_nbytes(data)
+
+    def to_dict(self):
+        """
+        Returns the span and its children as a dictionary.
+        """
+        return dict(name=self.name, start=self.start,
+                    duration=self.duration, bytes=self.bytes,
+                    thread=self.thread,
+                    children=[c.to_dict() for c in self.children])
+
+
+class _NoSpan(object):
+    """
+    Span returned while tracing is disabled, it records nothing.
+    """
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+    def add_bytes(self, data):
+        pass
+
+
+_no_span = _NoSpan()
+
+
+def _get_stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _record(root):
+    if _callback is not None:
+        _callback(root.to_dict())
+    if _filename is not None:
+        _spans.append(root)
+
+
+def get_nbytes(data):
+    """
+    Returns the number of bytes of *data*, see :meth:`Span.add_bytes`,
+    0 if it is unknown.
+    """
+    if data is None:
+        return 0
+    if isinstance(data, numbers.Integral):
+        return int(data)
+    if isinstance(data, dict):
+        return sum(get_nbytes(v) for v in data.values())
+    if isinstance(data, (list, tuple)):
+        return sum(get_nbytes(v) for v in data)
+    if hasattr(data, 'memory_usage'):
+        # DataFrame or Series
+        usage = data.memory_usage(index=False, deep=False)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    if hasattr(data, 'nbytes'):
+        return int(data.nbytes)
+    if hasattr(data, 'data') and hasattr(data, 'indices'):
+        # sparse matrix
+        return int(data.data.nbytes + data.indices.nbytes +
+                   data.indptr.nbytes)
+    return 0
+
+
+def span(name):
+    """
+    Returns a context manager measuring the phase *name* of a call, a
+    no-op when tracing is disabled.
+
+    .. code-block:: python
+
+        with span('resolve_dataframe') as s:
+            data = resolve_dataframe(X)
+            s.add_bytes(data)
+    """
+    if not _enabled:
+        return _no_span
+    return Span(name)
+
+
+def traced(name):
+    """
+    Decorator recording every call of a function as the span *name*.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with Span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable(callback=None, filename=None):
+    """
+    Enables tracing.
+
+    :param callback: function called with every top level span, as a
+        dictionary with keys ``name``, ``start``, ``duration`` (seconds),
+        ``bytes``, ``thread`` and ``children`` (the nested spans).
+    :param filename: file the spans are written to by :func:`disable`,
+        in the Chrome trace event format.
+    """
+    global _enabled, _callback, _filename, _origin
+    _callback = callback
+    _filename = filename
+    _origin = default_timer()
+    del _spans[:]
+    _enabled = True
+
+
+def disable():
+    """
+    Disables tracing and writes the trace file given to :func:`enable`.
+    """
+    global _enabled, _callback, _filename
+    _enabled = False
+    filename = _filename
+    _callback = None
+    _filename = None
+    if filename is not None:
+        write_trace(filename, _spans)
+    del _spans[:]
+
+
+def is_enabled():
+    """
+    Tells if tracing is enabled.
+    """
+    return _enabled
+
+
+def write_trace(filename, spans):
+    """
+    Writes *spans* and their children to *filename* in the Chrome trace
+    event format.
+    """
+    pid = os.getpid()
+    events = []
+
+    def add_events(s):
+        events.append(dict(
+            name=s.name, ph='X', pid=pid, tid=s.thread,
+            ts=(s.start - _origin) * 1e6, dur=s.duration * 1e6,
+            args=dict(bytes=s.bytes)))
+        for child in s.children:
+            add_events(child)
+
+    for s in spans:
+        add_events(s)
+    with open(filename, 'w') as f:
+        json.dump(dict(traceEvents=events, displayTimeUnit='ms'), f)
+
+
+__all__ = ['enable', 'disable', 'is_enabled', 'span']
@@ -1,4 +1,4 @@
-from .utils import get_X_y, evaluate_binary_classifier, load_img, ColumnSelector
+from ..internal.utils.lazy import lazy_import
 
 try:
     from inspect import signature
@@ -12,3 +12,10 @@ __all__ = [
     'ColumnSelector',
     'signature'
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'get_X_y': '.utils',
+    'evaluate_binary_classifier': '.utils',
+    'load_img': '.utils',
+    'ColumnSelector': '.utils'
+})